@@ -20,7 +20,7 @@ The confidence scoring system ensures:
 
 import re
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -41,6 +41,20 @@ class ConfidenceLevel(Enum):
     VERY_LOW = "very_low"    # 0.0-0.5: Block display, require review
 
 
+class CitationRequirements(NamedTuple):
+    """Citation density requirements for an audience"""
+    min_citations: int
+    claims_per_citation: int
+
+
+# Citation requirements by audience, shared with the validation layer
+AUDIENCE_CITATION_REQUIREMENTS = {
+    'citizen': CitationRequirements(min_citations=1, claims_per_citation=3),
+    'lawyer': CitationRequirements(min_citations=2, claims_per_citation=2),
+    'judge': CitationRequirements(min_citations=3, claims_per_citation=1)
+}
+
+
 @dataclass
 class ConfidenceComponents:
     """Detailed breakdown of confidence score calculation"""
@@ -141,11 +155,7 @@ class ConfidenceScorer:
         }
         
         # Citation requirements by audience (from validation layer)
-        self.citation_requirements = {
-            'citizen': {'min_citations': 1, 'claims_per_citation': 3},
-            'lawyer': {'min_citations': 2, 'claims_per_citation': 2},
-            'judge': {'min_citations': 3, 'claims_per_citation': 1}
-        }
+        self.citation_requirements = dict(AUDIENCE_CITATION_REQUIREMENTS)
         
         logger.info("Initialized confidence scorer with empirically calibrated thresholds")
     
@@ -319,7 +329,7 @@ class ConfidenceScorer:
         
         # Calculate citation density
         claims_per_citation = legal_claims / citation_count
-        max_claims_per_citation = requirements['claims_per_citation']
+        max_claims_per_citation = requirements.claims_per_citation
         
         # Score based on how well it meets requirements
         if claims_per_citation <= max_claims_per_citation:
@@ -329,7 +339,7 @@ class ConfidenceScorer:
             density_score = max(0.2, max_claims_per_citation / claims_per_citation)
         
         # Check minimum citation requirement
-        min_citations = requirements['min_citations']
+        min_citations = requirements.min_citations
         if citation_count < min_citations:
             min_citation_penalty = citation_count / min_citations
             density_score *= min_citation_penalty
@@ -649,5 +659,8 @@ class ConfidenceScorer:
         return {
             'thresholds': {level.value: threshold for level, threshold in self.confidence_thresholds.items()},
             'audience_weights': self.audience_weights,
-            'citation_requirements': self.citation_requirements
+            'citation_requirements': {
+                audience: requirements._asdict()
+                for audience, requirements in self.citation_requirements.items()
+            }
         }
\ No newline at end of file
@@ -14,7 +14,7 @@ from typing import Dict, Any
 from .providers import LLMProvider, OpenAIProvider, LLMResponse, LLMError
 from .prompt_templates import PromptTemplateManager, CitationConstraints, CitationFormat
 from .llm_manager import LLMManager, FallbackStrategy
-from .validation import ResponseValidator, ValidationSeverity
+from .validation import ResponseValidator, ValidationIssue, ValidationSeverity
 from query_engine.context_builder import LLMContext
 from query_engine.query_parser import IntentType
 from query_engine.graph_traversal import GraphContext, GraphNode
@@ -354,6 +354,60 @@ class TestResponseValidator:
         # Should have warning about missing disclaimer
         warnings = result.get_issues_by_severity(ValidationSeverity.WARNING)
         assert any("missing_disclaimer" in warning.issue_type for warning in warnings)
+        assert len(result.missing_disclaimers) == 1
+    
+    def test_lazy_issue_message(self):
+        """Test issue messages given as callables are formatted once on access"""
+        calls = []
+        
+        def build_message():
+            calls.append(1)
+            return "Citation 'X' not found"
+        
+        issue = ValidationIssue(ValidationSeverity.ERROR, "invalid_citation", build_message)
+        assert not calls
+        assert issue.message == "Citation 'X' not found"
+        assert issue.message == "Citation 'X' not found"
+        assert len(calls) == 1
+        assert issue == ValidationIssue(ValidationSeverity.ERROR, "invalid_citation",
+                                        "Citation 'X' not found")
+    
+    def test_validation_result_caching(self):
+        """Test repeated validation reuses cached results until the graph changes"""
+        validator = ResponseValidator()
+        context = create_mock_context()
+        graph_context = create_mock_graph_context()
+        constraints = CitationConstraints(CitationFormat.STANDARD)
+        response = """A consumer is defined as any person who buys goods [Citation: Citation-1]."""
+        
+        first = validator.validate_response(response, context, graph_context, constraints)
+        second = validator.validate_response(response, context, graph_context, constraints)
+        assert second is first
+        
+        # Different audience is validated separately
+        lawyer = validator.validate_response(response, context, graph_context, constraints,
+                                             audience="lawyer")
+        assert lawyer is not first
+        
+        # Mutating the graph context invalidates the cached result
+        graph_context.mark_modified()
+        third = validator.validate_response(response, context, graph_context, constraints)
+        assert third is not first
+        assert third.confidence_score == first.confidence_score
+    
+    def test_unknown_audience_uses_citizen_requirements(self):
+        """Test unknown audiences are checked like citizens without storing a validator each"""
+        validator = ResponseValidator()
+        audiences = set(validator._audience_validators)
+        response = "Section 2 states that consumers have the right to be informed."
+        
+        issues = validator._validate_citation_density(response, "journalist")
+        assert [issue.issue_type for issue in issues] == [
+            issue.issue_type for issue in validator._validate_citation_density(response, "citizen")
+        ]
+        assert "journalist audience" in issues[0].message
+        assert "journalist" in issues[0].suggestion
+        assert set(validator._audience_validators) == audiences
 
 
 class TestIntegration:
@@ -22,7 +22,8 @@ The validation layer ensures:
 import re
 import logging
 import json
-from typing import Dict, Any, List, Optional, Set, Tuple
+from collections import OrderedDict
+from typing import Callable, Dict, Any, List, NamedTuple, Optional, Set, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -31,11 +32,67 @@ from query_engine.context_builder import LLMContext
 from query_engine.graph_traversal import GraphContext, GraphNode
 from query_engine.query_parser import QueryIntent
 from .prompt_templates import CitationConstraints, CitationFormat
-from .confidence_scorer import ConfidenceScorer, ConfidenceScore
+from .confidence_scorer import (
+    ConfidenceScorer, ConfidenceScore, CitationRequirements, AUDIENCE_CITATION_REQUIREMENTS
+)
 
 
 logger = logging.getLogger(__name__)
 
+# Issue types that block a response outright when raised as errors
+CRITICAL_ISSUE_TYPES = frozenset({'fabricated_section', 'hallucinated_content', 'predictive_language'})
+
+# Issue types reported as format violations in ValidationResult
+FORMAT_VIOLATION_TYPES = frozenset({'format_violation', 'structure_issue'})
+
+# Legal claim patterns counted against audience citation density requirements
+CITATION_DENSITY_CLAIM_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\bsection\s+\d+\s+(?:states|provides|requires|prohibits|defines)',
+    r'\bthe\s+(?:consumer protection\s+)?act\s+(?:states|provides|requires)',
+    r'\bconsumers?\s+(?:have the right|are entitled|can|must|shall)',
+    r'\b(?:according to|under|pursuant to|as per)\s+(?:section|clause|the act)',
+    r'\b(?:unfair trade practice|consumer right|complaint procedure)\b'
+))
+
+CITATION_MARKER_PATTERN = re.compile(r'\[Citation: [^\]]+\]')
+
+SENTENCE_TERMINATOR_PATTERN = re.compile(r'[.!?]+')
+
+# Legal claim patterns that need a nearby citation or context support
+ENHANCED_CLAIM_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'section\s+\d+\s+(?:clearly\s+)?(?:states|provides|requires|prohibits|mandates|establishes)[^.]*\.',
+    r'the\s+(?:consumer protection\s+)?act\s+(?:explicitly\s+)?(?:defines|requires|prohibits|allows)[^.]*\.',
+    r'consumers?\s+(?:have\s+the\s+)?(?:right|entitlement)\s+to\s+[^.]*\.',
+    r'(?:according\s+to|under|pursuant\s+to|as\s+per)\s+(?:section|clause|the\s+act)[^.]*\.',
+    r'(?:the\s+law|statute|provision|regulation)\s+(?:clearly\s+)?(?:states|requires|prohibits)[^.]*\.',
+    r'(?:unfair\s+trade\s+practice|consumer\s+right|complaint\s+procedure)\s+(?:is\s+defined|means|includes)[^.]*\.'
+))
+
+# Any accepted citation format near a claim: [Citation: ...], [Ref: ...], (Section N...), (CPA 2019...)
+NEARBY_CITATION_PATTERN = re.compile(
+    r'\[Citation: [^\]]+\]|\[Ref: [^\]]+\]|\(Section\s+\d+[^)]*\)|\(CPA\s+2019[^)]*\)',
+    re.IGNORECASE
+)
+
+CLAIM_WORD_PATTERN = re.compile(r'\b\w{4,}\b')
+
+# Section references (e.g. "section 2(7)", "sec. 35", "§ 21") checked against the graph
+SECTION_REFERENCE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\bsection\s+(\d+(?:\([^)]+\))?)',
+    r'\bsec\.\s*(\d+(?:\([^)]+\))?)',
+    r'§\s*(\d+(?:\([^)]+\))?)'
+))
+
+CLAUSE_REFERENCE_PATTERN = re.compile(r'\bclause\s+\([^)]+\)', re.IGNORECASE)
+
+# Per-audience length limits for quality scoring:
+# (min_length, brief_penalty, max_length, verbose_penalty, max_avg_sentence_length)
+NO_LENGTH_LIMITS = (0, 0.0, float('inf'), 0.0, float('inf'))
+AUDIENCE_LENGTH_LIMITS = {
+    'citizen': (100, 0.3, 2000, 0.2, 25),  # Citizens prefer concise but complete responses
+    'lawyer': (200, 0.2, float('inf'), 0.0, float('inf')),  # Lawyers prefer detailed responses
+}
+
 
 class ValidationSeverity(Enum):
     """Severity levels for validation issues"""
@@ -44,15 +101,62 @@ class ValidationSeverity(Enum):
     INFO = "info"       # Informational notices
 
 
-@dataclass
+class ValidationThresholds(NamedTuple):
+    """Confidence thresholds for displaying and reviewing responses"""
+    high: float      # Auto-display without review
+    medium: float    # Display with caution notice
+    low: float       # Flag for expert review
+    very_low: float  # Block display, require review
+
+
 class ValidationIssue:
-    """Represents a validation issue found in response"""
-    severity: ValidationSeverity
-    issue_type: str
-    message: str
-    location: Optional[str] = None  # Location in response where issue was found
-    suggestion: Optional[str] = None  # Suggested fix
-    confidence_impact: float = 0.0  # Impact on confidence score (-1.0 to 1.0)
+    """
+    Represents a validation issue found in response.
+    
+    The message may be given as a zero-argument callable, in which case it is
+    only formatted the first time it is read.
+    """
+    __slots__ = ('severity', 'issue_type', '_message', 'location', 'suggestion', 'confidence_impact')
+    
+    def __init__(self, severity: ValidationSeverity, issue_type: str,
+                 message: Union[str, Callable[[], str]],
+                 location: Optional[str] = None,
+                 suggestion: Optional[str] = None,
+                 confidence_impact: float = 0.0):
+        self.severity = severity
+        self.issue_type = issue_type
+        self._message = message
+        self.location = location  # Location in response where issue was found
+        self.suggestion = suggestion  # Suggested fix
+        self.confidence_impact = confidence_impact  # Impact on confidence score (-1.0 to 1.0)
+    
+    @property
+    def message(self) -> str:
+        """Issue message, formatted on first access"""
+        message = self._message
+        if not isinstance(message, str):
+            message = self._message = message()
+        return message
+    
+    @message.setter
+    def message(self, value: Union[str, Callable[[], str]]):
+        self._message = value
+    
+    def _fields(self) -> tuple:
+        return (self.severity, self.issue_type, self.message, self.location,
+                self.suggestion, self.confidence_impact)
+    
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return (f"ValidationIssue(severity={self.severity!r}, issue_type={self.issue_type!r}, "
+                f"message={self.message!r}, location={self.location!r}, "
+                f"suggestion={self.suggestion!r}, confidence_impact={self.confidence_impact!r})")
 
 
 @dataclass
@@ -90,6 +194,43 @@ class ValidationResult:
         return self.has_errors() or self.confidence_score < 0.5 or len(self.fabricated_references) > 0
 
 
+class _IssueLedger:
+    """
+    Issue bookkeeping for a single validation pass.
+    
+    Keeps the issue objects for the final result, plus parallel arrays of the
+    fields the scoring and review checks read, so those checks never walk the
+    issue objects again.
+    """
+    __slots__ = ('issues', 'severities', 'issue_types', 'impacts',
+                 'missing_disclaimers', 'format_violations', 'has_critical_error')
+    
+    def __init__(self):
+        self.issues: List[ValidationIssue] = []
+        self.severities: List[ValidationSeverity] = []
+        self.issue_types: List[str] = []
+        self.impacts: List[float] = []
+        self.missing_disclaimers: List[str] = []
+        self.format_violations: List[str] = []
+        self.has_critical_error = False
+    
+    def add(self, issues: List[ValidationIssue]):
+        """Record issues, bucketing report fields and critical flags in one pass"""
+        for issue in issues:
+            severity = issue.severity
+            issue_type = issue.issue_type
+            self.issues.append(issue)
+            self.severities.append(severity)
+            self.issue_types.append(issue_type)
+            self.impacts.append(issue.confidence_impact)
+            if issue_type == "missing_disclaimer":
+                self.missing_disclaimers.append(issue.message)
+            elif issue_type in FORMAT_VIOLATION_TYPES:
+                self.format_violations.append(issue.message)
+            elif severity == ValidationSeverity.ERROR and issue_type in CRITICAL_ISSUE_TYPES:
+                self.has_critical_error = True
+
+
 class CitationValidator:
     """Validates citations in LLM responses against knowledge graph"""
     
@@ -216,7 +357,7 @@ class CitationValidator:
                     issues.append(ValidationIssue(
                         severity=ValidationSeverity.ERROR,
                         issue_type="invalid_citation",
-                        message=f"Citation '{citation_key}' not found in available context or knowledge graph",
+                        message=lambda citation_key=citation_key: f"Citation '{citation_key}' not found in available context or knowledge graph",
                         location=f"Citation: {citation_key}",
                         suggestion="Use only citations provided in the context or valid knowledge graph references",
                         confidence_impact=-0.3
@@ -228,7 +369,7 @@ class CitationValidator:
             issues.append(ValidationIssue(
                 severity=ValidationSeverity.WARNING,
                 issue_type="uncited_claim",
-                message=f"Legal claim '{claim_text}' may need citation",
+                message=lambda claim_text=claim_text: f"Legal claim '{claim_text}' may need citation",
                 location=f"Position {claim_location}",
                 suggestion="Add appropriate citation for legal claims",
                 confidence_impact=-0.1
@@ -240,7 +381,7 @@ class CitationValidator:
             issues.append(ValidationIssue(
                 severity=ValidationSeverity.ERROR,
                 issue_type="fabricated_section",
-                message=f"Response mentions {section_ref} which does not exist in knowledge base",
+                message=lambda section_ref=section_ref: f"Response mentions {section_ref} which does not exist in knowledge base",
                 suggestion="Only reference sections that exist in the Consumer Protection Act, 2019",
                 confidence_impact=-0.4
             ))
@@ -413,7 +554,7 @@ class ContentValidator:
                 issues.append(ValidationIssue(
                     severity=ValidationSeverity.ERROR,
                     issue_type="predictive_language",
-                    message=f"Response contains prohibited predictive language: '{phrase}'",
+                    message=lambda phrase=phrase: f"Response contains prohibited predictive language: '{phrase}'",
                     location=f"Position {match.start()}-{match.end()}",
                     suggestion="Remove predictions and focus on factual legal information",
                     confidence_impact=-0.4
@@ -452,7 +593,7 @@ class ContentValidator:
                 issues.append(ValidationIssue(
                     severity=ValidationSeverity.ERROR,
                     issue_type="hallucinated_content",
-                    message=f"Response contains reference outside knowledge base: '{hallucination}'",
+                    message=lambda hallucination=hallucination: f"Response contains reference outside knowledge base: '{hallucination}'",
                     location=f"Position {match.start()}-{match.end()}",
                     suggestion="Only reference Consumer Protection Act, 2019 provisions available in knowledge base",
                     confidence_impact=-0.5
@@ -466,7 +607,7 @@ class ContentValidator:
                 issues.append(ValidationIssue(
                     severity=ValidationSeverity.WARNING,
                     issue_type="unverified_definition",
-                    message=f"Definition claim may not be supported: '{claimed_definition}'",
+                    message=lambda claimed_definition=claimed_definition: f"Definition claim may not be supported: '{claimed_definition}'",
                     suggestion="Verify definition against knowledge graph",
                     confidence_impact=-0.2
                 ))
@@ -599,28 +740,35 @@ class ContentValidator:
 class ResponseValidator:
     """Main response validator that coordinates all validation checks"""
     
-    def __init__(self, knowledge_graph_path: str = "knowledge_graph"):
-        """Initialize response validator"""
+    def __init__(self, knowledge_graph_path: str = "knowledge_graph", cache_size: int = 512):
+        """
+        Initialize response validator.
+        
+        Args:
+            knowledge_graph_path: Path to the knowledge graph data directory
+            cache_size: Maximum number of validation results to cache (0 disables caching)
+        """
         self.citation_validator = CitationValidator(knowledge_graph_path)
         self.content_validator = ContentValidator()
         self.confidence_scorer = ConfidenceScorer()
         self.knowledge_graph_path = knowledge_graph_path
         
         # Enhanced validation thresholds
-        self.confidence_thresholds = {
-            'high': 0.9,      # Auto-display without review
-            'medium': 0.8,    # Display with caution notice  
-            'low': 0.7,       # Flag for expert review
-            'very_low': 0.5   # Block display, require review
-        }
+        self.confidence_thresholds = ValidationThresholds(high=0.9, medium=0.8, low=0.7, very_low=0.5)
         
         # Citation density requirements by audience
-        self.citation_requirements = {
-            'citizen': {'min_citations': 1, 'claims_per_citation': 3},
-            'lawyer': {'min_citations': 2, 'claims_per_citation': 2}, 
-            'judge': {'min_citations': 3, 'claims_per_citation': 1}
+        self.citation_requirements = dict(AUDIENCE_CITATION_REQUIREMENTS)
+        
+        # Audience-specialized checks with requirements folded in at construction
+        self._audience_validators = {
+            audience: self._compile_audience_validator(requirements)
+            for audience, requirements in self.citation_requirements.items()
         }
         
+        # LRU cache of results for re-validated responses (retries, reformatting)
+        self.cache_size = cache_size
+        self._result_cache: OrderedDict = OrderedDict()
+        
         logger.info("Initialized enhanced response validator")
     
     def validate_response(self, response: str, context: LLMContext,
@@ -631,6 +779,10 @@ class ResponseValidator:
         """
         Comprehensive validation of LLM response.
         
+        Results are cached per (response, context objects, constraints, audience);
+        cached results are shared and should be treated as read-only. Call
+        graph_context.mark_modified() after mutating a graph context in place.
+        
         Args:
             response: LLM response to validate
             context: LLM context used for generation
@@ -641,31 +793,63 @@ class ResponseValidator:
         Returns:
             ValidationResult with all validation findings
         """
-        all_issues = []
+        if self.cache_size <= 0:
+            return self._validate_response_uncached(
+                response, context, graph_context, citation_constraints, query_intent, audience
+            )
+        
+        # Context objects are keyed by identity; the cache entry pins them so ids stay unique
+        cache_key = (
+            response, id(context), id(graph_context), graph_context.version,
+            id(query_intent), audience, citation_constraints.format_type,
+            citation_constraints.require_all_claims, citation_constraints.max_unsupported_claims
+        )
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            self._result_cache.move_to_end(cache_key)
+            logger.debug("Validation cache hit")
+            return cached[1]
+        
+        result = self._validate_response_uncached(
+            response, context, graph_context, citation_constraints, query_intent, audience
+        )
+        
+        self._result_cache[cache_key] = ((context, graph_context, query_intent), result)
+        if len(self._result_cache) > self.cache_size:
+            self._result_cache.popitem(last=False)
+        
+        return result
+    
+    def clear_cache(self):
+        """Drop all cached validation results"""
+        self._result_cache.clear()
+    
+    def _validate_response_uncached(self, response: str, context: LLMContext,
+                                    graph_context: GraphContext,
+                                    citation_constraints: CitationConstraints,
+                                    query_intent: Optional[QueryIntent],
+                                    audience: str) -> ValidationResult:
+        """Run every validation check on a response"""
+        ledger = _IssueLedger()
         
         # Validate citations against knowledge graph
-        citation_issues = self.citation_validator.validate_citations(
+        ledger.add(self.citation_validator.validate_citations(
             response, context, citation_constraints.format_type
-        )
-        all_issues.extend(citation_issues)
+        ))
         
         # Validate content for hallucinations and accuracy
-        content_issues = self.content_validator.validate_content(
+        ledger.add(self.content_validator.validate_content(
             response, context, graph_context
-        )
-        all_issues.extend(content_issues)
+        ))
         
         # Enhanced knowledge graph validation
-        kg_issues = self.validate_against_knowledge_graph(response, graph_context)
-        all_issues.extend(kg_issues)
+        ledger.add(self.validate_against_knowledge_graph(response, graph_context))
         
         # Validate citation density for audience
-        citation_density_issues = self._validate_citation_density(response, audience)
-        all_issues.extend(citation_density_issues)
+        ledger.add(self._validate_citation_density(response, audience))
         
         # Validate response format and structure
-        format_issues = self._validate_response_format(response, citation_constraints)
-        all_issues.extend(format_issues)
+        ledger.add(self._validate_response_format(response, citation_constraints))
         
         # Count citations
         citation_count = len(self.citation_validator.extract_citation_references(
@@ -688,68 +872,59 @@ class ResponseValidator:
             
             # Add confidence-based issues
             if confidence_score_result.requires_human_review:
-                for reason in confidence_score_result.review_reasons:
-                    all_issues.append(ValidationIssue(
+                ledger.add([
+                    ValidationIssue(
                         severity=ValidationSeverity.WARNING,
                         issue_type="confidence_review",
-                        message=f"Human review required: {reason}",
+                        message=lambda reason=reason: f"Human review required: {reason}",
                         confidence_impact=0.0  # Already factored into confidence score
-                    ))
+                    )
+                    for reason in confidence_score_result.review_reasons
+                ])
         else:
             # Fallback to legacy confidence calculation
             confidence_score = self._calculate_enhanced_confidence_score(
-                response, context, graph_context, all_issues, citation_count, audience
+                response, context, graph_context, ledger, citation_count, audience
             )
             requires_human_review = self._requires_human_review(
-                confidence_score, all_issues, audience
+                confidence_score, ledger, audience
             )
         
         # Determine if response is valid
-        is_valid = self._determine_validity(all_issues, confidence_score, fabricated_references)
+        is_valid = self._determine_validity(ledger.has_critical_error, confidence_score, fabricated_references)
         
         # Apply citation constraints
         if citation_constraints.require_all_claims and len(unsupported_claims) > 0:
             is_valid = False
-            all_issues.append(ValidationIssue(
+            ledger.add([ValidationIssue(
                 severity=ValidationSeverity.ERROR,
                 issue_type="unsupported_claims",
-                message=f"Found {len(unsupported_claims)} unsupported legal claims",
+                message=lambda: f"Found {len(unsupported_claims)} unsupported legal claims",
                 suggestion="Ensure all legal claims have supporting citations",
                 confidence_impact=-0.4
-            ))
+            )])
         
         if len(unsupported_claims) > citation_constraints.max_unsupported_claims:
             is_valid = False
         
         # Generate corrected response if needed
         corrected_response = None
-        if not is_valid and self._can_auto_correct(all_issues):
-            corrected_response = self._attempt_auto_correction(response, all_issues)
-        
-        # Extract missing disclaimers and format violations for detailed reporting
-        missing_disclaimers = [
-            issue.message for issue in all_issues 
-            if issue.issue_type == "missing_disclaimer"
-        ]
-        
-        format_violations = [
-            issue.message for issue in all_issues 
-            if issue.issue_type in ["format_violation", "structure_issue"]
-        ]
+        if not is_valid and self._can_auto_correct(ledger):
+            corrected_response = self._attempt_auto_correction(response, ledger)
         
         logger.info(f"Enhanced validation complete: valid={is_valid}, confidence={confidence_score:.2f}, "
-                   f"issues={len(all_issues)}, citations={citation_count}, "
+                   f"issues={len(ledger.issues)}, citations={citation_count}, "
                    f"unsupported_claims={len(unsupported_claims)}, fabricated={len(fabricated_references)}")
         
         return ValidationResult(
             is_valid=is_valid,
             confidence_score=confidence_score,
-            issues=all_issues,
+            issues=ledger.issues,
             citation_count=citation_count,
             unsupported_claims=unsupported_claims,
             fabricated_references=fabricated_references,
-            missing_disclaimers=missing_disclaimers,
-            format_violations=format_violations,
+            missing_disclaimers=ledger.missing_disclaimers,
+            format_violations=ledger.format_violations,
             corrected_response=corrected_response,
             requires_human_review=requires_human_review
         )
@@ -807,27 +982,21 @@ class ResponseValidator:
         
         return max(0.0, min(1.0, base_score))
     
-    def _can_auto_correct(self, issues: List[ValidationIssue]) -> bool:
+    def _can_auto_correct(self, ledger: _IssueLedger) -> bool:
         """Check if issues can be automatically corrected"""
         correctable_types = {"missing_disclaimer", "formatting_issue"}
         
-        for issue in issues:
-            if issue.severity == ValidationSeverity.ERROR and issue.issue_type not in correctable_types:
+        for severity, issue_type in zip(ledger.severities, ledger.issue_types):
+            if severity == ValidationSeverity.ERROR and issue_type not in correctable_types:
                 return False
         
         return True
     
-    def _attempt_auto_correction(self, response: str, issues: List[ValidationIssue]) -> str:
+    def _attempt_auto_correction(self, response: str, ledger: _IssueLedger) -> str:
         """Attempt to automatically correct minor issues"""
-        corrected = response
-        
-        for issue in issues:
-            if issue.issue_type == "missing_disclaimer":
-                # Add disclaimer at the end
-                disclaimer = "\n\nDisclaimer: This information is provided for educational purposes only and does not constitute legal advice. For legal advice specific to your situation, please consult a qualified lawyer."
-                corrected += disclaimer
-        
-        return corrected
+        # Add disclaimer at the end for each missing disclaimer
+        disclaimer = "\n\nDisclaimer: This information is provided for educational purposes only and does not constitute legal advice. For legal advice specific to your situation, please consult a qualified lawyer."
+        return response + disclaimer * len(ledger.missing_disclaimers)
     
     def validate_against_knowledge_graph(self, response: str, 
                                        graph_context: GraphContext) -> List[ValidationIssue]:
@@ -866,7 +1035,7 @@ class ResponseValidator:
                     issues.append(ValidationIssue(
                         severity=ValidationSeverity.WARNING,
                         issue_type="content_mismatch",
-                        message=f"Claimed content for Section {section_num} may not match actual text",
+                        message=lambda section_num=section_num: f"Claimed content for Section {section_num} may not match actual text",
                         suggestion="Verify content against source text"
                     ))
         
@@ -874,49 +1043,56 @@ class ResponseValidator:
     
     def _validate_citation_density(self, response: str, audience: str) -> List[ValidationIssue]:
         """Validate citation density based on audience requirements"""
-        issues = []
-        
-        requirements = self.citation_requirements.get(audience, self.citation_requirements['citizen'])
+        # Unknown audiences are checked against citizen requirements. The audience comes
+        # from the caller, so no validator is stored for it.
+        validator = self._audience_validators.get(audience) or self._audience_validators['citizen']
         
         # Count legal claims
-        legal_claim_patterns = [
-            r'\bsection\s+\d+\s+(?:states|provides|requires|prohibits|defines)',
-            r'\bthe\s+(?:consumer protection\s+)?act\s+(?:states|provides|requires)',
-            r'\bconsumers?\s+(?:have the right|are entitled|can|must|shall)',
-            r'\b(?:according to|under|pursuant to|as per)\s+(?:section|clause|the act)',
-            r'\b(?:unfair trade practice|consumer right|complaint procedure)\b'
-        ]
-        
         legal_claims = 0
-        for pattern in legal_claim_patterns:
-            legal_claims += len(re.findall(pattern, response, re.IGNORECASE))
+        for pattern in CITATION_DENSITY_CLAIM_PATTERNS:
+            legal_claims += len(pattern.findall(response))
         
         # Count citations
-        citation_count = len(re.findall(r'\[Citation: [^\]]+\]', response))
+        citation_count = len(CITATION_MARKER_PATTERN.findall(response))
         
-        # Check minimum citations
-        if citation_count < requirements['min_citations'] and legal_claims > 0:
-            issues.append(ValidationIssue(
-                severity=ValidationSeverity.WARNING,
-                issue_type="insufficient_citations",
-                message=f"Response has {citation_count} citations but {audience} audience requires minimum {requirements['min_citations']}",
-                suggestion=f"Add more citations to meet {audience} requirements",
-                confidence_impact=-0.2
-            ))
+        return validator(legal_claims, citation_count, audience)
+    
+    @staticmethod
+    def _compile_audience_validator(requirements: CitationRequirements
+                                    ) -> Callable[[int, int, str], List[ValidationIssue]]:
+        """Build a citation density check with the audience requirements baked in"""
+        min_citations, max_claims_per_citation = requirements
         
-        # Check citation density
-        if legal_claims > 0:
+        def validate(legal_claims: int, citation_count: int, audience: str) -> List[ValidationIssue]:
+            if legal_claims == 0:
+                return []
+            
+            issues = []
+            
+            # Check minimum citations
+            if citation_count < min_citations:
+                issues.append(ValidationIssue(
+                    severity=ValidationSeverity.WARNING,
+                    issue_type="insufficient_citations",
+                    message=lambda: f"Response has {citation_count} citations but {audience} audience requires minimum {min_citations}",
+                    suggestion=f"Add more citations to meet {audience} requirements",
+                    confidence_impact=-0.2
+                ))
+            
+            # Check citation density
             claims_per_citation = legal_claims / max(1, citation_count)
-            if claims_per_citation > requirements['claims_per_citation']:
+            if claims_per_citation > max_claims_per_citation:
                 issues.append(ValidationIssue(
                     severity=ValidationSeverity.WARNING,
                     issue_type="low_citation_density",
-                    message=f"Citation density too low: {claims_per_citation:.1f} claims per citation (max: {requirements['claims_per_citation']})",
+                    message=lambda: f"Citation density too low: {claims_per_citation:.1f} claims per citation (max: {max_claims_per_citation})",
                     suggestion="Add more citations to support legal claims",
                     confidence_impact=-0.1
                 ))
+            
+            return issues
         
-        return issues
+        return validate
     
     def _validate_response_format(self, response: str, citation_constraints: CitationConstraints) -> List[ValidationIssue]:
         """Validate response format and structure"""
@@ -931,7 +1107,7 @@ class ResponseValidator:
                 issues.append(ValidationIssue(
                     severity=ValidationSeverity.WARNING,
                     issue_type="citation_format",
-                    message=f"Non-standard citation format found: {invalid}",
+                    message=lambda invalid=invalid: f"Non-standard citation format found: {invalid}",
                     suggestion="Use [Citation: ...] format",
                     confidence_impact=-0.05
                 ))
@@ -966,56 +1142,38 @@ class ResponseValidator:
     def _identify_unsupported_claims_enhanced(self, response: str, context: LLMContext) -> List[str]:
         """Enhanced identification of unsupported legal claims"""
         unsupported = []
+        response_length = len(response)
+        context_words = None
         
-        # Enhanced legal claim patterns
-        enhanced_patterns = [
-            r'section\s+\d+\s+(?:clearly\s+)?(?:states|provides|requires|prohibits|mandates|establishes)[^.]*\.',
-            r'the\s+(?:consumer protection\s+)?act\s+(?:explicitly\s+)?(?:defines|requires|prohibits|allows)[^.]*\.',
-            r'consumers?\s+(?:have\s+the\s+)?(?:right|entitlement)\s+to\s+[^.]*\.',
-            r'(?:according\s+to|under|pursuant\s+to|as\s+per)\s+(?:section|clause|the\s+act)[^.]*\.',
-            r'(?:the\s+law|statute|provision|regulation)\s+(?:clearly\s+)?(?:states|requires|prohibits)[^.]*\.',
-            r'(?:unfair\s+trade\s+practice|consumer\s+right|complaint\s+procedure)\s+(?:is\s+defined|means|includes)[^.]*\.'
-        ]
-        
-        for pattern in enhanced_patterns:
-            matches = re.finditer(pattern, response, re.IGNORECASE)
-            for match in matches:
-                claim = match.group()
+        for pattern in ENHANCED_CLAIM_PATTERNS:
+            for match in pattern.finditer(response):
                 claim_start = match.start()
                 claim_end = match.end()
                 
-                # Check for citations within 200 characters (expanded range)
+                # Check for citations within 200 characters (expanded range), searching
+                # the window in place rather than slicing it out
                 search_start = max(0, claim_start - 100)
-                search_end = min(len(response), claim_end + 100)
-                nearby_text = response[search_start:search_end]
-                
-                # Look for various citation formats
-                citation_patterns = [
-                    r'\[Citation: [^\]]+\]',
-                    r'\[Ref: [^\]]+\]',
-                    r'\(Section\s+\d+[^)]*\)',
-                    r'\(CPA\s+2019[^)]*\)'
-                ]
-                
-                has_nearby_citation = any(
-                    re.search(pattern, nearby_text, re.IGNORECASE) 
-                    for pattern in citation_patterns
-                )
+                search_end = min(response_length, claim_end + 100)
+                if NEARBY_CITATION_PATTERN.search(response, search_start, search_end):
+                    continue
                 
-                if not has_nearby_citation:
-                    # Check if claim is supported by context
-                    if not self._is_claim_supported_by_context(claim, context):
-                        unsupported.append(claim.strip())
+                # Check if claim is supported by context
+                claim = match.group()
+                if context_words is None:
+                    context_words = self._context_words(context)
+                if not self._is_claim_supported_by_context(claim, context, context_words):
+                    unsupported.append(claim.strip())
         
         return unsupported
     
     def _identify_fabricated_references(self, response: str, graph_context: GraphContext) -> List[str]:
         """Identify references to legal provisions that don't exist in knowledge graph"""
-        fabricated = []
+        # Ordered set: keeps first-seen order while removing duplicates
+        fabricated: Dict[str, None] = {}
         
         # Get available sections from graph context
         available_sections = set()
-        available_clauses = set()
+        available_clauses = []
         
         for node in graph_context.nodes:
             if node.node_type == 'section':
@@ -1025,40 +1183,33 @@ class ResponseValidator:
             elif node.node_type == 'clause':
                 clause_id = node.content.get('clause_id', '')
                 if clause_id:
-                    available_clauses.add(clause_id)
+                    available_clauses.append(clause_id.lower())
         
         # Find section references in response
-        section_patterns = [
-            r'\bsection\s+(\d+(?:\([^)]+\))?)',
-            r'\bsec\.\s*(\d+(?:\([^)]+\))?)',
-            r'§\s*(\d+(?:\([^)]+\))?)'
-        ]
-        
-        for pattern in section_patterns:
-            matches = re.finditer(pattern, response, re.IGNORECASE)
-            for match in matches:
+        for pattern in SECTION_REFERENCE_PATTERNS:
+            for match in pattern.finditer(response):
                 section_ref = match.group(1)
-                full_match = match.group(0)
                 
-                # Check if section exists in knowledge graph
-                if section_ref not in available_sections:
-                    # Also check without parenthetical parts
-                    base_section = re.sub(r'\([^)]+\)', '', section_ref)
-                    if base_section not in available_sections:
-                        fabricated.append(full_match)
+                # Check if section exists in knowledge graph, also without the
+                # parenthetical sub-section part when there is one
+                if section_ref in available_sections:
+                    continue
+                if '(' in section_ref and section_ref.split('(', 1)[0] in available_sections:
+                    continue
+                fabricated[match.group(0)] = None
         
         # Find clause references
-        clause_matches = re.finditer(r'\bclause\s+\([^)]+\)', response, re.IGNORECASE)
-        for match in clause_matches:
+        for match in CLAUSE_REFERENCE_PATTERN.finditer(response):
             clause_ref = match.group(0)
             # Simple check - could be enhanced with more sophisticated matching
-            if not any(clause_ref.lower() in clause_id.lower() for clause_id in available_clauses):
-                fabricated.append(clause_ref)
+            clause_ref_lower = clause_ref.lower()
+            if not any(clause_ref_lower in clause_id for clause_id in available_clauses):
+                fabricated[clause_ref] = None
         
-        return list(set(fabricated))  # Remove duplicates
+        return list(fabricated)
     
     def _calculate_enhanced_confidence_score(self, response: str, context: LLMContext,
-                                           graph_context: GraphContext, issues: List[ValidationIssue], 
+                                           graph_context: GraphContext, ledger: _IssueLedger, 
                                            citation_count: int, audience: str) -> float:
         """Calculate enhanced confidence score with multiple factors"""
         
@@ -1066,11 +1217,11 @@ class ResponseValidator:
         base_score = 1.0
         
         # Factor 1: Issue penalties (but not too harsh)
-        for issue in issues:
-            if issue.severity == ValidationSeverity.ERROR:
-                penalty = issue.confidence_impact if issue.confidence_impact else -0.2  # Reduced from -0.3
-            elif issue.severity == ValidationSeverity.WARNING:
-                penalty = issue.confidence_impact if issue.confidence_impact else -0.05  # Reduced from -0.1
+        for severity, impact in zip(ledger.severities, ledger.impacts):
+            if severity == ValidationSeverity.ERROR:
+                penalty = impact if impact else -0.2  # Reduced from -0.3
+            elif severity == ValidationSeverity.WARNING:
+                penalty = impact if impact else -0.05  # Reduced from -0.1
             else:  # INFO
                 penalty = -0.01
             base_score += penalty
@@ -1160,24 +1311,21 @@ class ResponseValidator:
         
         # Length appropriateness
         length = len(response)
-        if audience == 'citizen':
-            # Citizens prefer concise but complete responses
-            if length < 100:
-                quality_score -= 0.3  # Too brief
-            elif length > 2000:
-                quality_score -= 0.2  # Too verbose
-        elif audience == 'lawyer':
-            # Lawyers prefer detailed responses
-            if length < 200:
-                quality_score -= 0.2
+        min_length, brief_penalty, max_length, verbose_penalty, max_sentence_length = \
+            AUDIENCE_LENGTH_LIMITS.get(audience, NO_LENGTH_LIMITS)
+        if length < min_length:
+            quality_score -= brief_penalty  # Too brief
+        elif length > max_length:
+            quality_score -= verbose_penalty  # Too verbose
         
         # Readability (simple heuristic)
-        sentences = len(re.split(r'[.!?]+', response))
+        # One more sentence than terminator runs, without materializing the pieces
+        sentences = sum(1 for _ in SENTENCE_TERMINATOR_PATTERN.finditer(response)) + 1
         words = len(response.split())
         avg_sentence_length = words / max(1, sentences)
         
-        if audience == 'citizen' and avg_sentence_length > 25:
-            quality_score -= 0.1  # Too complex for citizens
+        if avg_sentence_length > max_sentence_length:
+            quality_score -= 0.1  # Too complex for the audience
         
         # Structure bonus
         has_structure = bool(re.search(r'(?:^|\n)(?:\d+\.|•|\*|\-)\s+', response, re.MULTILINE))
@@ -1186,62 +1334,45 @@ class ResponseValidator:
         
         return max(0.0, min(1.0, quality_score))
     
-    def _determine_validity(self, issues: List[ValidationIssue], confidence_score: float, 
+    def _determine_validity(self, has_critical_error: bool, confidence_score: float, 
                            fabricated_references: List[str]) -> bool:
         """Determine if response is valid for display"""
         
-        # Block if there are fabricated references
-        if fabricated_references:
-            return False
-        
-        # Block if there are critical errors
-        critical_errors = [
-            issue for issue in issues 
-            if issue.severity == ValidationSeverity.ERROR and 
-            issue.issue_type in ['fabricated_section', 'hallucinated_content', 'predictive_language']
-        ]
-        
-        if critical_errors:
-            return False
-        
-        # Block if confidence is very low
-        if confidence_score < self.confidence_thresholds['very_low']:
-            return False
-        
-        return True
+        # Block on fabricated references or critical errors, or if confidence is very low
+        return (not fabricated_references and
+                not has_critical_error and
+                confidence_score >= self.confidence_thresholds.very_low)
     
-    def _requires_human_review(self, confidence_score: float, issues: List[ValidationIssue], 
+    def _requires_human_review(self, confidence_score: float, ledger: _IssueLedger, 
                               audience: str) -> bool:
         """Determine if response requires human review"""
         
         # Always review for judge audience if confidence is not high
-        if audience == 'judge' and confidence_score < self.confidence_thresholds['high']:
+        if audience == 'judge' and confidence_score < self.confidence_thresholds.high:
             return True
         
         # Review if confidence is below medium threshold
-        if confidence_score < self.confidence_thresholds['medium']:
+        if confidence_score < self.confidence_thresholds.medium:
             return True
         
         # Review if there are specific issue types
-        review_triggering_issues = [
+        review_triggering_issues = {
             'content_mismatch', 'unverified_definition', 'potential_contradiction',
             'hallucinated_content', 'fabricated_section'
-        ]
-        
-        for issue in issues:
-            if issue.issue_type in review_triggering_issues:
-                return True
+        }
         
-        return False
+        return not review_triggering_issues.isdisjoint(ledger.issue_types)
     
-    def _is_claim_supported_by_context(self, claim: str, context: LLMContext) -> bool:
+    def _is_claim_supported_by_context(self, claim: str, context: LLMContext,
+                                       context_words: Optional[Set[str]] = None) -> bool:
         """Check if a legal claim is supported by the provided context"""
         if not context.formatted_text:
             return False
         
         # Extract key terms from claim
-        claim_words = set(re.findall(r'\b\w{4,}\b', claim.lower()))  # Words with 4+ chars
-        context_words = set(re.findall(r'\b\w{4,}\b', context.formatted_text.lower()))
+        claim_words = set(CLAIM_WORD_PATTERN.findall(claim.lower()))  # Words with 4+ chars
+        if context_words is None:
+            context_words = self._context_words(context)
         
         # Calculate overlap
         if len(claim_words) == 0:
@@ -1250,4 +1381,11 @@ class ResponseValidator:
         overlap_ratio = len(claim_words.intersection(context_words)) / len(claim_words)
         
         # Require at least 60% overlap for support
-        return overlap_ratio >= 0.6
\ No newline at end of file
+        return overlap_ratio >= 0.6
+    
+    @staticmethod
+    def _context_words(context: LLMContext) -> Set[str]:
+        """Words with 4+ characters in the formatted context"""
+        if not context.formatted_text:
+            return set()
+        return set(CLAIM_WORD_PATTERN.findall(context.formatted_text.lower()))
@@ -11,12 +11,74 @@ The context is structured with:
 - Hierarchical context (parent sections/chapters)
 """
 
-from typing import List, Dict, Optional, Set
+import re
+import sys
+import threading
+from collections import ChainMap, OrderedDict, defaultdict
+from typing import Any, List, Dict, Optional, Set
 from dataclasses import dataclass
 from query_engine.graph_traversal import GraphContext, GraphNode, GraphEdge
 from query_engine.query_parser import QueryIntent, IntentType
 
 
+# The six fundamental consumer rights from Section 2(9) as (title, description, section)
+FUNDAMENTAL_RIGHTS = (
+    ("Right to Safety",
+     "Protection against goods and services which are hazardous to life and property",
+     "Section 2(9)(a)"),
+    ("Right to be Informed",
+     "Right to be informed about the quality, quantity, potency, purity, standard and price of goods or services",
+     "Section 2(9)(b)"),
+    ("Right to Choose",
+     "Right to be assured of access to a variety of goods and services at competitive prices",
+     "Section 2(9)(c)"),
+    ("Right to be Heard",
+     "Right to be heard and to be assured that consumer interests will receive due consideration",
+     "Section 2(9)(d)"),
+    ("Right to Seek Redressal",
+     "Right to seek redressal against unfair trade practices or restrictive trade practices or unscrupulous exploitation of consumers",
+     "Section 2(9)(e)"),
+    ("Right to Consumer Education",
+     "Right to consumer education and to be informed about consumer rights and remedies",
+     "Section 2(9)(f)"),
+)
+
+# Section headers, interned once since every built context repeats them
+PRIMARY_PROVISIONS_HEADER = sys.intern("=== PRIMARY LEGAL PROVISIONS ===")
+DEFINITIONS_HEADER = sys.intern("\n=== LEGAL DEFINITIONS ===")
+CONSUMER_RIGHTS_HEADER = sys.intern("\n=== CONSUMER RIGHTS ===")
+RELATED_PROVISIONS_HEADER = sys.intern("\n=== RELATED PROVISIONS ===")
+CONTEXTUAL_INFORMATION_HEADER = sys.intern("\n=== CONTEXTUAL INFORMATION ===")
+
+# Citizen-friendly replacements for the section headers, applied in one scan
+CITIZEN_HEADERS = {
+    "PRIMARY LEGAL PROVISIONS": "RELEVANT LAWS THAT APPLY TO YOUR SITUATION",
+    "LEGAL DEFINITIONS": "WHAT THESE LEGAL TERMS MEAN",
+    "CONSUMER RIGHTS": "YOUR RIGHTS AS A CONSUMER",
+}
+CITIZEN_HEADER_PATTERN = re.compile(
+    "=== (" + "|".join(re.escape(header) for header in CITIZEN_HEADERS) + ") ==="
+)
+
+# Precomputed citation keys indexed by citation number; larger numbers are formatted on demand
+CITATION_KEYS = tuple(sys.intern(f"Citation-{i}") for i in range(1024))
+
+TRUNCATION_NOTICE = "\n\n[Context truncated due to length limits]"
+
+FUNDAMENTAL_RIGHTS_CITATION = sys.intern("Section 2, Consumer Protection Act, 2019")
+
+# Section node layouts: brief for related provisions, full for primary provisions
+SECTION_BRIEF_TEMPLATE = "**Section {0}**: {1} [{2}]\n{3}"
+SECTION_FULL_TEMPLATE = "**Section {0}: {1}** [{2}]\n\n{3}"
+
+# Pre-rendered fundamental rights block; positional fields take the citation keys
+FUNDAMENTAL_RIGHTS_TEMPLATE = "\n".join(
+    ["**Fundamental Consumer Rights (Section 2(9) of Consumer Protection Act, 2019):**", ""] +
+    [f"{i}. **{title}**: {description} [{{{i - 1}}}]"
+     for i, (title, description, _section) in enumerate(FUNDAMENTAL_RIGHTS, 1)]
+)
+
+
 @dataclass
 class LLMContext:
     """Structured context for LLM consumption"""
@@ -40,20 +102,44 @@ class LLMContext:
 class ContextBuilder:
     """Build structured context for LLM from graph data."""
     
-    def __init__(self, max_context_length: int = 8000):
+    def __init__(self, max_context_length: int = 8000, cache_size: int = 256,
+                 render_cache_size: int = 64):
         """
         Initialize the context builder.
         
         Args:
             max_context_length: Maximum character length for LLM context
+            cache_size: Maximum number of built contexts to cache (0 disables caching)
+            render_cache_size: Maximum number of section renderings to cache
+                (0 disables the render cache)
         """
         self.max_context_length = max_context_length
         self.citation_counter = 0
+        
+        # LRU cache of built contexts for repeated retrievals
+        self.cache_size = cache_size
+        self._context_cache: OrderedDict = OrderedDict()
+        
+        # LRU cache of section renderings; a few sections dominate traffic, so a
+        # cache much smaller than the corpus keeps the hot ones
+        self.render_cache_size = render_cache_size
+        self._render_cache: OrderedDict = OrderedDict()
+        
+        # Citations the traversal formatted for the nodes of the context being built,
+        # by node identity; replaced at the start of each build
+        self._node_citations: Dict[int, str] = {}
+        
+        # A build resets and advances citation_counter and updates the caches above,
+        # so builds from concurrent queries run one at a time
+        self._build_lock = threading.Lock()
     
     def build_context(self, graph_context: GraphContext, intent: QueryIntent) -> LLMContext:
         """
         Format graph data for LLM consumption.
         
+        Contexts are cached by intent type and the retrieved graph structure;
+        cached contexts are shared and should be treated as read-only.
+        
         Args:
             graph_context: Retrieved graph context from traversal
             intent: Original query intent
@@ -61,21 +147,53 @@ class ContextBuilder:
         Returns:
             LLMContext with structured text and metadata
         """
-        self.citation_counter = 0  # Reset counter
+        with self._build_lock:
+            if self.cache_size <= 0:
+                return self._build_context_uncached(graph_context, intent)
+            
+            return self._build_context_cached(graph_context, intent)
+    
+    def _build_context_cached(self, graph_context: GraphContext, intent: QueryIntent) -> LLMContext:
+        """Build the LLM context through the context cache; the caller holds the build lock."""
+        # Node content is keyed by identity; the cache entry pins the nodes so ids stay unique
+        cache_key = (
+            intent.intent_type,
+            tuple((node.node_id, node.node_type, id(node.content)) for node in graph_context.nodes),
+            tuple(edge.to_node for edge in graph_context.edges),
+            tuple(graph_context.traversal_path[:3]),
+            graph_context.confidence
+        )
+        cached = self._context_cache.get(cache_key)
+        if cached is not None:
+            self._context_cache.move_to_end(cache_key)
+            return cached[1]
         
-        # Categorize nodes by relevance and type
-        primary_nodes = graph_context.get_primary_nodes()
-        related_nodes = graph_context.get_related_nodes()
+        llm_context = self._build_context_uncached(graph_context, intent)
         
-        # Separate by node type
-        sections = [n for n in graph_context.nodes if n.node_type == 'section']
-        definitions = [n for n in graph_context.nodes if n.node_type == 'definition']
-        rights = [n for n in graph_context.nodes if n.node_type == 'right']
-        clauses = [n for n in graph_context.nodes if n.node_type == 'clause']
+        self._context_cache[cache_key] = (list(graph_context.nodes), llm_context)
+        if len(self._context_cache) > self.cache_size:
+            self._context_cache.popitem(last=False)
+        
+        return llm_context
+    
+    def clear_cache(self):
+        """Drop all cached contexts and section renderings"""
+        with self._build_lock:
+            self._context_cache.clear()
+            self._render_cache.clear()
+            self._node_citations = {}
+    
+    def _get_citation(self, node: GraphNode) -> str:
+        """Get a node's citation, reusing the one the traversal formatted for it."""
+        citation = self._node_citations.get(id(node))
+        if citation is None:
+            citation = node.get_citation()
+        return citation
+    
+    def _build_context_uncached(self, graph_context: GraphContext, intent: QueryIntent) -> LLMContext:
+        """Build the LLM context for a graph context."""
+        self.citation_counter = 0  # Reset counter
         
-        # Build context sections
-        context_parts = []
-        citations = {}
         metadata = {
             'intent_type': intent.intent_type.value,
             'confidence': graph_context.confidence,
@@ -83,48 +201,97 @@ class ContextBuilder:
             'edge_count': len(graph_context.edges)
         }
         
-        # 1. Primary Provisions Section
-        primary_text, primary_citations = self._build_primary_provisions(primary_nodes, intent)
-        if primary_text:
-            context_parts.append("=== PRIMARY LEGAL PROVISIONS ===")
-            context_parts.append(primary_text)
-            citations.update(primary_citations)
+        # Nothing retrieved: every section would come out empty
+        if not graph_context.nodes:
+            return LLMContext(
+                formatted_text="",
+                citations={},
+                metadata=metadata,
+                primary_provisions=[],
+                related_provisions=[],
+                definitions=[],
+                hierarchical_context=[]
+            )
+        
+        # The traversal lists one citation per node; the graph context keeps every
+        # node alive for the build, so node identities stay unique
+        if len(graph_context.citations) == len(graph_context.nodes):
+            self._node_citations = {
+                id(node): citation for node, citation in zip(graph_context.nodes, graph_context.citations)
+            }
+        else:
+            self._node_citations = {}
+        
+        # Categorize nodes by relevance and type
+        primary_nodes = graph_context.get_primary_nodes()
+        related_nodes = graph_context.get_related_nodes()
+        
+        # Separate by node type in a single pass
+        buckets = {'section': [], 'definition': [], 'right': [], 'clause': []}
+        for node in graph_context.nodes:
+            bucket = buckets.get(node.node_type)
+            if bucket is not None:
+                bucket.append(node)
+        sections = buckets['section']
+        definitions = buckets['definition']
+        rights = buckets['right']
+        definition_terms = [definition.content.get('term', '') for definition in definitions]
         
-        # 2. Definitions Section
-        definitions_text, def_citations = self._build_definitions_section(definitions)
-        if definitions_text:
-            context_parts.append("\n=== LEGAL DEFINITIONS ===")
-            context_parts.append(definitions_text)
-            citations.update(def_citations)
+        # Build context sections
+        context_parts = []
+        citation_maps = []
+        
+        # Section builders in output order; each returns (text, citations)
+        section_specs = [
+            # 1. Primary Provisions Section
+            (PRIMARY_PROVISIONS_HEADER, self._build_primary_provisions, (primary_nodes, intent)),
+            # 2. Definitions Section
+            (DEFINITIONS_HEADER, self._build_definitions_section, (definitions, definition_terms)),
+        ]
         
         # 3. Consumer Rights Section (for rights queries)
         if intent.intent_type == IntentType.RIGHTS_QUERY and rights:
-            rights_text, rights_citations = self._build_rights_section(rights)
-            if rights_text:
-                context_parts.append("\n=== CONSUMER RIGHTS ===")
-                context_parts.append(rights_text)
-                citations.update(rights_citations)
-        
-        # 4. Related Provisions Section
-        related_text, related_citations = self._build_related_provisions(related_nodes, graph_context.edges)
-        if related_text:
-            context_parts.append("\n=== RELATED PROVISIONS ===")
-            context_parts.append(related_text)
-            citations.update(related_citations)
-        
-        # 5. Hierarchical Context (if needed)
-        hierarchical_text, hier_citations = self._build_hierarchical_context(sections)
-        if hierarchical_text:
-            context_parts.append("\n=== CONTEXTUAL INFORMATION ===")
-            context_parts.append(hierarchical_text)
-            citations.update(hier_citations)
+            section_specs.append((CONSUMER_RIGHTS_HEADER, self._build_rights_section, (rights,)))
+        
+        section_specs += [
+            # 4. Related Provisions Section
+            (RELATED_PROVISIONS_HEADER, self._build_related_provisions, (related_nodes, graph_context.edges)),
+            # 5. Hierarchical Context (if needed)
+            (CONTEXTUAL_INFORMATION_HEADER, self._build_hierarchical_context, (sections,)),
+        ]
+        
+        # Builders share the citation counter, so they run sequentially in order.
+        # Sections are budgeted as they are added: the first section is always kept
+        # whole, later ones are added while they fit, and the first one that does not
+        # fit is truncated to the remaining space. Citations are kept for every section.
+        running_length = 0
+        truncated = False
+        for header, builder, args in section_specs:
+            section_text, section_citations = builder(*args)
+            if not section_text:
+                continue
+            citation_maps.append(section_citations)
+            if truncated:
+                continue
+            
+            separator_length = 1 if context_parts else 0
+            block_length = separator_length + len(header) + 1 + len(section_text)
+            if not context_parts or running_length + block_length <= self.max_context_length:
+                context_parts += (header, section_text)
+                running_length += block_length
+            else:
+                available = (self.max_context_length - running_length - separator_length -
+                             len(header) - 1 - len(TRUNCATION_NOTICE))
+                if available > 0:
+                    context_parts += (header, self._truncate_section(section_text, available) + TRUNCATION_NOTICE)
+                truncated = True
         
         # Combine all parts
         formatted_text = "\n".join(context_parts)
         
-        # Truncate if too long
-        if len(formatted_text) > self.max_context_length:
-            formatted_text = self._truncate_context(formatted_text, citations)
+        # Citation keys are unique across sections; ChainMap iterates its maps last
+        # to first, so reverse them to keep citations in section order
+        citations = dict(ChainMap(*reversed(citation_maps)))
         
         return LLMContext(
             formatted_text=formatted_text,
@@ -132,7 +299,7 @@ class ContextBuilder:
             metadata=metadata,
             primary_provisions=self._extract_provision_list(primary_nodes),
             related_provisions=self._extract_provision_list(related_nodes),
-            definitions=[d.content.get('term', '') for d in definitions],
+            definitions=definition_terms,
             hierarchical_context=self._extract_hierarchical_list(sections)
         )
     
@@ -141,114 +308,50 @@ class ContextBuilder:
         if not nodes:
             return "", {}
         
-        parts = []
-        citations = {}
+        # Every node gets a citation; only sections, definitions and rights are rendered
+        citation_keys = self._allocate_citation_keys(len(nodes))
+        citations = {key: self._get_citation(node) for key, node in zip(citation_keys, nodes)}
         
-        for node in nodes:
-            citation_key = self._get_next_citation_key()
-            citation_text = node.get_citation()
-            citations[citation_key] = citation_text
-            
-            if node.node_type == 'section':
-                section_text = self._format_section_node(node, citation_key)
-                parts.append(section_text)
-            elif node.node_type == 'definition':
-                def_text = self._format_definition_node(node, citation_key)
-                parts.append(def_text)
-            elif node.node_type == 'right':
-                right_text = self._format_right_node(node, citation_key)
-                parts.append(right_text)
-        
-        return "\n\n".join(parts), citations
+        formatters = {
+            'section': self._format_section_node,
+            'definition': self._format_definition_node,
+            'right': self._format_right_node
+        }
+        
+        return "\n\n".join(
+            formatters[node.node_type](node.content, citation_key)
+            for node, citation_key in zip(nodes, citation_keys)
+            if node.node_type in formatters
+        ), citations
     
-    def _build_definitions_section(self, definitions: List[GraphNode]) -> tuple[str, Dict[str, str]]:
-        """Build the definitions section."""
+    def _build_definitions_section(self, definitions: List[GraphNode],
+                                   terms: List[str]) -> tuple[str, Dict[str, str]]:
+        """Build the definitions section from definition nodes and their terms."""
         if not definitions:
             return "", {}
         
-        parts = []
-        citations = {}
-        
-        for definition in definitions:
-            citation_key = self._get_next_citation_key()
-            citation_text = definition.get_citation()
-            citations[citation_key] = citation_text
-            
-            term = definition.content.get('term', '')
-            definition_text = definition.content.get('definition', '')
-            
-            formatted = f"**{term.upper()}**: {definition_text} [{citation_key}]"
-            parts.append(formatted)
+        citation_keys = self._allocate_citation_keys(len(definitions))
+        citations = {key: self._get_citation(definition) for key, definition in zip(citation_keys, definitions)}
         
-        return "\n\n".join(parts), citations
+        return "\n\n".join(
+            f"**{term.upper()}**: {definition.content.get('definition', '')} [{citation_key}]"
+            for definition, term, citation_key in zip(definitions, terms, citation_keys)
+        ), citations
     
     def _build_rights_section(self, rights: List[GraphNode]) -> tuple[str, Dict[str, str]]:
         """Build the consumer rights section with comprehensive coverage."""
         if not rights:
             return "", {}
         
-        parts = []
-        citations = {}
-        
         # Always include the six fundamental consumer rights from Section 2(9)
-        fundamental_rights = [
-            {
-                "title": "Right to Safety",
-                "description": "Protection against goods and services which are hazardous to life and property",
-                "section": "Section 2(9)(a)",
-                "key": "safety"
-            },
-            {
-                "title": "Right to be Informed", 
-                "description": "Right to be informed about the quality, quantity, potency, purity, standard and price of goods or services",
-                "section": "Section 2(9)(b)",
-                "key": "informed"
-            },
-            {
-                "title": "Right to Choose",
-                "description": "Right to be assured of access to a variety of goods and services at competitive prices",
-                "section": "Section 2(9)(c)",
-                "key": "choose"
-            },
-            {
-                "title": "Right to be Heard",
-                "description": "Right to be heard and to be assured that consumer interests will receive due consideration",
-                "section": "Section 2(9)(d)",
-                "key": "heard"
-            },
-            {
-                "title": "Right to Seek Redressal",
-                "description": "Right to seek redressal against unfair trade practices or restrictive trade practices or unscrupulous exploitation of consumers",
-                "section": "Section 2(9)(e)",
-                "key": "redressal"
-            },
-            {
-                "title": "Right to Consumer Education",
-                "description": "Right to consumer education and to be informed about consumer rights and remedies",
-                "section": "Section 2(9)(f)",
-                "key": "education"
-            }
-        ]
-        
-        parts.append("**Fundamental Consumer Rights (Section 2(9) of Consumer Protection Act, 2019):**")
-        parts.append("")
-        
-        # Add fundamental rights with citations
-        for i, right in enumerate(fundamental_rights, 1):
-            citation_key = self._get_next_citation_key()
-            citations[citation_key] = f"Section 2, Consumer Protection Act, 2019"
-            
-            parts.append(f"{i}. **{right['title']}**: {right['description']} [{citation_key}]")
-        
-        parts.append("")
+        citation_keys = self._allocate_citation_keys(len(FUNDAMENTAL_RIGHTS))
+        citations = dict.fromkeys(citation_keys, FUNDAMENTAL_RIGHTS_CITATION)
+        parts = [FUNDAMENTAL_RIGHTS_TEMPLATE.format(*citation_keys), ""]
         
         # Group additional rights by type
-        rights_by_type = {}
+        rights_by_type = defaultdict(list)
         for right in rights:
-            right_type = right.content.get('right_type', 'unknown')
-            if right_type not in rights_by_type:
-                rights_by_type[right_type] = []
-            rights_by_type[right_type].append(right)
+            rights_by_type[right.content.get('right_type', 'unknown')].append(right)
         
         # Add procedural and remedy rights
         for right_type, type_rights in rights_by_type.items():
@@ -263,18 +366,14 @@ class ContextBuilder:
             
             for right in type_rights:
                 citation_key = self._get_next_citation_key()
-                citation_text = right.get_citation()
+                citation_text = self._get_citation(right)
                 citations[citation_key] = citation_text
                 
                 description = right.content.get('description', '')
                 scope = right.content.get('scope', '')
+                scope_note = f" (Scope: {scope})" if scope else ""
                 
-                right_text = f"• {description}"
-                if scope:
-                    right_text += f" (Scope: {scope})"
-                right_text += f" [{citation_key}]"
-                
-                parts.append(right_text)
+                parts.append(f"• {description}{scope_note} [{citation_key}]")
             
             parts.append("")  # Add spacing between right types
         
@@ -285,84 +384,92 @@ class ContextBuilder:
         if not nodes:
             return "", {}
         
-        parts = []
-        citations = {}
-        
         # Group nodes by relationship type
-        referenced_nodes = set()
-        for edge in edges:
-            referenced_nodes.add(edge.to_node)
+        referenced_nodes = {edge.to_node for edge in edges}
+        if not referenced_nodes:
+            return "", {}
         
-        for node in nodes:
-            if node.node_id in referenced_nodes:
-                citation_key = self._get_next_citation_key()
-                citation_text = node.get_citation()
-                citations[citation_key] = citation_text
-                
-                if node.node_type == 'section':
-                    section_text = self._format_section_node(node, citation_key, brief=True)
-                    parts.append(section_text)
+        referenced = [node for node in nodes if node.node_id in referenced_nodes]
+        citation_keys = self._allocate_citation_keys(len(referenced))
+        citations = {key: self._get_citation(node) for key, node in zip(citation_keys, referenced)}
         
-        return "\n\n".join(parts), citations
+        return "\n\n".join(
+            self._format_section_node(node.content, citation_key, brief=True)
+            for node, citation_key in zip(referenced, citation_keys)
+            if node.node_type == 'section'
+        ), citations
     
     def _build_hierarchical_context(self, sections: List[GraphNode]) -> tuple[str, Dict[str, str]]:
         """Build hierarchical context information."""
         if not sections:
             return "", {}
         
-        parts = []
         citations = {}
         
         # Group sections by chapter
-        chapters = {}
+        chapters = defaultdict(list)
         for section in sections:
-            chapter = section.content.get('chapter_title', 'Unknown Chapter')
-            if chapter not in chapters:
-                chapters[chapter] = []
-            chapters[chapter].append(section)
-        
-        for chapter_title, chapter_sections in chapters.items():
-            if len(chapter_sections) > 1:  # Only show if multiple sections
-                parts.append(f"**{chapter_title}:**")
-                for section in chapter_sections[:3]:  # Limit to 3 sections
-                    section_num = section.content.get('section_number', '')
-                    section_title = section.content.get('title', '')
-                    parts.append(f"• Section {section_num}: {section_title}")
-                parts.append("")
+            chapters[section.content.get('chapter_title', 'Unknown Chapter')].append(section)
+        
+        # One block per chapter: heading, then one line per section, each newline-terminated
+        chapter_blocks = (
+            f"**{chapter_title}:**\n" + "".join(
+                f"• Section {section.content.get('section_number', '')}: {section.content.get('title', '')}\n"
+                for section in chapter_sections[:3]  # Limit to 3 sections
+            )
+            for chapter_title, chapter_sections in chapters.items()
+            if len(chapter_sections) > 1  # Only show if multiple sections
+        )
         
-        return "\n".join(parts), citations
+        return "\n".join(chapter_blocks), citations
     
-    def _format_section_node(self, node: GraphNode, citation_key: str, brief: bool = False) -> str:
-        """Format a section node for display."""
-        section_num = node.content.get('section_number', '')
-        title = node.content.get('title', '')
-        text = node.content.get('text', '')
+    def _format_section_node(self, content: Dict[str, Any], citation_key: str, brief: bool = False) -> str:
+        """Format a section node's content for display, reusing cached renderings."""
+        if self.render_cache_size <= 0:
+            return self._render_section_node(content, citation_key, brief)
+        
+        # Content is keyed by identity; the entry pins the content so its id stays unique
+        cache_key = (id(content), citation_key, brief)
+        cached = self._render_cache.get(cache_key)
+        if cached is not None and cached[0] is content:
+            self._render_cache.move_to_end(cache_key)
+            return cached[1]
+        
+        formatted = self._render_section_node(content, citation_key, brief)
+        
+        self._render_cache[cache_key] = (content, formatted)
+        if len(self._render_cache) > self.render_cache_size:
+            self._render_cache.popitem(last=False)
+        
+        return formatted
+    
+    def _render_section_node(self, content: Dict[str, Any], citation_key: str, brief: bool) -> str:
+        """Render a section node's content as display text."""
+        section_num = content.get('section_number', '')
+        title = content.get('title', '')
+        text = content.get('text', '')
         
         if brief:
             # Brief format for related provisions
-            formatted = f"**Section {section_num}**: {title} [{citation_key}]"
             if len(text) > 200:
-                formatted += f"\n{text[:200]}..."
-            else:
-                formatted += f"\n{text}"
-        else:
-            # Full format for primary provisions
-            formatted = f"**Section {section_num}: {title}** [{citation_key}]\n\n{text}"
+                text = text[:200] + "..."
+            return SECTION_BRIEF_TEMPLATE.format(section_num, title, citation_key, text)
         
-        return formatted
+        # Full format for primary provisions
+        return SECTION_FULL_TEMPLATE.format(section_num, title, citation_key, text)
     
-    def _format_definition_node(self, node: GraphNode, citation_key: str) -> str:
-        """Format a definition node for display."""
-        term = node.content.get('term', '')
-        definition = node.content.get('definition', '')
+    def _format_definition_node(self, content: Dict[str, Any], citation_key: str) -> str:
+        """Format a definition node's content for display."""
+        term = content.get('term', '')
+        definition = content.get('definition', '')
         
         return f"**Definition of '{term}'** [{citation_key}]\n\n{definition}"
     
-    def _format_right_node(self, node: GraphNode, citation_key: str) -> str:
-        """Format a right node for display."""
-        description = node.content.get('description', '')
-        scope = node.content.get('scope', '')
-        enforcement = node.content.get('enforcement_mechanism', '')
+    def _format_right_node(self, content: Dict[str, Any], citation_key: str) -> str:
+        """Format a right node's content for display."""
+        description = content.get('description', '')
+        scope = content.get('scope', '')
+        enforcement = content.get('enforcement_mechanism', '')
         
         formatted = f"**Consumer Right** [{citation_key}]\n\n{description}"
         
@@ -374,67 +481,74 @@ class ContextBuilder:
         
         return formatted
     
+    def _allocate_citation_keys(self, count: int) -> List[str]:
+        """Reserve the next count citation keys in one step."""
+        start = self.citation_counter + 1
+        self.citation_counter += count
+        stop = self.citation_counter + 1
+        if stop <= len(CITATION_KEYS):
+            return list(CITATION_KEYS[start:stop])
+        return [f"Citation-{i}" for i in range(start, stop)]
+    
     def _get_next_citation_key(self) -> str:
         """Get the next citation key in sequence."""
         self.citation_counter += 1
+        if self.citation_counter < len(CITATION_KEYS):
+            return CITATION_KEYS[self.citation_counter]
         return f"Citation-{self.citation_counter}"
     
     def _extract_provision_list(self, nodes: List[GraphNode]) -> List[str]:
         """Extract list of provision identifiers."""
         provisions = []
+        append = provisions.append
         for node in nodes:
-            if node.node_type == 'section':
-                section_num = node.content.get('section_number', '')
-                provisions.append(f"Section {section_num}")
-            elif node.node_type == 'clause':
-                parent = node.content.get('parent_section', '')
-                label = node.content.get('label', '')
-                provisions.append(f"{parent}, Clause {label}")
+            node_type = node.node_type
+            content = node.content
+            if node_type == 'section':
+                append(f"Section {content.get('section_number', '')}")
+            elif node_type == 'clause':
+                append(f"{content.get('parent_section', '')}, Clause {content.get('label', '')}")
         return provisions
     
     def _extract_hierarchical_list(self, sections: List[GraphNode]) -> List[str]:
         """Extract hierarchical context list."""
-        context = []
-        chapters = set()
-        
-        for section in sections:
-            chapter_title = section.content.get('chapter_title', '')
-            if chapter_title and chapter_title not in chapters:
-                chapters.add(chapter_title)
-                context.append(chapter_title)
-        
-        return list(context)
+        # Unique non-empty chapter titles in first-seen order
+        chapter_titles = (section.content.get('chapter_title', '') for section in sections)
+        return list(dict.fromkeys(title for title in chapter_titles if title))
     
-    def _truncate_context(self, text: str, citations: Dict[str, str]) -> str:
-        """Truncate context to fit within length limits while preserving structure."""
-        if len(text) <= self.max_context_length:
-            return text
-        
-        # Split into sections
-        sections = text.split("===")
+    def _truncate_section(self, text: str, limit: int) -> str:
+        """
+        Shorten a section to at most limit characters, keeping every paragraph.
         
-        # Keep primary provisions and definitions, truncate others
-        truncated_sections = []
-        current_length = 0
+        Finds the largest per-paragraph cap whose capped lengths fit the limit
+        and shortens only the paragraphs longer than the cap, so short paragraphs
+        survive intact and long ones lose their tails.
+        """
+        if len(text) <= limit:
+            return text
         
-        for i, section in enumerate(sections):
-            section_length = len(section)
-            
-            if i <= 2:  # Keep first 3 sections (primary + definitions)
-                truncated_sections.append(section)
-                current_length += section_length
-            elif current_length + section_length < self.max_context_length:
-                truncated_sections.append(section)
-                current_length += section_length
-            else:
-                # Add truncation notice
-                remaining_space = self.max_context_length - current_length - 100
-                if remaining_space > 0:
-                    truncated_section = section[:remaining_space] + "\n\n[Context truncated due to length limits]"
-                    truncated_sections.append(truncated_section)
+        paragraphs = text.split("\n\n")
+        budget = limit - 2 * (len(paragraphs) - 1)  # Room left after paragraph separators
+        
+        # Water-fill the budget over paragraph lengths, smallest first
+        lengths = sorted(len(paragraph) for paragraph in paragraphs)
+        remaining = budget
+        cap = 0
+        for i, length in enumerate(lengths):
+            share = remaining // (len(lengths) - i)
+            if length > share:
+                cap = share
                 break
+            remaining -= length
+        
+        if cap < 4:
+            # Too little room to keep a piece of every paragraph
+            return text[:max(0, limit)]
         
-        return "===".join(truncated_sections)
+        return "\n\n".join(
+            paragraph if len(paragraph) <= cap else paragraph[:cap - 3] + "..."
+            for paragraph in paragraphs
+        )
     
     def format_for_audience(self, context: LLMContext, audience: str = "citizen") -> LLMContext:
         """
@@ -471,30 +585,19 @@ class ContextBuilder:
     
     def _simplify_for_citizens(self, text: str) -> str:
         """Simplify legal text for citizen audience."""
-        # Add explanatory notes for complex terms
-        simplified = text
-        
         # Add citizen-friendly headers
-        simplified = simplified.replace("=== PRIMARY LEGAL PROVISIONS ===", 
-                                      "=== RELEVANT LAWS THAT APPLY TO YOUR SITUATION ===")
-        simplified = simplified.replace("=== LEGAL DEFINITIONS ===", 
-                                      "=== WHAT THESE LEGAL TERMS MEAN ===")
-        simplified = simplified.replace("=== CONSUMER RIGHTS ===", 
-                                      "=== YOUR RIGHTS AS A CONSUMER ===")
-        
-        return simplified
+        return CITIZEN_HEADER_PATTERN.sub(
+            lambda match: f"=== {CITIZEN_HEADERS[match.group(1)]} ===", text
+        )
     
     def _enhance_for_lawyers(self, text: str, citations: Dict[str, str]) -> str:
         """Enhance context for lawyer audience with technical details."""
-        enhanced = text
+        if not citations:
+            return text
         
         # Add citation summary at the end
-        if citations:
-            enhanced += "\n\n=== CITATION SUMMARY ===\n"
-            for key, citation in citations.items():
-                enhanced += f"{key}: {citation}\n"
-        
-        return enhanced
+        summary = "".join(f"{key}: {citation}\n" for key, citation in citations.items())
+        return f"{text}\n\n=== CITATION SUMMARY ===\n{summary}"
     
     def _enhance_for_judges(self, text: str, citations: Dict[str, str]) -> str:
         """Enhance context for judge audience with legal analysis."""
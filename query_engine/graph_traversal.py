@@ -11,54 +11,132 @@ Supports traversal strategies:
 - Multi-hop reasoning: Combine multiple provisions
 """
 
+import heapq
 import json
+import os
+import pickle
 import re
-from typing import List, Dict, Optional, Set, Tuple, Any
+import sys
+import tempfile
+import threading
+from collections import OrderedDict, deque
+from typing import FrozenSet, Iterator, List, Dict, NamedTuple, Optional, Set, Tuple, Any
 from dataclasses import dataclass
+from functools import cached_property
+from itertools import chain, islice
 from pathlib import Path
-from query_engine.query_parser import QueryIntent, IntentType
+from query_engine.query_parser import DATACLASS_SLOTS, QueryIntent, IntentType
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Content field holding the main text of each node type
+NODE_TEXT_FIELDS = {
+    'section': 'text',
+    'clause': 'text',
+    'definition': 'definition',
+    'right': 'description',
+}
+
+# Citation formatters by node type; each takes the node content
+NODE_CITATION_FORMATTERS = {
+    'section': lambda content: f"Section {content.get('section_number', '')}, {content.get('act', '')}",
+    'clause': lambda content: f"{content.get('parent_section', '')}, Clause {content.get('label', '')}",
+    'definition': lambda content: f"Definition of '{content.get('term', '')}' in {content.get('defined_in', '')}",
+    'right': lambda content: f"Right granted by {content.get('granted_by', '')}",
+}
+
+# Lazily built lookup indices on GraphTraversal, dropped by _create_indices()
+INDEX_ATTRIBUTES = (
+    'section_by_id', 'section_by_number', 'sections_by_chapter', 'clause_by_id', 'clauses_by_section',
+    'definition_by_term', 'right_by_id', 'rights_by_type', 'rights_by_granting_section',
+    'definitions_by_section', 'edges_from', 'edges_to', 'node_by_id',
+    'search_documents', 'postings', 'vocabulary', 'citation_by_id', 'scenario_results',
+    'node_ids', 'node_index', 'adjacency', 'phrase_index'
+)
+
+# Knowledge graph shards, parsed from JSON on first access
+SHARD_ATTRIBUTES = (
+    'sections', 'clauses', 'definitions', 'rights',
+    'contains_edges', 'references_edges', 'defines_edges'
+)
+
+# Indices filled per query rather than built from the graph, so never persisted
+RUNTIME_INDEX_ATTRIBUTES = ('citation_by_id', 'scenario_results')
+
+# Bump when the shape of a persisted index changes so stale index caches are rebuilt
+INDEX_CACHE_VERSION = 1
+
+# Word tokens used by the keyword search index
+WORD_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Scenario routing keywords in priority order; matched as substrings of the lowercased query
+SCENARIO_KEYWORD_PATTERNS = (
+    ('defective_goods', re.compile(r"defective|faulty|damaged|broken|defect")),
+    ('misleading_ad', re.compile(r"misleading|false|advertisement|advertise")),
+    ('overcharging', re.compile(r"overcharg|excess|extra|price|refund")),
+    ('service_deficiency', re.compile(r"service|deficiency|poor service|bad service")),
+)
+
+
+class ScenarioSpec(NamedTuple):
+    """Provisions retrieved for a consumer scenario, in output order"""
+    definitions: Tuple[str, ...] = ()  # Definition terms
+    sections: Tuple[str, ...] = ()  # Section numbers
+    rights_limit: int = 0  # Consider the first N consumer rights
+    right_keywords: Tuple[str, ...] = ()  # Keep rights mentioning any of these, if given
+
+
+# Scenario routes from SCENARIO_KEYWORD_PATTERNS, plus the generic fallback
+SCENARIO_SPECS = {
+    # Defect definition, complaint filing and remedies, and quality/redressal rights
+    'defective_goods': ScenarioSpec(
+        definitions=('defect',),
+        sections=('35', '39'),
+        rights_limit=2,
+        right_keywords=('quality', 'defect', 'redressal')
+    ),
+    # Advertisement definitions, CCPA powers (18), penalties (21) and complaint filing
+    'misleading_ad': ScenarioSpec(
+        definitions=('misleading advertisement', 'advertisement'),
+        sections=('18', '21', '35')
+    ),
+    'overcharging': ScenarioSpec(sections=('35', '39')),
+    'service_deficiency': ScenarioSpec(definitions=('deficiency',), sections=('35', '39')),
+    # Consumer-actionable sections over institutional ones: complaints, remedies, definitions
+    'generic': ScenarioSpec(sections=('35', '39', '2'), rights_limit=2),
+}
 
 
 @dataclass
 class GraphNode:
     """Represents a node in the knowledge graph"""
+    __slots__ = ('node_id', 'node_type', 'content')
+    
     node_id: str
     node_type: str  # section, clause, definition, right
     content: Dict[str, Any]
     
     def get_text(self) -> str:
         """Get the main text content of the node"""
-        if self.node_type == 'section':
-            return self.content.get('text', '')
-        elif self.node_type == 'clause':
-            return self.content.get('text', '')
-        elif self.node_type == 'definition':
-            return self.content.get('definition', '')
-        elif self.node_type == 'right':
-            return self.content.get('description', '')
-        return ''
+        text_field = NODE_TEXT_FIELDS.get(self.node_type)
+        if text_field is None:
+            return ''
+        return self.content.get(text_field, '')
     
     def get_citation(self) -> str:
         """Get formatted citation for this node"""
-        if self.node_type == 'section':
-            section_num = self.content.get('section_number', '')
-            act = self.content.get('act', '')
-            return f"Section {section_num}, {act}"
-        elif self.node_type == 'clause':
-            parent = self.content.get('parent_section', '')
-            label = self.content.get('label', '')
-            return f"{parent}, Clause {label}"
-        elif self.node_type == 'definition':
-            term = self.content.get('term', '')
-            defined_in = self.content.get('defined_in', '')
-            return f"Definition of '{term}' in {defined_in}"
-        elif self.node_type == 'right':
-            granted_by = self.content.get('granted_by', '')
-            return f"Right granted by {granted_by}"
-        return self.node_id
+        formatter = NODE_CITATION_FORMATTERS.get(self.node_type)
+        if formatter is None:
+            return self.node_id
+        return formatter(self.content)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GraphEdge:
     """Represents an edge in the knowledge graph"""
     from_node: str
@@ -67,7 +145,7 @@ class GraphEdge:
     context: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GraphContext:
     """Context retrieved from knowledge graph traversal"""
     nodes: List[GraphNode]
@@ -75,6 +153,11 @@ class GraphContext:
     citations: List[str]
     confidence: float
     traversal_path: List[str]
+    version: int = 0  # Bumped on mutation so downstream caches can invalidate
+    
+    def mark_modified(self):
+        """Record that nodes or edges were changed after construction"""
+        self.version += 1
     
     def get_primary_nodes(self) -> List[GraphNode]:
         """Get nodes that directly match the query"""
@@ -89,35 +172,116 @@ class GraphContext:
 class GraphTraversal:
     """Traverse knowledge graph to retrieve relevant legal provisions."""
     
-    def __init__(self, knowledge_graph_path: str = "knowledge_graph"):
+    def __init__(self, knowledge_graph_path: str = "knowledge_graph", cache_size: int = 512,
+                 index_cache_path: Optional[str] = None):
         """
         Initialize the graph traversal engine.
         
         Args:
             knowledge_graph_path: Path to the knowledge graph data directory
+            cache_size: Maximum number of retrievals to cache (0 disables caching)
+            index_cache_path: Pickle file persisting the parsed graph and its lookup
+                indices across processes (None disables it)
         """
         self.kg_path = Path(knowledge_graph_path)
-        self._load_knowledge_graph()
+        
+        # LRU cache of retrieval results keyed by the intent fields the handlers read
+        self.cache_size = cache_size
+        self._retrieval_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        self.index_cache_path = Path(index_cache_path) if index_cache_path else None
+        if self.index_cache_path is not None and not self._load_index_cache():
+            self._save_index_cache()
     
-    def _load_knowledge_graph(self):
-        """Load knowledge graph data from JSON files."""
+    def _load_index_cache(self) -> bool:
+        """
+        Restore the graph and its indices from the index cache.
+        
+        Returns:
+            True if the cache was newer than every knowledge graph JSON file and
+            was restored, False if it is missing, stale or unreadable
+        """
         try:
-            # Load nodes
-            self.sections = self._load_json_file("nodes/sections.data.json")
-            self.clauses = self._load_json_file("nodes/clauses.data.json")
-            self.definitions = self._load_json_file("nodes/definitions.data.json")
-            self.rights = self._load_json_file("nodes/rights.data.json")
-            
-            # Load edges
-            self.contains_edges = self._load_json_file("edges/contains.data.json")
-            self.references_edges = self._load_json_file("edges/references.data.json")
-            self.defines_edges = self._load_json_file("edges/defines.data.json")
-            
-            # Create lookup indices
-            self._create_indices()
-            
-        except Exception as e:
-            raise RuntimeError(f"Failed to load knowledge graph: {e}")
+            cache_mtime = self.index_cache_path.stat().st_mtime
+            if any(path.stat().st_mtime >= cache_mtime for path in self.kg_path.rglob("*.json")):
+                return False
+            with open(self.index_cache_path, 'rb') as f:
+                state = pickle.load(f)
+        except Exception:
+            return False
+        
+        if state.get('version') != INDEX_CACHE_VERSION or state.get('kg_path') != str(self.kg_path):
+            return False
+        
+        self.__dict__.update(state['attributes'])
+        return True
+    
+    def _save_index_cache(self):
+        """Build the graph indices and persist them to the index cache, if writable."""
+        names = SHARD_ATTRIBUTES + tuple(
+            name for name in INDEX_ATTRIBUTES if name not in RUNTIME_INDEX_ATTRIBUTES
+        )
+        state = {
+            'version': INDEX_CACHE_VERSION,
+            'kg_path': str(self.kg_path),
+            'attributes': {name: getattr(self, name) for name in names}
+        }
+        try:
+            # Write a temporary file and rename it over the cache, so a concurrent reader
+            # (e.g. another worker process) never loads a half-written pickle
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.index_cache_path.parent, prefix=self.index_cache_path.name + '.', suffix='.tmp'
+            )
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, self.index_cache_path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError:
+            # A read-only deployment still works, just without the persisted indices
+            pass
+    
+    # Knowledge graph shards are parsed on first access, so a query only pays for the
+    # partitions it touches. Assigning a shard replaces it; call _create_indices()
+    # afterwards so the lookup indices are rebuilt from the new data.
+    
+    @cached_property
+    def sections(self) -> List[Dict]:
+        """Section nodes"""
+        return self._load_json_file("nodes/sections.data.json")
+    
+    @cached_property
+    def clauses(self) -> List[Dict]:
+        """Clause nodes"""
+        return self._load_json_file("nodes/clauses.data.json")
+    
+    @cached_property
+    def definitions(self) -> List[Dict]:
+        """Definition nodes"""
+        return self._load_json_file("nodes/definitions.data.json")
+    
+    @cached_property
+    def rights(self) -> List[Dict]:
+        """Right nodes"""
+        return self._load_json_file("nodes/rights.data.json")
+    
+    @cached_property
+    def contains_edges(self) -> List[Dict]:
+        """Contains edges (parent -> child)"""
+        return self._load_json_file("edges/contains.data.json")
+    
+    @cached_property
+    def references_edges(self) -> List[Dict]:
+        """Cross-reference edges between provisions"""
+        return self._load_json_file("edges/references.data.json")
+    
+    @cached_property
+    def defines_edges(self) -> List[Dict]:
+        """Defines edges (section -> definition)"""
+        return self._load_json_file("edges/defines.data.json")
     
     def _load_json_file(self, relative_path: str) -> List[Dict]:
         """Load JSON data from file."""
@@ -125,48 +289,248 @@ class GraphTraversal:
         if not file_path.exists():
             return []
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        try:
+            if ORJSON_AVAILABLE:
+                # orjson parses UTF-8 bytes natively and builds the same lists and dicts
+                return orjson.loads(file_path.read_bytes())
+            
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            raise RuntimeError(f"Failed to load knowledge graph: {e}")
     
     def _create_indices(self):
-        """Create lookup indices for efficient retrieval."""
-        # Section lookup by ID and number
-        self.section_by_id = {s['section_id']: s for s in self.sections}
-        self.section_by_number = {s['section_number']: s for s in self.sections}
-        
-        # Clause lookup by ID and parent
-        self.clause_by_id = {c['clause_id']: c for c in self.clauses}
-        self.clauses_by_section = {}
+        """Drop built lookup indices so they are rebuilt from the current graph data."""
+        for name in INDEX_ATTRIBUTES:
+            self.__dict__.pop(name, None)
+        self.clear_cache()
+    
+    def clear_cache(self):
+        """Drop all cached retrieval results"""
+        with self._cache_lock:
+            self._retrieval_cache.clear()
+    
+    # Lookup indices are built on first access from the shards they cover
+    
+    @staticmethod
+    def _intern_fields(records: List[Dict], *fields: str):
+        """Intern ID strings in place so index keys and node IDs share one object."""
+        for record in records:
+            for field_name in fields:
+                value = record.get(field_name)
+                if type(value) is str:
+                    record[field_name] = sys.intern(value)
+    
+    @cached_property
+    def section_by_id(self) -> Dict[str, Dict]:
+        """Section lookup by ID"""
+        self._intern_fields(self.sections, 'section_id')
+        return {s['section_id']: s for s in self.sections}
+    
+    @cached_property
+    def section_by_number(self) -> Dict[str, Dict]:
+        """Section lookup by number"""
+        return {s['section_number']: s for s in self.sections}
+    
+    @cached_property
+    def sections_by_chapter(self) -> Dict[str, List[Dict]]:
+        """Sections grouped by chapter, in section order"""
+        sections_by_chapter = {}
+        for s in self.sections:
+            sections_by_chapter.setdefault(s.get('chapter'), []).append(s)
+        return sections_by_chapter
+    
+    @cached_property
+    def clause_by_id(self) -> Dict[str, Dict]:
+        """Clause lookup by ID"""
+        self._intern_fields(self.clauses, 'clause_id', 'parent_section')
+        return {c['clause_id']: c for c in self.clauses}
+    
+    @cached_property
+    def clauses_by_section(self) -> Dict[str, List[Dict]]:
+        """Clause lookup by parent section"""
+        self._intern_fields(self.clauses, 'clause_id', 'parent_section')
+        clauses_by_section = {}
         for clause in self.clauses:
             parent = clause['parent_section']
-            if parent not in self.clauses_by_section:
-                self.clauses_by_section[parent] = []
-            self.clauses_by_section[parent].append(clause)
-        
-        # Definition lookup by term
-        self.definition_by_term = {d['term'].lower(): d for d in self.definitions}
-        
-        # Rights lookup by ID and type
-        self.right_by_id = {r['right_id']: r for r in self.rights}
-        self.rights_by_type = {}
+            if parent not in clauses_by_section:
+                clauses_by_section[parent] = []
+            clauses_by_section[parent].append(clause)
+        return clauses_by_section
+    
+    @cached_property
+    def definition_by_term(self) -> Dict[str, Dict]:
+        """Definition lookup by lowercased term"""
+        return {sys.intern(d['term'].lower()): d for d in self.definitions}
+    
+    @cached_property
+    def right_by_id(self) -> Dict[str, Dict]:
+        """Right lookup by ID"""
+        self._intern_fields(self.rights, 'right_id')
+        return {r['right_id']: r for r in self.rights}
+    
+    @cached_property
+    def rights_by_type(self) -> Dict[str, List[Dict]]:
+        """Right lookup by right type"""
+        rights_by_type = {}
         for right in self.rights:
             right_type = right.get('right_type', 'unknown')
-            if right_type not in self.rights_by_type:
-                self.rights_by_type[right_type] = []
-            self.rights_by_type[right_type].append(right)
-        
-        # Edge lookup by source
-        self.edges_from = {}
-        all_edges = (
-            [(e['parent'], e['child'], 'contains') for e in self.contains_edges] +
-            [(e['from'], e['to'], e['reference_type']) for e in self.references_edges] +
-            [(e['source'], e['target'], 'defines') for e in self.defines_edges]
+            if right_type not in rights_by_type:
+                rights_by_type[right_type] = []
+            rights_by_type[right_type].append(right)
+        return rights_by_type
+    
+    @cached_property
+    def rights_by_granting_section(self) -> Dict[str, List[Dict]]:
+        """Reverse lookup for the granted_by field"""
+        rights_by_granting_section = {}
+        for right in self.rights:
+            granted_by = right.get('granted_by')
+            if granted_by:
+                if granted_by not in rights_by_granting_section:
+                    rights_by_granting_section[granted_by] = []
+                rights_by_granting_section[granted_by].append(right)
+        return rights_by_granting_section
+    
+    @cached_property
+    def definitions_by_section(self) -> Dict[str, List[Dict]]:
+        """Reverse lookup for the defined_in field"""
+        definitions_by_section = {}
+        for definition in self.definitions:
+            defined_in = definition.get('defined_in')
+            if defined_in:
+                if defined_in not in definitions_by_section:
+                    definitions_by_section[defined_in] = []
+                definitions_by_section[defined_in].append(definition)
+        return definitions_by_section
+    
+    def _all_edges(self) -> Iterator[Tuple[str, str, str]]:
+        """Iterate all edges once as (from_node, to_node, relation) triples."""
+        intern = sys.intern
+        return chain(
+            ((intern(e['parent']), intern(e['child']), 'contains') for e in self.contains_edges),
+            ((intern(e['from']), intern(e['to']), intern(e['reference_type'])) for e in self.references_edges),
+            ((intern(e['source']), intern(e['target']), 'defines') for e in self.defines_edges)
         )
+    
+    @cached_property
+    def edges_from(self) -> Dict[str, List[Tuple[str, str]]]:
+        """Edge lookup by source as (to_node, relation) pairs"""
+        edges_from = {}
+        for from_node, to_node, relation in self._all_edges():
+            edges_from.setdefault(from_node, []).append((to_node, relation))
+        return edges_from
+    
+    @cached_property
+    def edges_to(self) -> Dict[str, List[Tuple[str, str]]]:
+        """Edge lookup by target as (from_node, relation) pairs"""
+        edges_to = {}
+        for from_node, to_node, relation in self._all_edges():
+            edges_to.setdefault(to_node, []).append((from_node, relation))
+        return edges_to
+    
+    @cached_property
+    def node_by_id(self) -> Dict[str, Tuple[str, Dict]]:
+        """
+        Node lookup by ID across all node types as (node_type, content).
         
-        for from_node, to_node, relation in all_edges:
-            if from_node not in self.edges_from:
-                self.edges_from[from_node] = []
-            self.edges_from[from_node].append((to_node, relation))
+        On an ID clash sections win over clauses, clauses over rights and
+        rights over definitions.
+        """
+        node_by_id = {}
+        for node_type, nodes_by_id in (
+            ('section', self.section_by_id),
+            ('clause', self.clause_by_id),
+            ('right', self.right_by_id),
+            ('definition', {f"DEF_{term}": d for term, d in self.definition_by_term.items()})
+        ):
+            for node_id, content in nodes_by_id.items():
+                if node_id not in node_by_id:
+                    node_by_id[node_id] = (node_type, content)
+        return node_by_id
+    
+    @cached_property
+    def node_ids(self) -> List[str]:
+        """Every node and edge endpoint ID, positioned by its integer ID"""
+        return list(dict.fromkeys(chain(
+            self.node_by_id,
+            (node_id for from_node, to_node, _ in self._all_edges() for node_id in (from_node, to_node))
+        )))
+    
+    @cached_property
+    def node_index(self) -> Dict[str, int]:
+        """Integer ID by node ID"""
+        return {node_id: i for i, node_id in enumerate(self.node_ids)}
+    
+    @cached_property
+    def adjacency(self) -> List[List[Tuple[int, str]]]:
+        """Outgoing edges by integer source ID as (integer target ID, relation) pairs"""
+        node_index = self.node_index
+        adjacency = [[] for _ in self.node_ids]
+        for from_node, to_node, relation in self._all_edges():
+            adjacency[node_index[from_node]].append((node_index[to_node], relation))
+        return adjacency
+    
+    @cached_property
+    def search_documents(self) -> List[Tuple[str, Dict, str]]:
+        """Keyword search documents in search order as (node_type, content, lowercased text)"""
+        return [
+            (node_type, content, (content.get(text_field, '') or '').lower())
+            for node_type, text_field, contents in (
+                ('section', 'text', self.sections),
+                ('definition', 'definition', self.definitions),
+                ('right', 'description', self.rights)
+            )
+            for content in contents
+        ]
+    
+    @cached_property
+    def postings(self) -> Dict[str, List[int]]:
+        """Inverted index from lowercased word token to the search documents containing it"""
+        postings = {}
+        for doc_index, (_, _, text_lower) in enumerate(self.search_documents):
+            for token in set(WORD_TOKEN_PATTERN.findall(text_lower)):
+                if token not in postings:
+                    postings[token] = []
+                postings[token].append(doc_index)
+        return postings
+    
+    @cached_property
+    def vocabulary(self) -> str:
+        """Newline-delimited index tokens, so substring lookups run as C-level str.find scans"""
+        return "\n" + "\n".join(self.postings) + "\n"
+    
+    @cached_property
+    def phrase_index(self) -> Dict[str, FrozenSet[int]]:
+        """Search documents containing each definition term, as the common legal search phrases"""
+        search_documents = self.search_documents
+        return {
+            term: frozenset(
+                doc_index for doc_index, (_, _, text_lower) in enumerate(search_documents)
+                if term in text_lower
+            )
+            for term in self.definition_by_term
+        }
+    
+    @cached_property
+    def citation_by_id(self) -> Dict[str, Tuple[str, Dict, str]]:
+        """Formatted citations by node ID as (node_type, content, citation), filled on first use"""
+        return {}
+    
+    @cached_property
+    def scenario_results(self) -> Dict[str, Tuple[List[GraphNode], List[GraphEdge], List[str]]]:
+        """Scenario handler results by scenario route, filled on first use"""
+        return {}
+    
+    def _get_citation(self, node: GraphNode) -> str:
+        """Get a node's citation, reusing the one formatted for the same node before."""
+        entry = self.citation_by_id.get(node.node_id)
+        if entry is not None and entry[0] == node.node_type and entry[1] is node.content:
+            return entry[2]
+        
+        citation = node.get_citation()
+        self.citation_by_id[node.node_id] = (node.node_type, node.content, citation)
+        return citation
     
     def retrieve_context(self, intent: QueryIntent) -> GraphContext:
         """
@@ -178,6 +542,47 @@ class GraphTraversal:
         Returns:
             GraphContext with relevant nodes, edges, and citations
         """
+        if self.cache_size > 0:
+            # Handlers read only these intent fields; scenario queries are routed by keyword
+            scenario = None
+            if intent.intent_type == IntentType.SCENARIO_ANALYSIS:
+                scenario = self._match_scenario(intent.original_query.lower())
+            cache_key = (
+                intent.intent_type,
+                tuple(intent.legal_terms),
+                tuple(intent.section_numbers),
+                scenario
+            )
+            
+            with self._cache_lock:
+                cached = self._retrieval_cache.get(cache_key)
+                if cached is not None:
+                    self._retrieval_cache.move_to_end(cache_key)
+            if cached is None:
+                cached = self._retrieve(intent)
+                with self._cache_lock:
+                    self._retrieval_cache[cache_key] = cached
+                    if len(self._retrieval_cache) > self.cache_size:
+                        self._retrieval_cache.popitem(last=False)
+        else:
+            cached = self._retrieve(intent)
+        
+        nodes, edges, traversal_path, citations = cached
+        
+        # Calculate confidence based on retrieval success
+        confidence = self._calculate_confidence(intent, nodes, edges)
+        
+        # Fresh lists so callers can edit the context without touching the cache
+        return GraphContext(
+            nodes=list(nodes),
+            edges=list(edges),
+            citations=list(citations),
+            confidence=confidence,
+            traversal_path=list(traversal_path)
+        )
+    
+    def _retrieve(self, intent: QueryIntent) -> Tuple[List[GraphNode], List[GraphEdge], List[str], List[str]]:
+        """Run the intent handler and collect citations as (nodes, edges, traversal_path, citations)."""
         nodes = []
         edges = []
         traversal_path = []
@@ -191,19 +596,10 @@ class GraphTraversal:
         elif intent.intent_type == IntentType.SCENARIO_ANALYSIS:
             nodes, edges, traversal_path = self._handle_scenario_analysis(intent)
         
-        # Calculate confidence based on retrieval success
-        confidence = self._calculate_confidence(intent, nodes, edges)
+        # Generate citations, formatting each graph node's citation only once
+        citations = [self._get_citation(node) for node in nodes]
         
-        # Generate citations
-        citations = [node.get_citation() for node in nodes]
-        
-        return GraphContext(
-            nodes=nodes,
-            edges=edges,
-            citations=citations,
-            confidence=confidence,
-            traversal_path=traversal_path
-        )
+        return nodes, edges, traversal_path, citations
     
     def _handle_definition_lookup(self, intent: QueryIntent) -> Tuple[List[GraphNode], List[GraphEdge], List[str]]:
         """Handle definition lookup queries."""
@@ -329,212 +725,44 @@ class GraphTraversal:
     
     def _handle_scenario_analysis(self, intent: QueryIntent) -> Tuple[List[GraphNode], List[GraphEdge], List[str]]:
         """Handle scenario analysis queries with scenario-specific routing."""
-        nodes = []
-        edges = []
-        traversal_path = []
-        
         # Check for specific consumer scenarios and route to appropriate provisions
-        query_lower = intent.original_query.lower()
-        
-        # Defective goods scenario
-        if any(term in query_lower for term in ['defective', 'faulty', 'damaged', 'broken', 'defect']):
-            nodes, edges, traversal_path = self._handle_defective_goods_scenario(intent)
-        
-        # Misleading advertisement scenario
-        elif any(term in query_lower for term in ['misleading', 'false', 'advertisement', 'advertise']):
-            nodes, edges, traversal_path = self._handle_misleading_ad_scenario(intent)
-        
-        # Overcharging scenario
-        elif any(term in query_lower for term in ['overcharg', 'excess', 'extra', 'price', 'refund']):
-            nodes, edges, traversal_path = self._handle_overcharging_scenario(intent)
-        
-        # Service deficiency scenario
-        elif any(term in query_lower for term in ['service', 'deficiency', 'poor service', 'bad service']):
-            nodes, edges, traversal_path = self._handle_service_deficiency_scenario(intent)
+        scenario = self._match_scenario(intent.original_query.lower())
         
-        # Generic scenario - fallback to keyword search but prioritize consumer-actionable sections
-        else:
-            nodes, edges, traversal_path = self._handle_generic_scenario(intent)
+        # Scenarios are built from the graph alone, never the intent, so each is built once per graph
+        results = self.scenario_results.get(scenario)
+        if results is None:
+            results = self._build_scenario(SCENARIO_SPECS[scenario])
+            self.scenario_results[scenario] = results
         
-        return nodes, edges, traversal_path
+        nodes, edges, traversal_path = results
+        return list(nodes), list(edges), list(traversal_path)
     
-    def _handle_defective_goods_scenario(self, intent: QueryIntent) -> Tuple[List[GraphNode], List[GraphEdge], List[str]]:
-        """Handle defective goods scenarios with consumer-actionable guidance."""
-        nodes = []
-        edges = []
-        traversal_path = []
-        
-        # 1. Add definition of "defect" from Section 2
-        if 'defect' in self.definition_by_term:
-            definition = self.definition_by_term['defect']
-            def_node = GraphNode(
-                node_id="DEF_defect",
-                node_type='definition',
-                content=definition
-            )
-            nodes.append(def_node)
-            traversal_path.append(def_node.node_id)
-        
-        # 2. Add Section 35 - How to file complaint
-        if '35' in self.section_by_number:
-            section_35 = self.section_by_number['35']
-            section_node = GraphNode(
-                node_id=section_35['section_id'],
-                node_type='section',
-                content=section_35
-            )
-            nodes.append(section_node)
-            traversal_path.append(section_node.node_id)
-        
-        # 3. Add Section 39 - Remedies available
-        if '39' in self.section_by_number:
-            section_39 = self.section_by_number['39']
-            remedy_node = GraphNode(
-                node_id=section_39['section_id'],
-                node_type='section',
-                content=section_39
-            )
-            nodes.append(remedy_node)
-            traversal_path.append(remedy_node.node_id)
-        
-        # 4. Add consumer rights related to defective goods
-        consumer_rights = self.rights_by_type.get('consumer_right', [])
-        for right in consumer_rights[:2]:  # Limit to top 2 relevant rights
-            if any(term in right.get('description', '').lower() for term in ['quality', 'defect', 'redressal']):
-                right_node = GraphNode(
-                    node_id=right['right_id'],
-                    node_type='right',
-                    content=right
-                )
-                nodes.append(right_node)
-                traversal_path.append(right_node.node_id)
-        
-        return nodes, edges, traversal_path
-    
-    def _handle_misleading_ad_scenario(self, intent: QueryIntent) -> Tuple[List[GraphNode], List[GraphEdge], List[str]]:
-        """Handle misleading advertisement scenarios."""
-        nodes = []
-        edges = []
-        traversal_path = []
-        
-        # 1. Add definition of misleading advertisement (most important)
-        if 'misleading advertisement' in self.definition_by_term:
-            definition = self.definition_by_term['misleading advertisement']
-            def_node = GraphNode(
-                node_id="DEF_misleading_advertisement",
-                node_type='definition',
-                content=definition
-            )
-            nodes.append(def_node)
-            traversal_path.append(def_node.node_id)
-        
-        # 2. Add definition of advertisement (general)
-        if 'advertisement' in self.definition_by_term:
-            definition = self.definition_by_term['advertisement']
-            def_node = GraphNode(
-                node_id="DEF_advertisement",
-                node_type='definition',
-                content=definition
-            )
-            nodes.append(def_node)
-            traversal_path.append(def_node.node_id)
-        
-        # 3. Add Section 18 - CCPA powers and functions
-        if '18' in self.section_by_number:
-            section_18 = self.section_by_number['18']
-            section_node = GraphNode(
-                node_id=section_18['section_id'],
-                node_type='section',
-                content=section_18
-            )
-            nodes.append(section_node)
-            traversal_path.append(section_node.node_id)
-        
-        # 4. Add Section 21 - Penalties for misleading advertisements
-        if '21' in self.section_by_number:
-            section_21 = self.section_by_number['21']
-            section_node = GraphNode(
-                node_id=section_21['section_id'],
-                node_type='section',
-                content=section_21
-            )
-            nodes.append(section_node)
-            traversal_path.append(section_node.node_id)
-        
-        # 5. Add Section 35 - How to file complaint (secondary)
-        if '35' in self.section_by_number:
-            section_35 = self.section_by_number['35']
-            section_node = GraphNode(
-                node_id=section_35['section_id'],
-                node_type='section',
-                content=section_35
-            )
-            nodes.append(section_node)
-            traversal_path.append(section_node.node_id)
-        
-        return nodes, edges, traversal_path
-    
-    def _handle_overcharging_scenario(self, intent: QueryIntent) -> Tuple[List[GraphNode], List[GraphEdge], List[str]]:
-        """Handle overcharging scenarios."""
-        nodes = []
-        edges = []
-        traversal_path = []
-        
-        # Add complaint filing and remedy sections
-        for section_num in ['35', '39']:
-            if section_num in self.section_by_number:
-                section = self.section_by_number[section_num]
-                section_node = GraphNode(
-                    node_id=section['section_id'],
-                    node_type='section',
-                    content=section
-                )
-                nodes.append(section_node)
-                traversal_path.append(section_node.node_id)
-        
-        return nodes, edges, traversal_path
+    def _match_scenario(self, query_lower: str) -> str:
+        """Get the first scenario whose keywords appear in the query, or 'generic'."""
+        for scenario, pattern in SCENARIO_KEYWORD_PATTERNS:
+            if pattern.search(query_lower):
+                return scenario
+        return 'generic'
     
-    def _handle_service_deficiency_scenario(self, intent: QueryIntent) -> Tuple[List[GraphNode], List[GraphEdge], List[str]]:
-        """Handle service deficiency scenarios."""
+    def _build_scenario(self, spec: ScenarioSpec) -> Tuple[List[GraphNode], List[GraphEdge], List[str]]:
+        """Collect a scenario's definitions, sections and consumer rights from its spec."""
         nodes = []
         edges = []
         traversal_path = []
         
-        # Add definition of deficiency if available
-        if 'deficiency' in self.definition_by_term:
-            definition = self.definition_by_term['deficiency']
-            def_node = GraphNode(
-                node_id="DEF_deficiency",
-                node_type='definition',
-                content=definition
-            )
-            nodes.append(def_node)
-            traversal_path.append(def_node.node_id)
-        
-        # Add complaint filing and remedy sections
-        for section_num in ['35', '39']:
-            if section_num in self.section_by_number:
-                section = self.section_by_number[section_num]
-                section_node = GraphNode(
-                    node_id=section['section_id'],
-                    node_type='section',
-                    content=section
+        # 1. Key definitions for the scenario
+        for term in spec.definitions:
+            if term in self.definition_by_term:
+                def_node = GraphNode(
+                    node_id=f"DEF_{term.replace(' ', '_')}",
+                    node_type='definition',
+                    content=self.definition_by_term[term]
                 )
-                nodes.append(section_node)
-                traversal_path.append(section_node.node_id)
-        
-        return nodes, edges, traversal_path
-    
-    def _handle_generic_scenario(self, intent: QueryIntent) -> Tuple[List[GraphNode], List[GraphEdge], List[str]]:
-        """Handle generic scenarios with consumer-focused sections."""
-        nodes = []
-        edges = []
-        traversal_path = []
-        
-        # Prioritize consumer-actionable sections over institutional ones
-        consumer_actionable_sections = ['35', '39', '2']  # Complaint filing, remedies, definitions
+                nodes.append(def_node)
+                traversal_path.append(def_node.node_id)
         
-        for section_num in consumer_actionable_sections:
+        # 2. Sections to act on, e.g. complaint filing (35) and remedies (39)
+        for section_num in spec.sections:
             if section_num in self.section_by_number:
                 section = self.section_by_number[section_num]
                 section_node = GraphNode(
@@ -545,9 +773,12 @@ class GraphTraversal:
                 nodes.append(section_node)
                 traversal_path.append(section_node.node_id)
         
-        # Add relevant consumer rights
+        # 3. Relevant consumer rights among the first few
         consumer_rights = self.rights_by_type.get('consumer_right', [])
-        for right in consumer_rights[:2]:  # Limit to top 2
+        for right in consumer_rights[:spec.rights_limit]:
+            description = right.get('description', '').lower()
+            if spec.right_keywords and not any(keyword in description for keyword in spec.right_keywords):
+                continue
             right_node = GraphNode(
                 node_id=right['right_id'],
                 node_type='right',
@@ -563,30 +794,35 @@ class GraphTraversal:
         nodes = []
         edges = []
         traversal_path = []
-        scored_matches = []
-        
-        # Search in sections
-        for section in self.sections:
-            score = self._calculate_text_match_score(section.get('text', ''), terms)
-            if score > 0:
-                scored_matches.append((score, 'section', section))
         
-        # Search in definitions
-        for definition in self.definitions:
-            score = self._calculate_text_match_score(definition.get('definition', ''), terms)
-            if score > 0:
-                scored_matches.append((score, 'definition', definition))
+        # Lowercase and split each term once per search
+        term_words = []
+        for term in terms:
+            term_lower = term.lower()
+            term_words.append((term_lower, term_lower.split()))
+        
+        # Score only documents containing a query word, keeping the top 5 in a min-heap of
+        # (score, -doc_index) so documents earlier in search order (sections, definitions,
+        # rights) win ties
+        top_heap = []
+        word_documents = self._query_word_documents(term_words)
+        if word_documents is not None:
+            scored = self._score_documents(term_words, word_documents).items()
+        else:
+            scored = (
+                (doc_index, self._calculate_text_match_score(text_lower, term_words))
+                for doc_index, (_, _, text_lower) in enumerate(self.search_documents)
+            )
         
-        # Search in rights
-        for right in self.rights:
-            score = self._calculate_text_match_score(right.get('description', ''), terms)
+        for doc_index, score in scored:
             if score > 0:
-                scored_matches.append((score, 'right', right))
+                if len(top_heap) < 5:
+                    heapq.heappush(top_heap, (score, -doc_index))
+                elif (score, -doc_index) > top_heap[0]:
+                    heapq.heapreplace(top_heap, (score, -doc_index))
         
-        # Sort by score and take top matches
-        scored_matches.sort(key=lambda x: x[0], reverse=True)
-        
-        for score, node_type, content in scored_matches[:5]:  # Top 5 matches
+        for score, negative_index in sorted(top_heap, reverse=True):  # Top 5 matches
+            node_type, content, _ = self.search_documents[-negative_index]
             if node_type == 'section':
                 node_id = content['section_id']
             elif node_type == 'definition':
@@ -604,26 +840,109 @@ class GraphTraversal:
         
         return nodes, edges, traversal_path
     
-    def _calculate_text_match_score(self, text: str, terms: List[str]) -> float:
-        """Calculate relevance score for text against search terms."""
-        if not text or not terms:
+    def _word_documents(self, word: str) -> Set[int]:
+        """
+        Find the search documents whose text contains a word-character word.
+        
+        Such a word can only occur inside a single token of the text, so its
+        documents are the postings of every indexed token that contains it.
+        Those tokens are found by scanning the newline-delimited vocabulary
+        with str.find and widening each hit to its enclosing line.
+        """
+        vocabulary = self.vocabulary
+        documents = set()
+        position = vocabulary.find(word)
+        while position != -1:
+            token_start = vocabulary.rfind("\n", 0, position) + 1
+            token_end = vocabulary.find("\n", position)
+            documents.update(self.postings[vocabulary[token_start:token_end]])
+            position = vocabulary.find(word, token_end)
+        return documents
+    
+    def _query_word_documents(self, term_words: List[Tuple[str, List[str]]]
+                              ) -> Optional[Dict[str, Set[int]]]:
+        """
+        Find the search documents containing each word of the search terms.
+        
+        Terms are given as (lowercased term, words) pairs. A document scores
+        only if some word of some term occurs in its text.
+        
+        Returns:
+            Document indices by query word, or None if a term has no words or
+            non-word characters, in which case every document must be scanned
+        """
+        word_documents = {}
+        for _, words in term_words:
+            if not words or not all(WORD_TOKEN_PATTERN.fullmatch(word) for word in words):
+                return None
+            for word in words:
+                if word not in word_documents:
+                    word_documents[word] = self._word_documents(word)
+        
+        return word_documents
+    
+    def _score_documents(self, term_words: List[Tuple[str, List[str]]],
+                         word_documents: Dict[str, Set[int]]) -> Dict[int, float]:
+        """
+        Score every candidate document at once from the inverted index.
+        
+        Gives the same scores as _calculate_text_match_score, computed term by
+        term over the documents containing each word. A phrase can only occur
+        where all of its words do, so only those documents are checked for it,
+        by phrase_index membership for definition terms and by substring
+        search otherwise.
+        
+        Returns:
+            Score by document index for every document containing a query word
+        """
+        search_documents = self.search_documents
+        phrase_index = self.phrase_index
+        scores = {}
+        for term_lower, words in term_words:
+            phrase_documents = phrase_index.get(term_lower)
+            word_matches = {}
+            for word in words:
+                for doc_index in word_documents[word]:
+                    word_matches[doc_index] = word_matches.get(doc_index, 0) + 1
+            
+            word_count = len(words)
+            for doc_index, matches in word_matches.items():
+                # Exact phrase match gets higher score
+                if matches == word_count and (
+                    doc_index in phrase_documents if phrase_documents is not None
+                    else term_lower in search_documents[doc_index][2]
+                ):
+                    term_score = 2.0
+                else:
+                    term_score = matches / word_count
+                scores[doc_index] = scores.get(doc_index, 0.0) + term_score
+        
+        term_count = len(term_words)
+        return {doc_index: score / term_count for doc_index, score in scores.items()}
+    
+    def _calculate_text_match_score(self, text_lower: str, term_words: List[Tuple[str, List[str]]]) -> float:
+        """
+        Calculate relevance score for text against search terms.
+        
+        Args:
+            text_lower: Lowercased text to score
+            term_words: Search terms as (lowercased term, words) pairs
+        """
+        if not text_lower or not term_words:
             return 0.0
         
-        text_lower = text.lower()
         score = 0.0
         
-        for term in terms:
-            term_lower = term.lower()
+        for term_lower, words in term_words:
             # Exact phrase match gets higher score
             if term_lower in text_lower:
                 score += 2.0
             else:
                 # Individual word matches
-                words = term_lower.split()
                 word_matches = sum(1 for word in words if word in text_lower)
                 score += word_matches / len(words)
         
-        return score / len(terms)  # Normalize by number of terms
+        return score / len(term_words)  # Normalize by number of terms
     
     def traverse_relationships(self, start_node: str, 
                               relation_types: List[str],
@@ -639,68 +958,64 @@ class GraphTraversal:
         Returns:
             List of nodes found through traversal
         """
-        visited = set()
+        start = self.node_index.get(start_node)
+        if start is None:
+            return []
+        
+        node_ids = self.node_ids
+        adjacency = self.adjacency
+        visited = bytearray(len(node_ids))
         result_nodes = []
-        queue = [(start_node, 0)]  # (node_id, depth)
+        queue = deque([(start, 0)])  # (integer node ID, depth)
         
         while queue:
-            current_node, depth = queue.pop(0)
+            current, depth = queue.popleft()
             
-            if current_node in visited or depth > max_depth:
+            if visited[current] or depth > max_depth:
                 continue
             
-            visited.add(current_node)
+            visited[current] = 1
             
             # Add current node to results if it exists
-            node = self._get_node_by_id(current_node)
+            node = self._get_node_by_id(node_ids[current])
             if node:
                 result_nodes.append(node)
             
             # Find connected nodes
-            if current_node in self.edges_from:
-                for target_node, relation in self.edges_from[current_node]:
-                    if relation in relation_types and target_node not in visited:
-                        queue.append((target_node, depth + 1))
+            for target, relation in adjacency[current]:
+                if relation in relation_types and not visited[target]:
+                    queue.append((target, depth + 1))
         
         return result_nodes
     
+    def get_incoming(self, node_id: str, relation: Optional[str] = None) -> List[Tuple[str, str]]:
+        """
+        Get the edges pointing at a node.
+        
+        Args:
+            node_id: Target node ID
+            relation: Only return edges of this relation type, if given
+            
+        Returns:
+            List of (from_node, relation) pairs
+        """
+        incoming = self.edges_to.get(node_id, [])
+        if relation is None:
+            return list(incoming)
+        return [edge for edge in incoming if edge[1] == relation]
+    
     def _get_node_by_id(self, node_id: str) -> Optional[GraphNode]:
         """Get a node by its ID from any node type."""
-        # Check sections
-        if node_id in self.section_by_id:
-            return GraphNode(
-                node_id=node_id,
-                node_type='section',
-                content=self.section_by_id[node_id]
-            )
-        
-        # Check clauses
-        if node_id in self.clause_by_id:
-            return GraphNode(
-                node_id=node_id,
-                node_type='clause',
-                content=self.clause_by_id[node_id]
-            )
-        
-        # Check rights
-        if node_id in self.right_by_id:
-            return GraphNode(
-                node_id=node_id,
-                node_type='right',
-                content=self.right_by_id[node_id]
-            )
-        
-        # Check definitions (by reconstructing ID)
-        for term, definition in self.definition_by_term.items():
-            def_id = f"DEF_{term}"
-            if node_id == def_id:
-                return GraphNode(
-                    node_id=def_id,
-                    node_type='definition',
-                    content=definition
-                )
-        
-        return None
+        entry = self.node_by_id.get(node_id)
+        if entry is None:
+            return None
+        
+        node_type, content = entry
+        return GraphNode(
+            node_id=node_id,
+            node_type=node_type,
+            content=content
+        )
     
     def _calculate_confidence(self, intent: QueryIntent, nodes: List[GraphNode], edges: List[GraphEdge]) -> float:
         """Calculate confidence score based on retrieval success."""
@@ -734,12 +1049,12 @@ class GraphTraversal:
         
         if chapter_id:
             # Find other sections in the same chapter
-            related_sections = [
-                s for s in self.sections 
-                if s.get('chapter') == chapter_id and s['section_id'] != section_id
-            ]
+            related_sections = (
+                s for s in self.sections_by_chapter.get(chapter_id, ())
+                if s['section_id'] != section_id
+            )
             
-            for related in related_sections[:3]:  # Limit to 3 related sections
+            for related in islice(related_sections, 3):  # Limit to 3 related sections
                 node = GraphNode(
                     node_id=related['section_id'],
                     node_type='section',
@@ -10,14 +10,82 @@ The engine integrates:
 - ContextBuilder: Format retrieved data for LLM consumption
 """
 
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
-from query_engine.query_parser import QueryParser, QueryIntent
+from dataclasses import dataclass, replace
+from query_engine.query_parser import DATACLASS_SLOTS, QueryParser, QueryIntent, IntentType
 from query_engine.graph_traversal import GraphTraversal, GraphContext
 from query_engine.context_builder import ContextBuilder, LLMContext
 
+# Unknown section IDs quoted in each orphaned-reference warning
+UNKNOWN_REFERENCE_EXAMPLES = 5
 
-@dataclass
+# Section renderings cached per section in the knowledge graph
+RENDER_CACHE_RATIO = 0.1
+
+# Reasoning explanation, filled in by GraphRAGEngine.explain_reasoning
+EXPLANATION_TEMPLATE = (
+    "**Query Analysis:**\n"
+    "- Intent Type: {intent_type}\n"
+    "- Confidence: {intent_confidence:.2f}\n"
+    "- Legal Terms Found: {legal_terms}\n"
+    "- Section Numbers: {section_numbers}\n"
+    "\n**Knowledge Graph Traversal:**\n"
+    "- Nodes Retrieved: {nodes}\n"
+    "- Relationships Found: {edges}\n"
+    "- Traversal Path: {traversal_path}{truncated}\n"
+    "\n**Context Construction:**\n"
+    "- Primary Provisions: {primary_provisions}\n"
+    "- Related Provisions: {related_provisions}\n"
+    "- Definitions Included: {definitions}\n"
+    "- Citations Generated: {citations}\n"
+    "- Context Length: {context_length} characters\n"
+    "\n**Overall Assessment:**\n"
+    "- Final Confidence: {final_confidence:.2f}\n"
+    "- Complexity Level: {complexity}\n"
+    "- Requires Review: {requires_review}"
+)
+
+# Similar query suggestions by intent type
+INTENT_SUGGESTIONS = {
+    IntentType.DEFINITION_LOOKUP: (
+        "What does 'unfair trade practice' mean?",
+        "Define consumer rights under CPA 2019",
+        "What is the meaning of 'defective goods'?",
+        "Explain the term 'misleading advertisement'"
+    ),
+    IntentType.SECTION_RETRIEVAL: (
+        "Show me Section 2 of Consumer Protection Act",
+        "What does Section 18 say about consumer rights?",
+        "Find Section 35 about filing complaints",
+        "Get Section 21 about penalties"
+    ),
+    IntentType.RIGHTS_QUERY: (
+        "What are my rights as a consumer?",
+        "How can I file a complaint against unfair practices?",
+        "What compensation can I claim for defective products?",
+        "Where can I seek redressal for consumer disputes?"
+    ),
+    IntentType.SCENARIO_ANALYSIS: (
+        "I bought a defective product, what can I do?",
+        "The seller is refusing to refund, what are my options?",
+        "I saw a misleading advertisement, how to complain?",
+        "The service provider is charging extra, is this legal?"
+    )
+}
+
+# Suggestions offered after the intent-specific ones for every query
+GENERAL_SUGGESTIONS = (
+    "What is Consumer Protection Act 2019?",
+    "How to file a consumer complaint?",
+    "What are the different consumer commissions?"
+)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class GraphRAGResponse:
     """Complete response from GraphRAG engine"""
     query_intent: QueryIntent
@@ -42,27 +110,58 @@ class GraphRAGEngine:
     """Main GraphRAG reasoning engine that coordinates all components."""
     
     def __init__(self, knowledge_graph_path: str = "knowledge_graph", 
-                 max_context_length: int = 8000):
+                 max_context_length: int = 8000, cache_size: int = 256,
+                 n_workers: int = 1, index_cache_path: Optional[str] = None):
         """
         Initialize the GraphRAG engine.
         
         Args:
             knowledge_graph_path: Path to knowledge graph data
             max_context_length: Maximum context length for LLM
+            cache_size: Maximum number of entries in each pipeline cache: parsed
+                intents, retrievals, built contexts and responses (0 disables
+                them all, section renderings included)
+            n_workers: Threads process_queries runs a batch on (1 runs it serially)
+            index_cache_path: Pickle file persisting the graph indices across
+                processes (None disables it)
         """
-        self.query_parser = QueryParser()
-        self.graph_traversal = GraphTraversal(knowledge_graph_path)
-        self.context_builder = ContextBuilder(max_context_length)
+        self.query_parser = QueryParser(cache_size=cache_size)
+        self.graph_traversal = GraphTraversal(knowledge_graph_path, cache_size=cache_size,
+                                              index_cache_path=index_cache_path)
+        # Section renderings are bounded by the size of the graph instead
+        render_cache_size = 0
+        if cache_size > 0:
+            render_cache_size = max(1, int(RENDER_CACHE_RATIO * len(self.graph_traversal.sections)))
+        self.context_builder = ContextBuilder(max_context_length, cache_size=cache_size,
+                                              render_cache_size=render_cache_size)
         
-        # Performance tracking
+        # LRU cache of pipeline results by (stripped query, language, audience)
+        self.cache_size = cache_size
+        self._response_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        self.n_workers = n_workers
+        
+        # Performance tracking, updated under a lock by queries on any thread
         self.query_count = 0
         self.total_processing_time = 0.0
+        self._stats_lock = threading.Lock()
+    
+    def _record_query(self, processing_time: float):
+        """Add a processed query to the performance statistics."""
+        with self._stats_lock:
+            self.query_count += 1
+            self.total_processing_time += processing_time
     
     def process_query(self, query: str, language: str = "en", 
                      audience: str = "citizen") -> GraphRAGResponse:
         """
         Process a natural language query through the complete GraphRAG pipeline.
         
+        Responses are cached by the stripped query, language and audience.
+        Cached contexts are shared between responses and should be treated as
+        read-only.
+        
         Args:
             query: User's natural language query
             language: Query language (default: "en")
@@ -71,25 +170,42 @@ class GraphRAGEngine:
         Returns:
             GraphRAGResponse with complete processing results
         """
-        import time
         start_time = time.time()
         
         try:
-            # Step 1: Parse query intent
-            query_intent = self.query_parser.parse_query(query, language)
-            
-            # Step 2: Traverse knowledge graph
-            graph_context = self.graph_traversal.retrieve_context(query_intent)
-            
-            # Step 3: Build LLM context
-            llm_context = self.context_builder.build_context(graph_context, query_intent)
-            
-            # Step 4: Format for specific audience
-            llm_context = self.context_builder.format_for_audience(llm_context, audience)
+            cache_key = (query.strip(), language, audience)
+            cached = None
+            if self.cache_size > 0:
+                with self._cache_lock:
+                    cached = self._response_cache.get(cache_key)
+                    if cached is not None:
+                        self._response_cache.move_to_end(cache_key)
+            if cached is not None:
+                query_intent, graph_context, llm_context, complexity = cached
+                query_intent = replace(query_intent, original_query=query)
+            else:
+                # Step 1: Parse query intent
+                query_intent = self.query_parser.parse_query(query, language)
+                
+                # Step 2: Traverse knowledge graph
+                graph_context = self.graph_traversal.retrieve_context(query_intent)
+                
+                # Step 3: Build LLM context
+                llm_context = self.context_builder.build_context(graph_context, query_intent)
+                
+                # Step 4: Format for specific audience
+                llm_context = self.context_builder.format_for_audience(llm_context, audience)
+                
+                complexity = self.query_parser.get_query_complexity(query_intent)
+                
+                if self.cache_size > 0:
+                    with self._cache_lock:
+                        self._response_cache[cache_key] = (query_intent, graph_context, llm_context, complexity)
+                        if len(self._response_cache) > self.cache_size:
+                            self._response_cache.popitem(last=False)
             
             # Calculate processing metadata
             processing_time = time.time() - start_time
-            complexity = self.query_parser.get_query_complexity(query_intent)
             
             processing_metadata = {
                 'processing_time': processing_time,
@@ -103,8 +219,7 @@ class GraphRAGEngine:
             }
             
             # Update performance tracking
-            self.query_count += 1
-            self.total_processing_time += processing_time
+            self._record_query(processing_time)
             
             return GraphRAGResponse(
                 query_intent=query_intent,
@@ -135,7 +250,6 @@ class GraphRAGEngine:
             )
             
             # Create minimal error intent
-            from query_engine.query_parser import IntentType
             error_intent = QueryIntent(
                 intent_type=IntentType.SCENARIO_ANALYSIS,
                 entities=[],
@@ -161,6 +275,39 @@ class GraphRAGEngine:
                 processing_metadata=error_metadata
             )
     
+    def process_queries(self, queries: List[str], language: str = "en",
+                        audience: str = "citizen") -> List[GraphRAGResponse]:
+        """
+        Process a batch of queries, e.g. an FAQ widget or test run.
+        
+        Overlapping work is shared through the pipeline caches: repeated queries
+        are answered from the response cache, queries with the same intent fields
+        share one graph retrieval, and identical retrievals share one built context.
+        With n_workers > 1 the queries run on a thread pool that is shut down
+        before the batch returns.
+        
+        Args:
+            queries: User queries
+            language: Query language (default: "en")
+            audience: Target audience ("citizen", "lawyer", "judge")
+            
+        Returns:
+            GraphRAGResponse for each query, in input order
+        """
+        if self.n_workers > 1 and len(queries) > 1:
+            with ThreadPoolExecutor(max_workers=self.n_workers) as executor:
+                return list(executor.map(lambda query: self.process_query(query, language, audience), queries))
+        
+        return [self.process_query(query, language, audience) for query in queries]
+    
+    def clear_cache(self):
+        """Drop all cached responses, intents, retrievals and contexts, e.g. after reloading the knowledge graph"""
+        with self._cache_lock:
+            self._response_cache.clear()
+        self.query_parser.clear_cache()
+        self.graph_traversal.clear_cache()
+        self.context_builder.clear_cache()
+    
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get performance statistics for the engine."""
         avg_processing_time = (self.total_processing_time / self.query_count 
@@ -200,18 +347,22 @@ class GraphRAGEngine:
                 validation_results['warnings'].append("No rights loaded")
             
             # Check for orphaned references
-            section_ids = {s['section_id'] for s in self.graph_traversal.sections}
+            section_ids = self.graph_traversal.section_by_id
             
-            # Check references in edges
-            for edge in self.graph_traversal.references_edges:
-                if edge['from'] not in section_ids:
-                    validation_results['warnings'].append(
-                        f"Reference from unknown section: {edge['from']}"
-                    )
-                if edge['to'] not in section_ids:
-                    validation_results['warnings'].append(
-                        f"Reference to unknown section: {edge['to']}"
-                    )
+            # Check references in edges, with one summary warning per direction
+            references_edges = self.graph_traversal.references_edges
+            unknown_from = [edge['from'] for edge in references_edges if edge['from'] not in section_ids]
+            unknown_to = [edge['to'] for edge in references_edges if edge['to'] not in section_ids]
+            if unknown_from:
+                validation_results['warnings'].append(
+                    f"{len(unknown_from)} references from unknown sections, e.g. "
+                    f"{', '.join(unknown_from[:UNKNOWN_REFERENCE_EXAMPLES])}"
+                )
+            if unknown_to:
+                validation_results['warnings'].append(
+                    f"{len(unknown_to)} references to unknown sections, e.g. "
+                    f"{', '.join(unknown_to[:UNKNOWN_REFERENCE_EXAMPLES])}"
+                )
             
             # Collect stats
             validation_results['stats'] = {
@@ -240,41 +391,32 @@ class GraphRAGEngine:
         Returns:
             Human-readable explanation of the reasoning process
         """
-        explanation_parts = []
-        
-        # Query analysis
         intent = response.query_intent
-        explanation_parts.append(f"**Query Analysis:**")
-        explanation_parts.append(f"- Intent Type: {intent.intent_type.value}")
-        explanation_parts.append(f"- Confidence: {intent.confidence:.2f}")
-        explanation_parts.append(f"- Legal Terms Found: {', '.join(intent.legal_terms) if intent.legal_terms else 'None'}")
-        explanation_parts.append(f"- Section Numbers: {', '.join(intent.section_numbers) if intent.section_numbers else 'None'}")
-        
-        # Graph traversal
         graph_ctx = response.graph_context
-        explanation_parts.append(f"\n**Knowledge Graph Traversal:**")
-        explanation_parts.append(f"- Nodes Retrieved: {len(graph_ctx.nodes)}")
-        explanation_parts.append(f"- Relationships Found: {len(graph_ctx.edges)}")
-        explanation_parts.append(f"- Traversal Path: {' → '.join(graph_ctx.traversal_path[:5])}")
-        if len(graph_ctx.traversal_path) > 5:
-            explanation_parts.append("  (truncated)")
-        
-        # Context building
         llm_ctx = response.llm_context
-        explanation_parts.append(f"\n**Context Construction:**")
-        explanation_parts.append(f"- Primary Provisions: {len(llm_ctx.primary_provisions)}")
-        explanation_parts.append(f"- Related Provisions: {len(llm_ctx.related_provisions)}")
-        explanation_parts.append(f"- Definitions Included: {len(llm_ctx.definitions)}")
-        explanation_parts.append(f"- Citations Generated: {llm_ctx.get_citation_count()}")
-        explanation_parts.append(f"- Context Length: {llm_ctx.get_total_length()} characters")
-        
-        # Overall assessment
-        explanation_parts.append(f"\n**Overall Assessment:**")
-        explanation_parts.append(f"- Final Confidence: {response.get_confidence_score():.2f}")
-        explanation_parts.append(f"- Complexity Level: {response.get_complexity_level()}")
-        explanation_parts.append(f"- Requires Review: {'Yes' if response.requires_human_review() else 'No'}")
         
-        return "\n".join(explanation_parts)
+        return EXPLANATION_TEMPLATE.format(
+            # Query analysis
+            intent_type=intent.intent_type.value,
+            intent_confidence=intent.confidence,
+            legal_terms=', '.join(intent.legal_terms) if intent.legal_terms else 'None',
+            section_numbers=', '.join(intent.section_numbers) if intent.section_numbers else 'None',
+            # Graph traversal
+            nodes=len(graph_ctx.nodes),
+            edges=len(graph_ctx.edges),
+            traversal_path=' → '.join(graph_ctx.traversal_path[:5]),
+            truncated="\n  (truncated)" if len(graph_ctx.traversal_path) > 5 else "",
+            # Context building
+            primary_provisions=len(llm_ctx.primary_provisions),
+            related_provisions=len(llm_ctx.related_provisions),
+            definitions=len(llm_ctx.definitions),
+            citations=llm_ctx.get_citation_count(),
+            context_length=llm_ctx.get_total_length(),
+            # Overall assessment
+            final_confidence=response.get_confidence_score(),
+            complexity=response.get_complexity_level(),
+            requires_review='Yes' if response.requires_human_review() else 'No'
+        )
     
     def get_similar_queries(self, query: str, limit: int = 5) -> List[str]:
         """
@@ -290,44 +432,9 @@ class GraphRAGEngine:
         # Parse current query to understand intent
         intent = self.query_parser.parse_query(query)
         
-        suggestions = []
-        
-        if intent.intent_type.value == "definition_lookup":
-            suggestions.extend([
-                "What does 'unfair trade practice' mean?",
-                "Define consumer rights under CPA 2019",
-                "What is the meaning of 'defective goods'?",
-                "Explain the term 'misleading advertisement'"
-            ])
-        elif intent.intent_type.value == "section_retrieval":
-            suggestions.extend([
-                "Show me Section 2 of Consumer Protection Act",
-                "What does Section 18 say about consumer rights?",
-                "Find Section 35 about filing complaints",
-                "Get Section 21 about penalties"
-            ])
-        elif intent.intent_type.value == "rights_query":
-            suggestions.extend([
-                "What are my rights as a consumer?",
-                "How can I file a complaint against unfair practices?",
-                "What compensation can I claim for defective products?",
-                "Where can I seek redressal for consumer disputes?"
-            ])
-        elif intent.intent_type.value == "scenario_analysis":
-            suggestions.extend([
-                "I bought a defective product, what can I do?",
-                "The seller is refusing to refund, what are my options?",
-                "I saw a misleading advertisement, how to complain?",
-                "The service provider is charging extra, is this legal?"
-            ])
-        
-        # Add some general suggestions
-        suggestions.extend([
-            "What is Consumer Protection Act 2019?",
-            "How to file a consumer complaint?",
-            "What are the different consumer commissions?"
-        ])
+        # Intent-specific suggestions first, then some general ones
+        suggestions = INTENT_SUGGESTIONS.get(intent.intent_type, ()) + GENERAL_SUGGESTIONS
         
         # Remove duplicates and limit
-        unique_suggestions = list(set(suggestions))
+        unique_suggestions = list(dict.fromkeys(suggestions))
         return unique_suggestions[:limit]
\ No newline at end of file
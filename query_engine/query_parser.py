@@ -12,10 +12,23 @@ Supports intent types:
 """
 
 import re
+import sys
+import threading
+from collections import OrderedDict
 from typing import List, Dict, Optional, Set
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+    re2 = None
+
+# dataclass(slots=True) needs Python 3.10; older interpreters keep per-instance dicts
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class IntentType(Enum):
     """Supported query intent types"""
@@ -25,7 +38,7 @@ class IntentType(Enum):
     SCENARIO_ANALYSIS = "scenario_analysis"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class QueryIntent:
     """Represents the parsed intent from a user query"""
     intent_type: IntentType
@@ -37,18 +50,65 @@ class QueryIntent:
     temporal_context: Optional[str] = None
 
 
+def _is_word_char(char: str) -> bool:
+    """Check whether a character is a regex word character, as used by \\b"""
+    return re.match(r'\w', char) is not None
+
+
+def _trie_pattern(words: List[str]) -> str:
+    """
+    Build a regex alternation of words factored into a prefix trie.
+    
+    The regex engine then walks shared prefixes once instead of retrying every
+    word at each position. Longer words are preferred: a branch is tried
+    before ending at a shorter word.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    
+    def build(node: Dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if '' in node:
+            branches.append('')
+        if len(branches) == 1:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')'
+    
+    return build(trie)
+
+
 class QueryParser:
     """Parse natural language queries to extract legal intent and entities."""
     
-    def __init__(self):
-        """Initialize the query parser with pattern matching rules."""
+    def __init__(self, cache_size: int = 1024):
+        """
+        Initialize the query parser with pattern matching rules.
+        
+        Args:
+            cache_size: Maximum number of parsed queries to cache (0 disables caching)
+        """
         self._init_patterns()
         self._init_legal_terms()
         self._init_section_patterns()
+        self._init_temporal_patterns()
+        
+        # LRU cache of parsed intents by (query, language)
+        self.cache_size = cache_size
+        self._parse_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def clear_cache(self):
+        """Drop all cached parsed intents"""
+        with self._cache_lock:
+            self._parse_cache.clear()
     
     def _init_patterns(self):
         """Initialize regex patterns for intent classification."""
-        self.intent_patterns = {
+        intent_patterns = {
             IntentType.DEFINITION_LOOKUP: [
                 r'\b(?:what\s+is|define|definition\s+of|meaning\s+of|explain)\b.*?\b(?:consumer|trader|defect|deficiency|unfair\s+trade|advertisement)\b',
                 r'\b(?:consumer|trader|defect|deficiency|unfair\s+trade|advertisement)\b.*?\b(?:means?|definition|defined\s+as)\b',
@@ -74,10 +134,34 @@ class QueryParser:
                 r'\b(?:unfair|misleading|false)\b.*?\b(?:advertisement|practice|contract)\b'
             ]
         }
+        
+        # Compiled once here rather than looked up in the re module cache per query.
+        # The lazy '.*?' gaps backtrack polynomially on long adversarial queries, so
+        # with google-re2 installed they run on its linear-time engine instead (whose
+        # \b treats only ASCII letters and digits as word characters).
+        if RE2_AVAILABLE:
+            compile_intent_pattern = lambda pattern: re2.compile('(?i)' + pattern)
+        else:
+            compile_intent_pattern = lambda pattern: re.compile(pattern, re.IGNORECASE)
+        self.intent_patterns = {
+            intent_type: [compile_intent_pattern(pattern) for pattern in patterns]
+            for intent_type, patterns in intent_patterns.items()
+        }
+        
+        # A bare reference such as "section 35" or "chapter 4" matches exactly one
+        # section retrieval pattern and nothing else, so its intent is known upfront
+        self.bare_section_reference_pattern = re.compile(
+            r'(?:section\s+|s\.\s*|sec\.\s*)\d+(?:\.\d+)*|(?:chapter|part)\s+\d+', re.IGNORECASE
+        )
+        
+        # Entity patterns: quoted terms and capitalized terms (potential proper nouns)
+        self.quoted_term_pattern = re.compile(r'"([^"]*)"')
+        self.capitalized_term_pattern = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
     
     def _init_legal_terms(self):
         """Initialize common legal terms for entity extraction."""
-        self.legal_terms = {
+        # Interned, since the terms are reused in every intent and cache key built from it
+        self.legal_terms = {sys.intern(term) for term in {
             'consumer', 'trader', 'manufacturer', 'service provider', 'complainant',
             'defect', 'deficiency', 'unfair trade practice', 'restrictive trade practice',
             'misleading advertisement', 'false advertisement', 'consumer rights',
@@ -85,27 +169,64 @@ class QueryParser:
             'district commission', 'state commission', 'national commission',
             'central authority', 'consumer protection', 'goods', 'services',
             'warranty', 'guarantee', 'endorsement', 'e-commerce', 'direct selling'
-        }
+        }}
         
         # Create variations for better matching
         self.term_variations = {}
         for term in self.legal_terms:
             variations = [term, term.replace(' ', '_'), term.replace(' ', '')]
             self.term_variations[term] = variations
+        
+        # One sweep finds, at every word start, the longest variation matching there as
+        # a whole word (the trie prefers longer branches). Any shorter match at that
+        # position is a prefix of it ending on a word boundary, so each variation maps
+        # to every term matched along with it, longest first.
+        term_by_variation = {
+            variation.lower(): term
+            for term, variations in self.term_variations.items()
+            for variation in variations
+        }
+        ordered_variations = sorted(term_by_variation, key=len, reverse=True)
+        self.term_pattern = re.compile(r'\b(?=(' + _trie_pattern(ordered_variations) + r')\b)')
+        self.terms_by_variation = {
+            variation: tuple(
+                term_by_variation[prefix] for prefix in ordered_variations
+                if variation.startswith(prefix) and (
+                    prefix == variation
+                    or _is_word_char(prefix[-1]) != _is_word_char(variation[len(prefix)])
+                )
+            )
+            for variation in ordered_variations
+        }
     
     def _init_section_patterns(self):
         """Initialize patterns for section number extraction."""
         self.section_patterns = [
-            r'\bsection\s+(\d+(?:\.\d+)*)\b',
-            r'\bs\.\s*(\d+(?:\.\d+)*)\b',
-            r'\bsec\.\s*(\d+(?:\.\d+)*)\b',
-            r'\b(\d+)\s*(?:of|under)\s+(?:cpa|consumer\s+protection\s+act)\b'
+            re.compile(pattern, re.IGNORECASE) for pattern in [
+                r'\bsection\s+(\d+(?:\.\d+)*)\b',
+                r'\bs\.\s*(\d+(?:\.\d+)*)\b',
+                r'\bsec\.\s*(\d+(?:\.\d+)*)\b',
+                r'\b(\d+)\s*(?:of|under)\s+(?:cpa|consumer\s+protection\s+act)\b'
+            ]
+        ]
+    
+    def _init_temporal_patterns(self):
+        """Initialize patterns for temporal context extraction."""
+        self.temporal_patterns = [
+            re.compile(pattern) for pattern in [
+                r'\b(?:in|during|as\s+of|before|after)\s+(\d{4})\b',
+                r'\b(\d{4})\s+(?:version|amendment|act)\b',
+                r'\b(?:current|latest|present|now)\b'
+            ]
         ]
     
     def parse_query(self, query: str, language: str = "en") -> QueryIntent:
         """
         Extract legal intent from user query.
         
+        Parsing is a pure function of the query, so intents are cached; cached
+        intents are shared and should be treated as read-only.
+        
         Args:
             query: User's natural language query
             language: Language of the query (default: "en")
@@ -113,10 +234,31 @@ class QueryParser:
         Returns:
             QueryIntent with extracted intent type, entities, and confidence score
         """
+        if self.cache_size <= 0:
+            return self._parse_query_uncached(query)
+        
+        cache_key = (query, language)
+        with self._cache_lock:
+            intent = self._parse_cache.get(cache_key)
+            if intent is not None:
+                self._parse_cache.move_to_end(cache_key)
+                return intent
+        
+        intent = self._parse_query_uncached(query)
+        
+        with self._cache_lock:
+            self._parse_cache[cache_key] = intent
+            if len(self._parse_cache) > self.cache_size:
+                self._parse_cache.popitem(last=False)
+        
+        return intent
+    
+    def _parse_query_uncached(self, query: str) -> QueryIntent:
+        """Extract legal intent from user query without consulting the cache."""
         query_lower = query.lower().strip()
         
-        # Extract entities first
-        entities = self._extract_entities(query_lower)
+        # Extract entities first, from the original case so proper nouns stand out
+        entities = self._extract_entities(query)
         section_numbers = self._extract_section_numbers(query_lower)
         legal_terms = self._extract_legal_terms(query_lower)
         
@@ -146,6 +288,10 @@ class QueryParser:
         Returns:
             Tuple of (intent_type, confidence_score)
         """
+        if self.bare_section_reference_pattern.fullmatch(query):
+            # Same result as scoring: one of the section retrieval patterns matches
+            return IntentType.SECTION_RETRIEVAL, 1 / len(self.intent_patterns[IntentType.SECTION_RETRIEVAL])
+        
         intent_scores = {}
         
         for intent_type, patterns in self.intent_patterns.items():
@@ -153,7 +299,7 @@ class QueryParser:
             matches = 0
             
             for pattern in patterns:
-                if re.search(pattern, query, re.IGNORECASE):
+                if pattern.search(query):
                     matches += 1
                     score += 1
             
@@ -174,22 +320,23 @@ class QueryParser:
         Extract general entities from the query.
         
         Args:
-            query: Lowercase query string
+            query: Query string in its original case
             
         Returns:
             List of extracted entities
         """
-        entities = []
+        # Deduplicated in order of first appearance
+        entities = {}
         
         # Extract quoted terms
-        quoted_terms = re.findall(r'"([^"]*)"', query)
-        entities.extend(quoted_terms)
+        quoted_terms = self.quoted_term_pattern.findall(query)
+        entities.update(dict.fromkeys(quoted_terms))
         
         # Extract capitalized terms (potential proper nouns)
-        capitalized = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', query)
-        entities.extend(capitalized)
+        capitalized = self.capitalized_term_pattern.findall(query)
+        entities.update(dict.fromkeys(capitalized))
         
-        return list(set(entities))
+        return list(entities)
     
     def _extract_section_numbers(self, query: str) -> List[str]:
         """
@@ -201,13 +348,14 @@ class QueryParser:
         Returns:
             List of section numbers found in the query
         """
-        section_numbers = []
+        # Deduplicated in order of first appearance
+        section_numbers = {}
         
         for pattern in self.section_patterns:
-            matches = re.findall(pattern, query, re.IGNORECASE)
-            section_numbers.extend(matches)
+            matches = pattern.findall(query)
+            section_numbers.update(dict.fromkeys(matches))
         
-        return list(set(section_numbers))
+        return list(section_numbers)
     
     def _extract_legal_terms(self, query: str) -> List[str]:
         """
@@ -219,19 +367,14 @@ class QueryParser:
         Returns:
             List of legal terms found in the query
         """
-        found_terms = []
+        # Deduplicated in order of appearance in the query
+        found_terms = {}
         
-        for term in self.legal_terms:
-            # Check exact match and variations
-            variations = self.term_variations.get(term, [term])
-            
-            for variation in variations:
-                pattern = r'\b' + re.escape(variation.lower()) + r'\b'
-                if re.search(pattern, query):
-                    found_terms.append(term)
-                    break
+        # Check exact match and variations in a single scan
+        for variation in self.term_pattern.findall(query):
+            found_terms.update(dict.fromkeys(self.terms_by_variation[variation]))
         
-        return list(set(found_terms))
+        return list(found_terms)
     
     def _extract_temporal_context(self, query: str) -> Optional[str]:
         """
@@ -243,14 +386,8 @@ class QueryParser:
         Returns:
             Temporal context string if found, None otherwise
         """
-        temporal_patterns = [
-            r'\b(?:in|during|as\s+of|before|after)\s+(\d{4})\b',
-            r'\b(\d{4})\s+(?:version|amendment|act)\b',
-            r'\b(?:current|latest|present|now)\b'
-        ]
-        
-        for pattern in temporal_patterns:
-            match = re.search(pattern, query)
+        for pattern in self.temporal_patterns:
+            match = pattern.search(query)
             if match:
                 if 'current' in query or 'latest' in query or 'present' in query or 'now' in query:
                     return 'current'
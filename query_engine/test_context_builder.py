@@ -0,0 +1,143 @@
+"""
+Unit Tests for ContextBuilder
+
+Tests the caches of built contexts and section renderings against
+retrievals from the knowledge graph shipped with the repository.
+"""
+
+from dataclasses import replace
+from pathlib import Path
+
+from query_engine.context_builder import ContextBuilder
+from query_engine.graph_traversal import GraphTraversal
+from query_engine.query_parser import QueryParser
+
+KNOWLEDGE_GRAPH_PATH = str(Path(__file__).resolve().parent.parent / "knowledge_graph")
+
+
+class TestCitations:
+    """Test cases for reusing the citations formatted during traversal."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.parser = QueryParser()
+        self.traversal = GraphTraversal(KNOWLEDGE_GRAPH_PATH)
+        self.builder = ContextBuilder(cache_size=0)
+    
+    def test_uses_traversal_citations(self):
+        """Test that each node is cited with the citation the traversal listed for it."""
+        intent = self.parser.parse_query("Show me section 2")
+        graph_context = self.traversal.retrieve_context(intent)
+        relabelled = replace(graph_context, citations=[f"Traversal {citation}" for citation in graph_context.citations])
+        
+        citations = self.builder.build_context(relabelled, intent).citations
+        
+        assert citations
+        assert all(citation.startswith("Traversal ") for citation in citations.values())
+    
+    def test_formats_citations_missing_from_traversal(self):
+        """Test that nodes without a listed citation are cited from their content."""
+        for query in ["Show me section 2", "What are my consumer rights?", "define service"]:
+            intent = self.parser.parse_query(query)
+            graph_context = self.traversal.retrieve_context(intent)
+            expected = self.builder.build_context(graph_context, intent)
+            
+            context = self.builder.build_context(replace(graph_context, citations=[]), intent)
+            
+            assert context.citations == expected.citations
+            assert context.formatted_text == expected.formatted_text
+
+
+class TestContextCache:
+    """Test cases for the LRU cache of built contexts."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.parser = QueryParser()
+        self.traversal = GraphTraversal(KNOWLEDGE_GRAPH_PATH)
+        self.builder = ContextBuilder(cache_size=2)
+        self.built = []
+        build_context_uncached = self.builder._build_context_uncached
+        
+        def counting_build(graph_context, intent):
+            self.built.append(intent.original_query)
+            return build_context_uncached(graph_context, intent)
+        
+        self.builder._build_context_uncached = counting_build
+    
+    def build(self, query: str):
+        intent = self.parser.parse_query(query)
+        return self.builder.build_context(self.traversal.retrieve_context(intent), intent)
+    
+    def test_same_retrieval_is_served_from_cache(self):
+        """Test that rebuilding a context for the same retrieval returns the cached one."""
+        context = self.build("What does consumer mean?")
+        
+        assert self.build("What does consumer mean?") is context
+        assert self.built == ["What does consumer mean?"]
+    
+    def test_cached_context_matches_fresh_build(self):
+        """Test that a cached context renders the same as one built without the cache."""
+        uncached = ContextBuilder(cache_size=0)
+        for query in ["define service", "Show me section 2", "define service"]:
+            intent = self.parser.parse_query(query)
+            graph_context = self.traversal.retrieve_context(intent)
+            expected = uncached.build_context(graph_context, intent)
+            context = self.builder.build_context(graph_context, intent)
+            
+            assert context.formatted_text == expected.formatted_text
+            assert context.citations == expected.citations
+    
+    def test_least_recently_used_context_is_evicted(self):
+        """Test that the cache keeps the most recently used contexts."""
+        self.build("define service")
+        self.build("Show me section 2")
+        self.build("define service")
+        self.build("What are my consumer rights?")
+        self.build("Show me section 2")
+        self.build("What are my consumer rights?")
+        
+        assert self.built == [
+            "define service", "Show me section 2", "What are my consumer rights?", "Show me section 2"
+        ]
+        assert len(self.builder._context_cache) == 2
+    
+    def test_zero_cache_size_disables_cache(self):
+        """Test that cache_size=0 builds every context afresh."""
+        self.builder.cache_size = 0
+        first = self.build("define service")
+        second = self.build("define service")
+        
+        assert first is not second
+        assert first.formatted_text == second.formatted_text
+        assert self.built == ["define service", "define service"]
+        assert len(self.builder._context_cache) == 0
+    
+    def test_render_cache_is_bounded(self):
+        """Test that section renderings are capped at render_cache_size and can be disabled."""
+        queries = ["Show me section 2", "What does section 35 say?", "What are my consumer rights?",
+                   "I bought a defective product, what can I do?"]
+        bounded = ContextBuilder(cache_size=0, render_cache_size=2)
+        disabled = ContextBuilder(cache_size=0, render_cache_size=0)
+        for query in queries:
+            intent = self.parser.parse_query(query)
+            graph_context = self.traversal.retrieve_context(intent)
+            expected = disabled.build_context(graph_context, intent).formatted_text
+            
+            assert bounded.build_context(graph_context, intent).formatted_text == expected
+            assert bounded.build_context(graph_context, intent).formatted_text == expected
+            assert len(bounded._render_cache) <= 2
+        
+        assert bounded._render_cache
+        assert not disabled._render_cache
+    
+    def test_clear_cache(self):
+        """Test that clearing the cache drops built contexts and renderings."""
+        context = self.build("Show me section 2")
+        self.builder.clear_cache()
+        
+        assert not self.builder._render_cache
+        rebuilt = self.build("Show me section 2")
+        assert rebuilt is not context
+        assert rebuilt.formatted_text == context.formatted_text
+        assert self.built == ["Show me section 2", "Show me section 2"]
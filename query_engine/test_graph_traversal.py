@@ -0,0 +1,298 @@
+"""
+Unit Tests for GraphTraversal
+
+Tests keyword search, the retrieval cache and the persisted index cache
+against the knowledge graph shipped with the repository.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from query_engine import graph_traversal
+from query_engine.graph_traversal import GraphTraversal
+from query_engine.query_parser import QueryParser
+
+KNOWLEDGE_GRAPH_PATH = Path(__file__).resolve().parent.parent / "knowledge_graph"
+
+KEYWORD_SEARCHES = [
+    ["consumer"],
+    ["consum"],
+    ["consumer rights"],
+    ["unfair trade practice"],
+    ["product liability action", "defect"],
+    ["goods", "service", "trader"],
+    ["refund my money"],
+    ["e-commerce"],
+    ["director-general", "consumer"],
+    ["section 2(7)"],
+    ["consumer's complaint"],
+    ["goods,"],
+    ["consumer  rights"],
+    ["district", "commission"],
+    ["xyzzy"],
+    [""],
+]
+
+RETRIEVAL_QUERIES = [
+    "What does consumer mean?",
+    "Show me section 2",
+    "What are my consumer rights?",
+    "I bought a defective product, what can I do?",
+]
+
+
+def copy_knowledge_graph(directory: Path) -> Path:
+    """Copy the knowledge graph, keeping file times, so tests can touch it."""
+    kg_path = directory / "knowledge_graph"
+    shutil.copytree(KNOWLEDGE_GRAPH_PATH, kg_path)
+    return kg_path
+
+
+def retrievals(traversal: GraphTraversal):
+    """Node IDs and citations retrieved for each test query."""
+    parser = QueryParser()
+    results = []
+    for query in RETRIEVAL_QUERIES:
+        context = traversal.retrieve_context(parser.parse_query(query))
+        results.append(([node.node_id for node in context.nodes], context.citations))
+    return results
+
+
+def term_words(terms):
+    """Search terms as the (lowercased term, words) pairs the scorers take."""
+    return [(term.lower(), term.lower().split()) for term in terms]
+
+
+def scan_keyword_search(traversal: GraphTraversal, terms):
+    """Top 5 node IDs from scoring every search document, earlier documents winning ties."""
+    scored = [
+        (traversal._calculate_text_match_score(text_lower, term_words(terms)), -doc_index)
+        for doc_index, (_, _, text_lower) in enumerate(traversal.search_documents)
+    ]
+    node_ids = []
+    for score, negative_index in sorted(scored, reverse=True)[:5]:
+        if score > 0:
+            node_type, content, _ = traversal.search_documents[-negative_index]
+            if node_type == 'section':
+                node_ids.append(content['section_id'])
+            elif node_type == 'definition':
+                node_ids.append(f"DEF_{content['term'].lower()}")
+            else:
+                node_ids.append(content['right_id'])
+    return node_ids
+
+
+def loads_index_cache(kg_path: Path, cache_path: Path) -> bool:
+    """Whether a traversal over kg_path would accept the index cache at cache_path."""
+    traversal = GraphTraversal(str(kg_path))
+    traversal.index_cache_path = cache_path
+    return traversal._load_index_cache()
+
+
+class TestKeywordSearch:
+    """Test cases for the indexed keyword search against a full document scan."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.traversal = GraphTraversal(str(KNOWLEDGE_GRAPH_PATH))
+    
+    @pytest.mark.parametrize("terms", KEYWORD_SEARCHES)
+    def test_matches_full_scan(self, terms):
+        """Test that the indexed search returns the nodes a full scan ranks highest."""
+        nodes, edges, traversal_path = self.traversal._keyword_search(terms)
+        
+        assert [node.node_id for node in nodes] == scan_keyword_search(self.traversal, terms)
+        assert traversal_path == [node.node_id for node in nodes]
+        assert edges == []
+    
+    @pytest.mark.parametrize("terms", [terms for terms in KEYWORD_SEARCHES if terms != [""]])
+    def test_scores_match_full_scan(self, terms):
+        """Test that bulk scoring gives every document its full-scan score."""
+        words = term_words(terms)
+        expected = {
+            doc_index: score
+            for doc_index, (_, _, text_lower) in enumerate(self.traversal.search_documents)
+            if (score := self.traversal._calculate_text_match_score(text_lower, words)) > 0
+        }
+        word_documents = self.traversal._query_word_documents(words)
+        
+        if word_documents is None:
+            # Terms with punctuation fall back to the full scan
+            assert any(not term.replace(" ", "").isalnum() for term in terms)
+        else:
+            scores = self.traversal._score_documents(words, word_documents)
+            assert {doc_index: score for doc_index, score in scores.items() if score > 0} == expected
+    
+    def test_definition_terms_match_full_scan(self):
+        """Test that definition terms, scored through phrase_index, match a full scan."""
+        for term in self.traversal.definition_by_term:
+            nodes, _, _ = self.traversal._keyword_search([term])
+            assert [node.node_id for node in nodes] == scan_keyword_search(self.traversal, [term]), term
+    
+    @pytest.mark.parametrize("word", ["consum", "consumer", "rights", "ight", "2", "e", "xyzzy"])
+    def test_word_documents_match_substring_scan(self, word):
+        """Test that vocabulary lookups find every document containing a word, even inside a token."""
+        expected = {
+            doc_index for doc_index, (_, _, text_lower) in enumerate(self.traversal.search_documents)
+            if word in text_lower
+        }
+        
+        assert self.traversal._word_documents(word) == expected
+
+
+class TestRetrievalCache:
+    """Test cases for the LRU cache of retrieval results."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.parser = QueryParser()
+        self.traversal = GraphTraversal(str(KNOWLEDGE_GRAPH_PATH), cache_size=2)
+        self.retrieved = []
+        retrieve = self.traversal._retrieve
+        
+        def counting_retrieve(intent):
+            self.retrieved.append(intent.original_query)
+            return retrieve(intent)
+        
+        self.traversal._retrieve = counting_retrieve
+    
+    def retrieve(self, query: str):
+        return self.traversal.retrieve_context(self.parser.parse_query(query))
+    
+    def test_same_intent_fields_are_served_from_cache(self):
+        """Test that intents differing only in fields the handlers ignore share a retrieval."""
+        first = self.retrieve("What does consumer mean?")
+        second = self.retrieve("what does CONSUMER mean")
+        
+        assert self.retrieved == ["What does consumer mean?"]
+        assert [node.node_id for node in second.nodes] == [node.node_id for node in first.nodes]
+        assert second.citations == first.citations
+    
+    def test_cached_context_is_a_fresh_copy(self):
+        """Test that editing a returned context does not change later cache hits."""
+        first = self.retrieve("What does consumer mean?")
+        first.nodes.clear()
+        first.citations.append("edited")
+        
+        second = self.retrieve("What does consumer mean?")
+        assert second.nodes
+        assert "edited" not in second.citations
+    
+    def test_scenarios_are_cached_separately(self):
+        """Test that scenario queries routed to different scenarios do not share a retrieval."""
+        defective = self.retrieve("I bought a defective product, what can I do?")
+        overcharged = self.retrieve("Service provider overcharging, is this legal?")
+        
+        assert len(self.retrieved) == 2
+        assert defective.traversal_path != overcharged.traversal_path
+    
+    def test_least_recently_used_retrieval_is_evicted(self):
+        """Test that the cache keeps the most recently used retrievals."""
+        self.retrieve("define service")
+        self.retrieve("Show me section 2")
+        self.retrieve("define service")
+        self.retrieve("What are my consumer rights?")
+        self.retrieve("Show me section 2")
+        self.retrieve("What are my consumer rights?")
+        
+        assert self.retrieved == [
+            "define service", "Show me section 2", "What are my consumer rights?", "Show me section 2"
+        ]
+        assert len(self.traversal._retrieval_cache) == 2
+    
+    def test_zero_cache_size_disables_cache(self):
+        """Test that cache_size=0 retrieves every time."""
+        self.traversal.cache_size = 0
+        first = self.retrieve("define service")
+        second = self.retrieve("define service")
+        
+        assert self.retrieved == ["define service", "define service"]
+        assert [node.node_id for node in second.nodes] == [node.node_id for node in first.nodes]
+        assert len(self.traversal._retrieval_cache) == 0
+    
+    def test_clear_cache(self):
+        """Test that clearing the cache makes the next retrieval recompute."""
+        self.retrieve("define service")
+        self.traversal.clear_cache()
+        self.retrieve("define service")
+        
+        assert self.retrieved == ["define service", "define service"]
+
+
+class TestIndexCache:
+    """Test cases for persisting graph indices across processes."""
+    
+    def test_round_trip(self, tmp_path):
+        """Test that a restored cache serves the same retrievals as a fresh build."""
+        kg_path = copy_knowledge_graph(tmp_path)
+        cache_path = tmp_path / "index.pkl"
+        
+        GraphTraversal(str(kg_path), index_cache_path=str(cache_path))
+        assert cache_path.exists()
+        assert loads_index_cache(kg_path, cache_path)
+        
+        restored = GraphTraversal(str(kg_path), index_cache_path=str(cache_path))
+        assert retrievals(restored) == retrievals(GraphTraversal(str(kg_path)))
+    
+    def test_rejects_cache_older_than_graph(self, tmp_path):
+        """Test that a JSON file modified after the cache was written invalidates it."""
+        kg_path = copy_knowledge_graph(tmp_path)
+        cache_path = tmp_path / "index.pkl"
+        GraphTraversal(str(kg_path), index_cache_path=str(cache_path))
+        
+        newer = cache_path.stat().st_mtime + 10
+        os.utime(kg_path / "nodes" / "sections.data.json", (newer, newer))
+        
+        assert not loads_index_cache(kg_path, cache_path)
+    
+    def test_rejects_other_version(self, tmp_path, monkeypatch):
+        """Test that a cache written by another index layout version is rejected."""
+        kg_path = copy_knowledge_graph(tmp_path)
+        cache_path = tmp_path / "index.pkl"
+        GraphTraversal(str(kg_path), index_cache_path=str(cache_path))
+        
+        monkeypatch.setattr(graph_traversal, "INDEX_CACHE_VERSION", graph_traversal.INDEX_CACHE_VERSION + 1)
+        
+        assert not loads_index_cache(kg_path, cache_path)
+    
+    def test_rejects_other_knowledge_graph(self, tmp_path):
+        """Test that a cache built from another knowledge graph directory is rejected."""
+        kg_path = copy_knowledge_graph(tmp_path)
+        other_kg_path = copy_knowledge_graph(tmp_path / "other")
+        cache_path = tmp_path / "index.pkl"
+        GraphTraversal(str(other_kg_path), index_cache_path=str(cache_path))
+        
+        assert not loads_index_cache(kg_path, cache_path)
+        assert loads_index_cache(other_kg_path, cache_path)
+    
+    def test_rejects_corrupt_cache(self, tmp_path):
+        """Test that an unreadable cache is rejected and then rewritten."""
+        kg_path = copy_knowledge_graph(tmp_path)
+        cache_path = tmp_path / "index.pkl"
+        cache_path.write_bytes(b"not a pickle")
+        
+        assert not loads_index_cache(kg_path, cache_path)
+        
+        traversal = GraphTraversal(str(kg_path), index_cache_path=str(cache_path))
+        assert retrievals(traversal) == retrievals(GraphTraversal(str(kg_path)))
+        assert loads_index_cache(kg_path, cache_path)
+    
+    def test_failed_write_keeps_previous_cache(self, tmp_path, monkeypatch):
+        """Test that a write failing partway leaves the old cache and no temporary file."""
+        kg_path = copy_knowledge_graph(tmp_path)
+        cache_path = tmp_path / "index.pkl"
+        traversal = GraphTraversal(str(kg_path), index_cache_path=str(cache_path))
+        previous = cache_path.read_bytes()
+        
+        def partial_dump(state, f, protocol=None):
+            f.write(b"partial")
+            raise OSError("disk full")
+        
+        monkeypatch.setattr(graph_traversal.pickle, "dump", partial_dump)
+        traversal._save_index_cache()
+        
+        assert cache_path.read_bytes() == previous
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["index.pkl", "knowledge_graph"]
@@ -0,0 +1,165 @@
+"""
+Unit Tests for GraphRAGEngine
+
+Tests the engine's batch processing and response cache against the
+knowledge graph shipped with the repository.
+"""
+
+import sys
+from pathlib import Path
+
+from query_engine.graphrag_engine import GraphRAGEngine
+
+KNOWLEDGE_GRAPH_PATH = str(Path(__file__).resolve().parent.parent / "knowledge_graph")
+
+BATCH_QUERIES = [
+    "What does consumer mean?",
+    "define service",
+    "Define unfair trade practice",
+    "Show me section 2",
+    "What does section 35 say?",
+    "What are my consumer rights?",
+    "Rights against misleading advertisements",
+    "I bought a defective product, what can I do?",
+    "Service provider overcharging, is this legal?",
+    "Misleading advertisement caused loss, how to complain?",
+]
+
+
+def response_snapshot(response):
+    """The parts of a response that must not depend on how it was scheduled."""
+    return (
+        response.query_intent.intent_type,
+        response.llm_context.formatted_text,
+        response.llm_context.citations,
+        [node.node_id for node in response.graph_context.nodes],
+    )
+
+
+class TestProcessQueries:
+    """Test cases for batch processing on the engine's worker threads."""
+    
+    def setup_method(self):
+        """Switch threads as often as possible so races surface."""
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+    
+    def teardown_method(self):
+        sys.setswitchinterval(self.switch_interval)
+    
+    def test_parallel_batch_matches_serial(self):
+        """Test that a threaded batch returns exactly what a serial run does."""
+        serial_engine = GraphRAGEngine(KNOWLEDGE_GRAPH_PATH)
+        expected = [response_snapshot(serial_engine.process_query(query)) for query in BATCH_QUERIES]
+        
+        engine = GraphRAGEngine(KNOWLEDGE_GRAPH_PATH, n_workers=8)
+        for _ in range(5):
+            # Start cold each round so contexts are built concurrently
+            engine.clear_cache()
+            responses = engine.process_queries(BATCH_QUERIES * 4)
+            assert [response_snapshot(r) for r in responses] == expected * 4
+        
+        # Nothing built concurrently was cached wrong either
+        assert [response_snapshot(engine.process_query(q)) for q in BATCH_QUERIES] == expected
+    
+    def test_parallel_batch_counts_every_query(self):
+        """Test that queries on worker threads are all counted, and the counters can be reset."""
+        engine = GraphRAGEngine(KNOWLEDGE_GRAPH_PATH, cache_size=0, n_workers=8)
+        engine.process_queries(BATCH_QUERIES * 10)
+        
+        assert engine.query_count == len(BATCH_QUERIES) * 10
+        assert engine.get_performance_stats()['total_queries'] == engine.query_count
+        
+        engine.query_count = 0
+        engine.total_processing_time = 0.0
+        assert engine.get_performance_stats()['average_processing_time'] == 0.0
+
+
+def count_calls(obj, method_name):
+    """Replace a method on obj with a wrapper recording each call's first argument."""
+    calls = []
+    method = getattr(obj, method_name)
+    
+    def counting_method(*args, **kwargs):
+        calls.append(args[0])
+        return method(*args, **kwargs)
+    
+    setattr(obj, method_name, counting_method)
+    return calls
+
+
+class TestResponseCache:
+    """Test cases for the LRU cache of query responses and clearing every cache layer."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.engine = GraphRAGEngine(KNOWLEDGE_GRAPH_PATH, cache_size=2)
+        self.parsed = count_calls(self.engine.query_parser, 'parse_query')
+    
+    def test_repeated_query_is_served_from_cache(self):
+        """Test that a repeated query skips the pipeline but keeps its own query text."""
+        first = self.engine.process_query("What does consumer mean?")
+        second = self.engine.process_query("  What does consumer mean?  ")
+        
+        assert self.parsed == ["What does consumer mean?"]
+        assert response_snapshot(second) == response_snapshot(first)
+        assert second.query_intent.original_query == "  What does consumer mean?  "
+        
+        self.engine.process_query("What does consumer mean?", audience="lawyer")
+        assert len(self.parsed) == 2
+    
+    def test_least_recently_used_response_is_evicted(self):
+        """Test that the cache keeps the most recently used responses."""
+        for query in ["define service", "Show me section 2", "define service",
+                      "What are my consumer rights?", "Show me section 2", "What are my consumer rights?"]:
+            self.engine.process_query(query)
+        
+        assert self.parsed == [
+            "define service", "Show me section 2", "What are my consumer rights?", "Show me section 2"
+        ]
+        assert len(self.engine._response_cache) == 2
+    
+    def test_zero_cache_size_disables_cache(self):
+        """Test that cache_size=0 runs the pipeline for every query."""
+        self.engine.cache_size = 0
+        first = self.engine.process_query("define service")
+        second = self.engine.process_query("define service")
+        
+        assert self.parsed == ["define service", "define service"]
+        assert response_snapshot(second) == response_snapshot(first)
+        assert len(self.engine._response_cache) == 0
+    
+    def test_zero_cache_size_disables_every_layer(self):
+        """Test that an engine built with cache_size=0 caches nothing at any stage."""
+        engine = GraphRAGEngine(KNOWLEDGE_GRAPH_PATH, cache_size=0)
+        for query in BATCH_QUERIES * 2:
+            engine.process_query(query)
+        
+        assert not engine._response_cache
+        assert not engine.query_parser._parse_cache
+        assert not engine.graph_traversal._retrieval_cache
+        assert not engine.context_builder._context_cache
+        assert not engine.context_builder._render_cache
+    
+    def test_clear_cache_invalidates_every_layer(self):
+        """Test that clearing the engine's cache makes every pipeline stage recompute."""
+        parsed = count_calls(self.engine.query_parser, '_parse_query_uncached')
+        retrieved = count_calls(self.engine.graph_traversal, '_retrieve')
+        built = count_calls(self.engine.context_builder, '_build_context_uncached')
+        expected = response_snapshot(self.engine.process_query("Show me section 2"))
+        
+        assert self.engine._response_cache
+        assert self.engine.query_parser._parse_cache
+        assert self.engine.graph_traversal._retrieval_cache
+        assert self.engine.context_builder._context_cache
+        
+        self.engine.clear_cache()
+        
+        assert not self.engine._response_cache
+        assert not self.engine.query_parser._parse_cache
+        assert not self.engine.graph_traversal._retrieval_cache
+        assert not self.engine.context_builder._context_cache
+        assert not self.engine.context_builder._render_cache
+        
+        assert response_snapshot(self.engine.process_query("Show me section 2")) == expected
+        assert (len(parsed), len(retrieved), len(built)) == (2, 2, 2)
@@ -0,0 +1,173 @@
+"""
+Unit Tests for QueryParser
+
+Tests legal term extraction against a per-term word-boundary search, and
+the cache of parsed intents.
+"""
+
+import re
+
+import pytest
+
+from query_engine.query_parser import QueryParser, _trie_pattern
+
+TERM_QUERIES = [
+    "what are my consumer rights?",
+    "consumer rights and consumer protection",
+    "is a consumer_rights clause valid",
+    "consumerrights",
+    "the consumer's complaint",
+    "e-commerce platform refused a refund",
+    "ecommerce and e_commerce sellers",
+    "non-consumer goods",
+    "consumers and traders",
+    "prosumer goodsmith reconsumer",
+    "unfair trade practice by a service provider",
+    "unfair trade practices",
+    "unfair trade",
+    "district commission, state commission or national commission?",
+    "misleading advertisement vs false advertisement",
+    "",
+]
+
+
+def scan_legal_terms(parser: QueryParser, query: str):
+    """Terms with a variation occurring in the query as a whole word, checked one by one."""
+    return {
+        term for term, variations in parser.term_variations.items()
+        if any(re.search(r'\b' + re.escape(variation.lower()) + r'\b', query) for variation in variations)
+    }
+
+
+class TestLegalTermExtraction:
+    """Test cases for extracting legal terms through the trie pattern."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.parser = QueryParser()
+    
+    @pytest.mark.parametrize("query", TERM_QUERIES)
+    def test_matches_per_term_scan(self, query):
+        """Test that the single-sweep extraction finds the terms a per-term search does."""
+        terms = self.parser._extract_legal_terms(query)
+        
+        assert len(terms) == len(set(terms))
+        assert set(terms) == scan_legal_terms(self.parser, query)
+    
+    def test_overlapping_terms(self):
+        """Test that a longer term also reports the shorter terms it contains."""
+        assert set(self.parser._extract_legal_terms("consumer rights")) == {"consumer rights", "consumer"}
+        assert set(self.parser._extract_legal_terms("consumer_rights")) == {"consumer rights"}
+        assert set(self.parser._extract_legal_terms("consumerrights")) == {"consumer rights"}
+        assert self.parser._extract_legal_terms("consumer") == ["consumer"]
+    
+    def test_hyphenated_term(self):
+        """Test that a term containing punctuation matches as a whole."""
+        assert self.parser._extract_legal_terms("an e-commerce seller") == ["e-commerce"]
+        assert self.parser._extract_legal_terms("an e_commerce seller") == []
+    
+    def test_no_match_inside_word(self):
+        """Test that terms are not found inside longer words."""
+        assert self.parser._extract_legal_terms("consumers and traders") == []
+        assert self.parser._extract_legal_terms("reconsumer") == []
+        assert self.parser._extract_legal_terms("goodsmith") == []
+    
+    def test_variations_map_to_terms_matched_with_them(self):
+        """Test that each variation lists the terms whose variations it starts with at a word boundary."""
+        terms_by_variation = self.parser.terms_by_variation
+        
+        assert terms_by_variation["consumer rights"] == ("consumer rights", "consumer")
+        assert terms_by_variation["consumer_rights"] == ("consumer rights",)
+        assert terms_by_variation["consumerrights"] == ("consumer rights",)
+        assert terms_by_variation["e-commerce"] == ("e-commerce",)
+        assert all(variation.lower() in terms_by_variation
+                   for variations in self.parser.term_variations.values() for variation in variations)
+
+
+class TestParseCache:
+    """Test cases for the LRU cache of parsed intents."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.parser = QueryParser(cache_size=2)
+        self.parsed = []
+        parse_query_uncached = self.parser._parse_query_uncached
+        
+        def counting_parse(query):
+            self.parsed.append(query)
+            return parse_query_uncached(query)
+        
+        self.parser._parse_query_uncached = counting_parse
+    
+    def test_repeated_query_is_served_from_cache(self):
+        """Test that a repeated query returns the cached intent without parsing again."""
+        intent = self.parser.parse_query("What does consumer mean?")
+        
+        assert self.parser.parse_query("What does consumer mean?") is intent
+        assert self.parsed == ["What does consumer mean?"]
+        assert self.parser.parse_query("What does consumer mean?", language="hi") is not intent
+    
+    def test_least_recently_used_query_is_evicted(self):
+        """Test that the cache keeps the most recently used queries."""
+        self.parser.parse_query("define service")
+        self.parser.parse_query("Show me section 2")
+        self.parser.parse_query("define service")
+        self.parser.parse_query("What are my consumer rights?")
+        
+        assert list(self.parser._parse_cache) == [("define service", "en"), ("What are my consumer rights?", "en")]
+        self.parser.parse_query("Show me section 2")
+        assert self.parsed.count("Show me section 2") == 2
+        assert self.parsed.count("define service") == 1
+    
+    def test_zero_cache_size_disables_cache(self):
+        """Test that cache_size=0 parses every query afresh."""
+        self.parser.cache_size = 0
+        first = self.parser.parse_query("define service")
+        second = self.parser.parse_query("define service")
+        
+        assert first is not second
+        assert first == second
+        assert self.parsed == ["define service", "define service"]
+        assert len(self.parser._parse_cache) == 0
+    
+    def test_clear_cache(self):
+        """Test that clearing the cache makes the next parse recompute."""
+        intent = self.parser.parse_query("define service")
+        self.parser.clear_cache()
+        
+        assert self.parser.parse_query("define service") is not intent
+        assert self.parsed == ["define service", "define service"]
+
+
+class TestTriePattern:
+    """Test cases for the prefix-trie alternation."""
+    
+    WORDS = ["consumer", "consumer rights", "consumer_rights", "consume", "e-commerce", "c"]
+    
+    def test_matches_exactly_the_words(self):
+        """Test that the pattern fully matches each word and nothing else."""
+        pattern = re.compile(_trie_pattern(self.WORDS))
+        
+        for word in self.WORDS:
+            assert pattern.fullmatch(word), word
+        for other in ["consumer right", "consumers", "cons", "e-comm", "ecommerce", ""]:
+            assert not pattern.fullmatch(other), other
+    
+    def test_prefers_longest_word(self):
+        """Test that the longest word matching at a position is tried first."""
+        pattern = re.compile(_trie_pattern(self.WORDS))
+        
+        assert pattern.match("consumer rights act").group() == "consumer rights"
+        assert pattern.match("consumer_rights act").group() == "consumer_rights"
+        assert pattern.match("consumer protection").group() == "consumer"
+        assert pattern.match("consumed").group() == "consume"
+        assert pattern.match("cat").group() == "c"
+    
+    def test_escapes_special_characters(self):
+        """Test that regex metacharacters in words match literally."""
+        pattern = re.compile(_trie_pattern(["s.2(1)", "s.2", "a+b"]))
+        
+        assert pattern.fullmatch("s.2(1)")
+        assert pattern.fullmatch("a+b")
+        assert not pattern.fullmatch("sx2")
+        assert not pattern.fullmatch("aab")
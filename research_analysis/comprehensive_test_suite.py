@@ -2,166 +2,258 @@
 """
 Comprehensive Test Suite for Nyayamrit GraphRAG System
 Tests the system on 100 diverse queries to validate performance with enhanced clause coverage.
+
+Run as a module from the repository root:
+
+    python -m research_analysis.comprehensive_test_suite [--workers N] [--no-cache] [-v]
 """
 
+import argparse
 import json
-import sys
+import logging
+import math
 import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Iterator, List, Dict, Any, NamedTuple, Optional
 import statistics
 
-# Add current directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
-
 from query_engine.graphrag_engine import GraphRAGEngine
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+RESULTS_DIR = Path("research_analysis/data")
+
+# Per-query results, streamed one JSON object per line as each query completes
+DETAILED_RESULTS_PATH = RESULTS_DIR / "detailed_query_results.jsonl"
+
+# Pickle of the engine's graph indices, reused by later runs of the suite
+INDEX_CACHE_PATH = RESULTS_DIR / ".index_cache.pkl"
+
+# One untimed query per category, run before the suite so that lazily built
+# graph indices are not charged to the first measured query
+WARMUP_QUERIES = {
+    "definition_lookup": "What is the meaning of goods?",
+    "section_retrieval": "Show section 10",
+    "rights_query": "What are the rights of a consumer?",
+    "scenario_analysis": "I was sold expired goods, what can I do?",
+}
+
+
+# Built-in test queries: (id prefix, intent, queries), 25 queries per intent type
+TEST_QUERIES = (
+    ("DEF", "definition_lookup", (
+        "What does consumer mean?",
+        "Define unfair trade practice",
+        "What is the meaning of defective goods?",
+        "Explain misleading advertisement",
+        "What does complainant mean in legal terms?",
+        "Define trader under CPA",
+        "What is meant by service in consumer law?",
+        "Explain the term product liability",
+        "What does Central Authority mean?",
+        "Define District Commission",
+        "What is State Commission?",
+        "Explain National Commission",
+        "What does e-commerce mean in CPA?",
+        "Define product seller",
+        "What is meant by product manufacturer?",
+        "Explain consumer dispute",
+        "What does harm mean in consumer context?",
+        "Define express warranty",
+        "What is implied warranty?",
+        "Explain restrictive trade practice",
+        "What does pecuniary jurisdiction mean?",
+        "Define territorial jurisdiction",
+        "What is meant by consumer protection council?",
+        "Explain the term mediation",
+        "What does investigation wing mean?",
+    )),
+    ("SEC", "section_retrieval", (
+        "Show me section 2",
+        "Get section 18 of CPA",
+        "What does section 35 say?",
+        "Display section 21 content",
+        "Find section 47 provisions",
+        "Section 12 details",
+        "Show section 23",
+        "Section 34 text",
+        "Get me section 41",
+        "Section 58 provisions",
+        "What is in section 67?",
+        "Section 72 content",
+        "Show section 15",
+        "Section 28 details",
+        "Get section 36",
+        "Section 49 text",
+        "What does section 51 contain?",
+        "Section 63 provisions",
+        "Show me section 74",
+        "Section 19 content",
+        "Get section 25",
+        "Section 31 details",
+        "What is section 44?",
+        "Section 56 text",
+        "Show section 69",
+    )),
+    ("RGT", "rights_query", (
+        "What are my consumer rights?",
+        "What rights do I have as a buyer?",
+        "Consumer protection rights under CPA",
+        "Rights against unfair trade practices",
+        "What can consumers claim for defective products?",
+        "Rights to information about products",
+        "Consumer rights for service deficiency",
+        "Rights against misleading advertisements",
+        "What rights do online buyers have?",
+        "Consumer rights for warranty claims",
+        "Rights to compensation for damages",
+        "Consumer rights in e-commerce",
+        "Rights against overcharging",
+        "Consumer rights for product safety",
+        "Rights to file complaints",
+        "Consumer rights for refunds",
+        "Rights against discrimination",
+        "Consumer rights for privacy",
+        "Rights to choose products freely",
+        "Consumer rights for education",
+        "Rights against hazardous goods",
+        "Consumer rights for representation",
+        "Rights to seek redressal",
+        "Consumer rights for fair treatment",
+        "Rights against exploitation",
+    )),
+    ("SCN", "scenario_analysis", (
+        "I bought a defective product, what can I do?",
+        "Seller is refusing refund, what are my options?",
+        "Misleading advertisement caused loss, how to complain?",
+        "Service provider overcharging, is this legal?",
+        "Received damaged goods, what compensation can I get?",
+        "Online purchase not delivered, what to do?",
+        "Product caused injury, can I claim damages?",
+        "Warranty expired but product failed early, any recourse?",
+        "Restaurant served contaminated food, what action?",
+        "Bank charged unauthorized fees, how to complain?",
+        "Insurance claim rejected unfairly, what options?",
+        "Mobile service poor quality, can I get compensation?",
+        "Airline cancelled flight without notice, what rights?",
+        "Hospital overcharged for treatment, is this allowed?",
+        "Courier lost my package, what compensation?",
+        "Gym refusing membership cancellation, what to do?",
+        "Car dealer sold defective vehicle, what recourse?",
+        "Real estate agent misled about property, can I complain?",
+        "Educational institution charging hidden fees, is this legal?",
+        "Electricity bill seems wrong, how to dispute?",
+        "Medicine caused side effects not mentioned, what action?",
+        "Appliance repair service damaged my item, what compensation?",
+        "Travel agency cancelled trip last minute, what rights?",
+        "Software purchase doesn't work as advertised, what options?",
+        "Subscription service won't let me cancel, what to do?",
+    )),
+)
+
+
+def _dump_json(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+class QueryResult(NamedTuple):
+    """Metrics collected for one test query, in the field order they are reported."""
+    query_id: str
+    query_text: str
+    expected_intent: str
+    category: str
+    success: bool
+    latency_ms: float
+    intent_detected: str
+    confidence: float
+    nodes_retrieved: int
+    context_length: int
+    citations_count: int
+    reasoning_steps: int
+    human_review_flagged: bool
+    intent_correct: bool
+    error: Optional[str] = None
+    error_type: Optional[str] = None
+
+
 class ComprehensiveTestSuite:
-    def __init__(self):
-        self.engine = GraphRAGEngine()
-        self.test_queries = self._generate_test_queries()
+    def __init__(self, max_workers: int = 1, use_cache: bool = True,
+                 queries_file: Optional[str] = None):
+        """
+        Args:
+            max_workers: Worker processes the queries are spread over, each with its
+                own engine (1 runs them serially in this process)
+            use_cache: Reuse the graph indices persisted by earlier runs and keep the
+                engine's pipeline caches on (False benchmarks a cold engine)
+            queries_file: JSONL file of test queries to run instead of the built-in set
+        
+        Raises:
+            ValueError: If queries_file holds no test queries
+        """
+        self.test_queries = self._generate_test_queries(queries_file)
+        if not self.test_queries:
+            raise ValueError(f"No test queries found in {queries_file}")
+        
+        if use_cache:
+            RESULTS_DIR.mkdir(exist_ok=True)
+            self.engine = GraphRAGEngine(index_cache_path=str(INDEX_CACHE_PATH))
+        else:
+            self.engine = GraphRAGEngine(cache_size=0)
+        self.max_workers = max_workers
+        self.use_cache = use_cache
         self.results = []
+        self._success_count = 0
+        self._warm_up()
         
-    def _generate_test_queries(self) -> List[Dict[str, Any]]:
-        """Generate 100 diverse test queries across all intent types and complexity levels."""
-        
-        queries = []
-        
-        # Definition Lookup Queries (25 queries)
-        definition_queries = [
-            {"query": "What does consumer mean?", "expected_intent": "definition_lookup"},
-            {"query": "Define unfair trade practice", "expected_intent": "definition_lookup"},
-            {"query": "What is the meaning of defective goods?", "expected_intent": "definition_lookup"},
-            {"query": "Explain misleading advertisement", "expected_intent": "definition_lookup"},
-            {"query": "What does complainant mean in legal terms?", "expected_intent": "definition_lookup"},
-            {"query": "Define trader under CPA", "expected_intent": "definition_lookup"},
-            {"query": "What is meant by service in consumer law?", "expected_intent": "definition_lookup"},
-            {"query": "Explain the term product liability", "expected_intent": "definition_lookup"},
-            {"query": "What does Central Authority mean?", "expected_intent": "definition_lookup"},
-            {"query": "Define District Commission", "expected_intent": "definition_lookup"},
-            {"query": "What is State Commission?", "expected_intent": "definition_lookup"},
-            {"query": "Explain National Commission", "expected_intent": "definition_lookup"},
-            {"query": "What does e-commerce mean in CPA?", "expected_intent": "definition_lookup"},
-            {"query": "Define product seller", "expected_intent": "definition_lookup"},
-            {"query": "What is meant by product manufacturer?", "expected_intent": "definition_lookup"},
-            {"query": "Explain consumer dispute", "expected_intent": "definition_lookup"},
-            {"query": "What does harm mean in consumer context?", "expected_intent": "definition_lookup"},
-            {"query": "Define express warranty", "expected_intent": "definition_lookup"},
-            {"query": "What is implied warranty?", "expected_intent": "definition_lookup"},
-            {"query": "Explain restrictive trade practice", "expected_intent": "definition_lookup"},
-            {"query": "What does pecuniary jurisdiction mean?", "expected_intent": "definition_lookup"},
-            {"query": "Define territorial jurisdiction", "expected_intent": "definition_lookup"},
-            {"query": "What is meant by consumer protection council?", "expected_intent": "definition_lookup"},
-            {"query": "Explain the term mediation", "expected_intent": "definition_lookup"},
-            {"query": "What does investigation wing mean?", "expected_intent": "definition_lookup"}
-        ]
+    def _warm_up(self) -> None:
+        """Run the warm-up queries, discarding their responses."""
         
-        # Section Retrieval Queries (25 queries)
-        section_queries = [
-            {"query": "Show me section 2", "expected_intent": "section_retrieval"},
-            {"query": "Get section 18 of CPA", "expected_intent": "section_retrieval"},
-            {"query": "What does section 35 say?", "expected_intent": "section_retrieval"},
-            {"query": "Display section 21 content", "expected_intent": "section_retrieval"},
-            {"query": "Find section 47 provisions", "expected_intent": "section_retrieval"},
-            {"query": "Section 12 details", "expected_intent": "section_retrieval"},
-            {"query": "Show section 23", "expected_intent": "section_retrieval"},
-            {"query": "Section 34 text", "expected_intent": "section_retrieval"},
-            {"query": "Get me section 41", "expected_intent": "section_retrieval"},
-            {"query": "Section 58 provisions", "expected_intent": "section_retrieval"},
-            {"query": "What is in section 67?", "expected_intent": "section_retrieval"},
-            {"query": "Section 72 content", "expected_intent": "section_retrieval"},
-            {"query": "Show section 15", "expected_intent": "section_retrieval"},
-            {"query": "Section 28 details", "expected_intent": "section_retrieval"},
-            {"query": "Get section 36", "expected_intent": "section_retrieval"},
-            {"query": "Section 49 text", "expected_intent": "section_retrieval"},
-            {"query": "What does section 51 contain?", "expected_intent": "section_retrieval"},
-            {"query": "Section 63 provisions", "expected_intent": "section_retrieval"},
-            {"query": "Show me section 74", "expected_intent": "section_retrieval"},
-            {"query": "Section 19 content", "expected_intent": "section_retrieval"},
-            {"query": "Get section 25", "expected_intent": "section_retrieval"},
-            {"query": "Section 31 details", "expected_intent": "section_retrieval"},
-            {"query": "What is section 44?", "expected_intent": "section_retrieval"},
-            {"query": "Section 56 text", "expected_intent": "section_retrieval"},
-            {"query": "Show section 69", "expected_intent": "section_retrieval"}
-        ]
+        for query in WARMUP_QUERIES.values():
+            self.engine.process_query(query=query, audience="citizen")
         
-        # Rights Query Queries (25 queries)
-        rights_queries = [
-            {"query": "What are my consumer rights?", "expected_intent": "rights_query"},
-            {"query": "What rights do I have as a buyer?", "expected_intent": "rights_query"},
-            {"query": "Consumer protection rights under CPA", "expected_intent": "rights_query"},
-            {"query": "Rights against unfair trade practices", "expected_intent": "rights_query"},
-            {"query": "What can consumers claim for defective products?", "expected_intent": "rights_query"},
-            {"query": "Rights to information about products", "expected_intent": "rights_query"},
-            {"query": "Consumer rights for service deficiency", "expected_intent": "rights_query"},
-            {"query": "Rights against misleading advertisements", "expected_intent": "rights_query"},
-            {"query": "What rights do online buyers have?", "expected_intent": "rights_query"},
-            {"query": "Consumer rights for warranty claims", "expected_intent": "rights_query"},
-            {"query": "Rights to compensation for damages", "expected_intent": "rights_query"},
-            {"query": "Consumer rights in e-commerce", "expected_intent": "rights_query"},
-            {"query": "Rights against overcharging", "expected_intent": "rights_query"},
-            {"query": "Consumer rights for product safety", "expected_intent": "rights_query"},
-            {"query": "Rights to file complaints", "expected_intent": "rights_query"},
-            {"query": "Consumer rights for refunds", "expected_intent": "rights_query"},
-            {"query": "Rights against discrimination", "expected_intent": "rights_query"},
-            {"query": "Consumer rights for privacy", "expected_intent": "rights_query"},
-            {"query": "Rights to choose products freely", "expected_intent": "rights_query"},
-            {"query": "Consumer rights for education", "expected_intent": "rights_query"},
-            {"query": "Rights against hazardous goods", "expected_intent": "rights_query"},
-            {"query": "Consumer rights for representation", "expected_intent": "rights_query"},
-            {"query": "Rights to seek redressal", "expected_intent": "rights_query"},
-            {"query": "Consumer rights for fair treatment", "expected_intent": "rights_query"},
-            {"query": "Rights against exploitation", "expected_intent": "rights_query"}
-        ]
+    def _generate_test_queries(self, queries_file: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Generate the test queries: the built-in 100 across all intent types, or
+        those read from a JSONL file of {"query", "expected_intent"[, "id", "category"]} objects.
+        """
         
-        # Scenario Analysis Queries (25 queries)
-        scenario_queries = [
-            {"query": "I bought a defective product, what can I do?", "expected_intent": "scenario_analysis"},
-            {"query": "Seller is refusing refund, what are my options?", "expected_intent": "scenario_analysis"},
-            {"query": "Misleading advertisement caused loss, how to complain?", "expected_intent": "scenario_analysis"},
-            {"query": "Service provider overcharging, is this legal?", "expected_intent": "scenario_analysis"},
-            {"query": "Received damaged goods, what compensation can I get?", "expected_intent": "scenario_analysis"},
-            {"query": "Online purchase not delivered, what to do?", "expected_intent": "scenario_analysis"},
-            {"query": "Product caused injury, can I claim damages?", "expected_intent": "scenario_analysis"},
-            {"query": "Warranty expired but product failed early, any recourse?", "expected_intent": "scenario_analysis"},
-            {"query": "Restaurant served contaminated food, what action?", "expected_intent": "scenario_analysis"},
-            {"query": "Bank charged unauthorized fees, how to complain?", "expected_intent": "scenario_analysis"},
-            {"query": "Insurance claim rejected unfairly, what options?", "expected_intent": "scenario_analysis"},
-            {"query": "Mobile service poor quality, can I get compensation?", "expected_intent": "scenario_analysis"},
-            {"query": "Airline cancelled flight without notice, what rights?", "expected_intent": "scenario_analysis"},
-            {"query": "Hospital overcharged for treatment, is this allowed?", "expected_intent": "scenario_analysis"},
-            {"query": "Courier lost my package, what compensation?", "expected_intent": "scenario_analysis"},
-            {"query": "Gym refusing membership cancellation, what to do?", "expected_intent": "scenario_analysis"},
-            {"query": "Car dealer sold defective vehicle, what recourse?", "expected_intent": "scenario_analysis"},
-            {"query": "Real estate agent misled about property, can I complain?", "expected_intent": "scenario_analysis"},
-            {"query": "Educational institution charging hidden fees, is this legal?", "expected_intent": "scenario_analysis"},
-            {"query": "Electricity bill seems wrong, how to dispute?", "expected_intent": "scenario_analysis"},
-            {"query": "Medicine caused side effects not mentioned, what action?", "expected_intent": "scenario_analysis"},
-            {"query": "Appliance repair service damaged my item, what compensation?", "expected_intent": "scenario_analysis"},
-            {"query": "Travel agency cancelled trip last minute, what rights?", "expected_intent": "scenario_analysis"},
-            {"query": "Software purchase doesn't work as advertised, what options?", "expected_intent": "scenario_analysis"},
-            {"query": "Subscription service won't let me cancel, what to do?", "expected_intent": "scenario_analysis"}
-        ]
+        if queries_file is not None:
+            return list(self._load_test_queries(queries_file))
         
-        # Add all queries with metadata
-        for i, q in enumerate(definition_queries):
-            queries.append({**q, "id": f"DEF_{i+1:03d}", "category": "definition_lookup"})
-            
-        for i, q in enumerate(section_queries):
-            queries.append({**q, "id": f"SEC_{i+1:03d}", "category": "section_retrieval"})
-            
-        for i, q in enumerate(rights_queries):
-            queries.append({**q, "id": f"RGT_{i+1:03d}", "category": "rights_query"})
-            
-        for i, q in enumerate(scenario_queries):
-            queries.append({**q, "id": f"SCN_{i+1:03d}", "category": "scenario_analysis"})
+        return [
+            {"query": query, "expected_intent": intent, "id": f"{prefix}_{i:03d}", "category": intent}
+            for prefix, intent, queries in TEST_QUERIES
+            for i, query in enumerate(queries, 1)
+        ]
+    
+    @staticmethod
+    def _load_test_queries(queries_file: str) -> Iterator[Dict[str, Any]]:
+        """Yield test queries from a JSONL file, one line at a time."""
         
-        return queries
+        loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+        with open(queries_file, "rb") as f:
+            for i, line in enumerate(filter(bytes.strip, f), 1):
+                query = loads(line)
+                query.setdefault("id", f"Q_{i:03d}")
+                query.setdefault("category", query["expected_intent"])
+                yield query
     
-    def run_single_query(self, query_data: Dict[str, Any]) -> Dict[str, Any]:
+    def run_single_query(self, query_data: Dict[str, Any]) -> QueryResult:
         """Run a single query and collect detailed metrics."""
         
-        start_time = time.time()
+        start = time.perf_counter_ns()
         
         try:
             # Process query
@@ -170,73 +262,75 @@ class ComprehensiveTestSuite:
                 audience="citizen"
             )
             
-            end_time = time.time()
-            latency = (end_time - start_time) * 1000  # Convert to milliseconds
+            elapsed_us = (time.perf_counter_ns() - start) // 1000
             
             # Extract metrics from GraphRAGResponse object
-            metrics = {
-                "query_id": query_data["id"],
-                "query_text": query_data["query"],
-                "expected_intent": query_data["expected_intent"],
-                "category": query_data["category"],
-                "success": True,
-                "latency_ms": round(latency, 2),
-                "intent_detected": response.query_intent.intent_type.value,
-                "confidence": response.get_confidence_score(),
-                "nodes_retrieved": len(response.graph_context.nodes),
-                "context_length": response.llm_context.get_total_length(),
-                "citations_count": response.llm_context.get_citation_count(),
-                "reasoning_steps": len(response.processing_metadata.get("reasoning_steps", [])),
-                "human_review_flagged": response.requires_human_review(),
-                "error": None
-            }
-            
-            # Validate intent classification
-            metrics["intent_correct"] = (
-                metrics["intent_detected"] == metrics["expected_intent"]
+            intent_detected = response.query_intent.intent_type.value
+            metrics = QueryResult(
+                query_id=query_data["id"],
+                query_text=query_data["query"],
+                expected_intent=query_data["expected_intent"],
+                category=query_data["category"],
+                success=True,
+                latency_ms=elapsed_us / 1000.0,
+                intent_detected=intent_detected,
+                confidence=response.get_confidence_score(),
+                nodes_retrieved=len(response.graph_context.nodes),
+                context_length=response.llm_context.get_total_length(),
+                citations_count=response.llm_context.get_citation_count(),
+                reasoning_steps=len(response.processing_metadata.get("reasoning_steps", [])),
+                human_review_flagged=response.requires_human_review(),
+                # Validate intent classification
+                intent_correct=intent_detected == query_data["expected_intent"]
             )
             
         except Exception as e:
-            end_time = time.time()
-            latency = (end_time - start_time) * 1000
+            elapsed_us = (time.perf_counter_ns() - start) // 1000
             
-            metrics = {
-                "query_id": query_data["id"],
-                "query_text": query_data["query"],
-                "expected_intent": query_data["expected_intent"],
-                "category": query_data["category"],
-                "success": False,
-                "latency_ms": round(latency, 2),
-                "intent_detected": "error",
-                "confidence": 0.0,
-                "nodes_retrieved": 0,
-                "context_length": 0,
-                "citations_count": 0,
-                "reasoning_steps": 0,
-                "human_review_flagged": True,
-                "intent_correct": False,
-                "error": str(e)
-            }
+            metrics = QueryResult(
+                query_id=query_data["id"],
+                query_text=query_data["query"],
+                expected_intent=query_data["expected_intent"],
+                category=query_data["category"],
+                success=False,
+                latency_ms=elapsed_us / 1000.0,
+                intent_detected="error",
+                confidence=0.0,
+                nodes_retrieved=0,
+                context_length=0,
+                citations_count=0,
+                reasoning_steps=0,
+                human_review_flagged=True,
+                intent_correct=False,
+                error=str(e),
+                error_type=type(e).__name__
+            )
         
         return metrics
     
     def run_comprehensive_test(self) -> Dict[str, Any]:
-        """Run all 100 queries and collect comprehensive statistics."""
+        """Run all test queries and collect comprehensive statistics."""
         
-        print("Starting Comprehensive Test Suite (100 queries)")
+        total = len(self.test_queries)
+        print(f"Starting Comprehensive Test Suite ({total} queries)")
         print("=" * 60)
         
-        # Run all queries
-        for i, query_data in enumerate(self.test_queries, 1):
-            print(f"Testing query {i:3d}/100: {query_data['query'][:50]}...")
-            
-            result = self.run_single_query(query_data)
-            self.results.append(result)
-            
-            # Show progress every 25 queries
-            if i % 25 == 0:
-                success_rate = sum(1 for r in self.results if r["success"]) / len(self.results) * 100
-                print(f"  Progress: {i}/100 queries completed ({success_rate:.1f}% success rate)")
+        RESULTS_DIR.mkdir(exist_ok=True)
+        
+        # Run all queries; results come back in query order
+        with open(DETAILED_RESULTS_PATH, "wb") as detailed_file:
+            for i, (query_data, result) in enumerate(zip(self.test_queries, self._run_queries()), 1):
+                logger.debug("Testing query %3d/%d: %.50s...", i, total, query_data["query"])
+                
+                self.results.append(result)
+                self._success_count += result.success
+                detailed_file.write(_dump_json(result._asdict()) + b"\n")
+                
+                # Show progress every 25 queries
+                if i % 25 == 0:
+                    success_rate = self._success_count / len(self.results) * 100
+                    logger.info("  Progress: %d/%d queries completed (%.1f%% success rate)",
+                                i, total, success_rate)
         
         # Calculate comprehensive statistics
         stats = self._calculate_statistics()
@@ -246,10 +340,34 @@ class ComprehensiveTestSuite:
         
         return stats
     
+    def _run_queries(self) -> Iterator[QueryResult]:
+        """Yield the test query results in order, from worker processes when max_workers > 1."""
+        
+        if self.max_workers == 1:
+            yield from map(self.run_single_query, self.test_queries)
+            return
+        
+        # Each worker builds and warms up its own engine once (from the index cache
+        # this process has just written, when caching is on); chunks cut IPC round trips
+        with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                 initargs=(self.use_cache,)) as executor:
+            yield from executor.map(_run_in_worker, self.test_queries, chunksize=8)
+    
     def _calculate_statistics(self) -> Dict[str, Any]:
         """Calculate comprehensive statistics from test results."""
         
-        successful_results = [r for r in self.results if r["success"]]
+        # Split the results by outcome and bucket them by category in one pass
+        successful_results = []
+        errors = []
+        results_by_category = defaultdict(list)
+        successes_by_category = defaultdict(list)
+        for r in self.results:
+            results_by_category[r.category].append(r)
+            if r.success:
+                successful_results.append(r)
+                successes_by_category[r.category].append(r)
+            else:
+                errors.append(r)
         
         # Overall statistics
         overall_stats = {
@@ -261,198 +379,245 @@ class ComprehensiveTestSuite:
         }
         
         if successful_results:
-            # Performance statistics
-            latencies = [r["latency_ms"] for r in successful_results]
-            confidences = [r["confidence"] for r in successful_results]
-            nodes_retrieved = [r["nodes_retrieved"] for r in successful_results]
-            context_lengths = [r["context_length"] for r in successful_results]
-            citations = [r["citations_count"] for r in successful_results]
+            # Performance statistics, over columns sorted once so the median,
+            # extremes and p95 are all read off by index
+            latencies, confidences, nodes_retrieved, context_lengths, citations = (
+                sorted(column) for column in zip(*(
+                    (r.latency_ms, r.confidence, r.nodes_retrieved,
+                     r.context_length, r.citations_count)
+                    for r in successful_results
+                ))
+            )
             
             performance_stats = {
                 "latency": {
-                    "mean": statistics.mean(latencies),
-                    "median": statistics.median(latencies),
-                    "std_dev": statistics.stdev(latencies) if len(latencies) > 1 else 0,
-                    "min": min(latencies),
-                    "max": max(latencies),
-                    "p95": sorted(latencies)[int(0.95 * len(latencies))]
+                    **self._describe(latencies),
+                    "std_dev": self._std_dev(latencies),
+                    "p95": latencies[int(0.95 * len(latencies))]
                 },
                 "confidence": {
-                    "mean": statistics.mean(confidences),
-                    "median": statistics.median(confidences),
-                    "std_dev": statistics.stdev(confidences) if len(confidences) > 1 else 0,
-                    "min": min(confidences),
-                    "max": max(confidences)
-                },
-                "nodes_retrieved": {
-                    "mean": statistics.mean(nodes_retrieved),
-                    "median": statistics.median(nodes_retrieved),
-                    "min": min(nodes_retrieved),
-                    "max": max(nodes_retrieved)
+                    **self._describe(confidences),
+                    "std_dev": self._std_dev(confidences)
                 },
-                "context_length": {
-                    "mean": statistics.mean(context_lengths),
-                    "median": statistics.median(context_lengths),
-                    "min": min(context_lengths),
-                    "max": max(context_lengths)
-                },
-                "citations": {
-                    "mean": statistics.mean(citations),
-                    "median": statistics.median(citations),
-                    "min": min(citations),
-                    "max": max(citations)
-                }
+                "nodes_retrieved": self._describe(nodes_retrieved),
+                "context_length": self._describe(context_lengths),
+                "citations": self._describe(citations)
             }
         else:
             performance_stats = {}
         
         # Intent classification accuracy
         intent_stats = {}
-        for category in ["definition_lookup", "section_retrieval", "rights_query", "scenario_analysis"]:
-            category_results = [r for r in self.results if r["category"] == category]
-            if category_results:
-                correct = sum(1 for r in category_results if r["intent_correct"])
-                intent_stats[category] = {
-                    "total": len(category_results),
-                    "correct": correct,
-                    "accuracy": correct / len(category_results) * 100
-                }
+        for category, category_results in results_by_category.items():
+            correct = sum(1 for r in category_results if r.intent_correct)
+            intent_stats[category] = {
+                "total": len(category_results),
+                "correct": correct,
+                "accuracy": correct / len(category_results) * 100
+            }
         
         # Category-wise performance
         category_stats = {}
-        for category in ["definition_lookup", "section_retrieval", "rights_query", "scenario_analysis"]:
-            category_results = [r for r in successful_results if r["category"] == category]
-            if category_results:
-                category_stats[category] = {
-                    "count": len(category_results),
-                    "avg_latency": statistics.mean([r["latency_ms"] for r in category_results]),
-                    "avg_confidence": statistics.mean([r["confidence"] for r in category_results]),
-                    "avg_nodes": statistics.mean([r["nodes_retrieved"] for r in category_results]),
-                    "avg_context_length": statistics.mean([r["context_length"] for r in category_results]),
-                    "avg_citations": statistics.mean([r["citations_count"] for r in category_results]),
-                    "human_review_rate": sum(1 for r in category_results if r["human_review_flagged"]) / len(category_results) * 100
-                }
+        for category, category_results in successes_by_category.items():
+            # Column totals from a single pass over the category's results
+            latency, confidence, nodes, context_length, citations, human_reviews = (
+                math.fsum(column) for column in zip(*(
+                    (r.latency_ms, r.confidence, r.nodes_retrieved, r.context_length,
+                     r.citations_count, r.human_review_flagged)
+                    for r in category_results
+                ))
+            )
+            count = len(category_results)
+            category_stats[category] = {
+                "count": count,
+                "avg_latency": latency / count,
+                "avg_confidence": confidence / count,
+                "avg_nodes": nodes / count,
+                "avg_context_length": context_length / count,
+                "avg_citations": citations / count,
+                "human_review_rate": human_reviews / count * 100
+            }
+        
+        category_sizes = {len(category_results) for category_results in results_by_category.values()}
         
         # Error analysis
-        errors = [r for r in self.results if not r["success"]]
         error_stats = {
             "total_errors": len(errors),
-            "error_types": {},
-            "failed_queries": [{"id": r["query_id"], "query": r["query_text"], "error": r["error"]} for r in errors]
+            "error_types": dict(Counter(r.error_type for r in errors)),
+            "failed_queries": [{"id": r.query_id, "query": r.query_text, "error": r.error} for r in errors]
         }
         
-        # Count error types
-        for error in errors:
-            error_type = type(error.get("error", "Unknown")).__name__
-            error_stats["error_types"][error_type] = error_stats["error_types"].get(error_type, 0) + 1
-        
         return {
             "test_metadata": {
                 "test_date": time.strftime("%Y-%m-%d %H:%M:%S"),
-                "total_queries": 100,
-                "query_categories": ["definition_lookup", "section_retrieval", "rights_query", "scenario_analysis"],
-                "queries_per_category": 25
+                "total_queries": len(self.results),
+                "query_categories": list(results_by_category),
+                # None when the categories are not all the same size
+                "queries_per_category": category_sizes.pop() if len(category_sizes) == 1 else None
             },
             "overall_performance": overall_stats,
             "performance_metrics": performance_stats,
             "intent_classification": intent_stats,
             "category_performance": category_stats,
-            "error_analysis": error_stats,
-            "detailed_results": self.results
+            "error_analysis": error_stats
         }
     
+    @staticmethod
+    def _describe(values: List[float]) -> Dict[str, float]:
+        """Mean, median and range of a sorted, non-empty column."""
+        
+        # Read off the sorted column: statistics.median would copy and sort it again
+        mid = len(values) // 2
+        median = values[mid] if len(values) % 2 else (values[mid - 1] + values[mid]) / 2
+        return {
+            "mean": statistics.fmean(values),
+            "median": median,
+            "min": values[0],
+            "max": values[-1]
+        }
+    
+    @staticmethod
+    def _std_dev(values: List[float]) -> float:
+        """Sample standard deviation of a column (0 for a single value)."""
+        
+        if len(values) < 2:
+            return 0
+        mean = statistics.fmean(values)
+        return math.sqrt(math.fsum((v - mean) ** 2 for v in values) / (len(values) - 1))
+    
     def _save_results(self, stats: Dict[str, Any]) -> None:
-        """Save comprehensive test results to files."""
+        """Save comprehensive test results to files (per-query results are already streamed)."""
         
         # Create results directory
-        results_dir = Path("research_analysis/data")
+        results_dir = RESULTS_DIR
         results_dir.mkdir(exist_ok=True)
         
         # Save comprehensive statistics
-        with open(results_dir / "comprehensive_test_results.json", "w", encoding="utf-8") as f:
-            json.dump(stats, f, indent=2, ensure_ascii=False)
-        
-        # Save detailed results
-        with open(results_dir / "detailed_query_results.json", "w", encoding="utf-8") as f:
-            json.dump(self.results, f, indent=2, ensure_ascii=False)
+        with open(results_dir / "comprehensive_test_results.json", "wb") as f:
+            f.write(_dump_json(stats, indent=True))
         
         # Generate summary report
         self._generate_summary_report(stats, results_dir / "comprehensive_test_summary.txt")
         
         print(f"\n✓ Results saved to: {results_dir}")
     
+    @staticmethod
+    def _format_stats(title: str, values: Dict[str, float], spec: str) -> str:
+        """Format one metric's mean, median, p95 (if measured) and range for the summary report."""
+        
+        lines = [
+            f"{title}:",
+            f"  - Mean: {values['mean']:{spec}}",
+            f"  - Median: {values['median']:{spec}}",
+        ]
+        if "p95" in values:
+            lines.append(f"  - 95th Percentile: {values['p95']:{spec}}")
+        lines.append(f"  - Range: {values['min']:{spec}} - {values['max']:{spec}}")
+        return "\n".join(lines) + "\n\n"
+    
     def _generate_summary_report(self, stats: Dict[str, Any], output_path: Path) -> None:
         """Generate a human-readable summary report."""
         
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write("NYAYAMRIT GRAPHRAG COMPREHENSIVE TEST REPORT (100 QUERIES)\n")
-            f.write("=" * 70 + "\n\n")
-            
-            # Test metadata
-            f.write("TEST METADATA:\n")
-            f.write(f"- Test Date: {stats['test_metadata']['test_date']}\n")
-            f.write(f"- Total Queries: {stats['test_metadata']['total_queries']}\n")
-            f.write(f"- Categories: {', '.join(stats['test_metadata']['query_categories'])}\n")
-            f.write(f"- Queries per Category: {stats['test_metadata']['queries_per_category']}\n\n")
-            
-            # Overall performance
-            f.write("OVERALL PERFORMANCE:\n")
-            overall = stats["overall_performance"]
-            f.write(f"- Success Rate: {overall['success_rate']:.1f}% ({overall['successful_queries']}/{overall['total_queries']})\n")
-            f.write(f"- Error Rate: {overall['error_rate']:.1f}% ({overall['failed_queries']}/{overall['total_queries']})\n\n")
-            
-            # Performance metrics
-            if stats["performance_metrics"]:
-                f.write("PERFORMANCE METRICS:\n")
-                perf = stats["performance_metrics"]
-                
-                f.write(f"Latency (ms):\n")
-                f.write(f"  - Mean: {perf['latency']['mean']:.2f}\n")
-                f.write(f"  - Median: {perf['latency']['median']:.2f}\n")
-                f.write(f"  - 95th Percentile: {perf['latency']['p95']:.2f}\n")
-                f.write(f"  - Range: {perf['latency']['min']:.2f} - {perf['latency']['max']:.2f}\n\n")
-                
-                f.write(f"Confidence Scores:\n")
-                f.write(f"  - Mean: {perf['confidence']['mean']:.3f}\n")
-                f.write(f"  - Median: {perf['confidence']['median']:.3f}\n")
-                f.write(f"  - Range: {perf['confidence']['min']:.3f} - {perf['confidence']['max']:.3f}\n\n")
-                
-                f.write(f"Retrieval Metrics:\n")
-                f.write(f"  - Avg Nodes Retrieved: {perf['nodes_retrieved']['mean']:.1f}\n")
-                f.write(f"  - Avg Context Length: {perf['context_length']['mean']:.0f} chars\n")
-                f.write(f"  - Avg Citations: {perf['citations']['mean']:.1f}\n\n")
-            
-            # Intent classification accuracy
-            f.write("INTENT CLASSIFICATION ACCURACY:\n")
-            for category, data in stats["intent_classification"].items():
-                f.write(f"- {category.replace('_', ' ').title()}: {data['accuracy']:.1f}% ({data['correct']}/{data['total']})\n")
-            f.write("\n")
+        metadata = stats["test_metadata"]
+        parts = [
+            f"NYAYAMRIT GRAPHRAG COMPREHENSIVE TEST REPORT ({metadata['total_queries']} QUERIES)\n",
+            "=" * 70 + "\n\n",
+        ]
+        
+        # Test metadata
+        parts.append("TEST METADATA:\n")
+        parts.append(f"- Test Date: {metadata['test_date']}\n")
+        parts.append(f"- Total Queries: {metadata['total_queries']}\n")
+        parts.append(f"- Categories: {', '.join(metadata['query_categories'])}\n")
+        if metadata["queries_per_category"] is not None:
+            parts.append(f"- Queries per Category: {metadata['queries_per_category']}\n")
+        parts.append("\n")
+        
+        # Overall performance
+        parts.append("OVERALL PERFORMANCE:\n")
+        overall = stats["overall_performance"]
+        parts.append(f"- Success Rate: {overall['success_rate']:.1f}% ({overall['successful_queries']}/{overall['total_queries']})\n")
+        parts.append(f"- Error Rate: {overall['error_rate']:.1f}% ({overall['failed_queries']}/{overall['total_queries']})\n\n")
+        
+        # Performance metrics
+        if stats["performance_metrics"]:
+            parts.append("PERFORMANCE METRICS:\n")
+            perf = stats["performance_metrics"]
             
-            # Category performance
-            f.write("CATEGORY-WISE PERFORMANCE:\n")
-            for category, data in stats["category_performance"].items():
-                f.write(f"{category.replace('_', ' ').title()}:\n")
-                f.write(f"  - Queries: {data['count']}\n")
-                f.write(f"  - Avg Latency: {data['avg_latency']:.2f}ms\n")
-                f.write(f"  - Avg Confidence: {data['avg_confidence']:.3f}\n")
-                f.write(f"  - Avg Nodes: {data['avg_nodes']:.1f}\n")
-                f.write(f"  - Avg Citations: {data['avg_citations']:.1f}\n")
-                f.write(f"  - Human Review Rate: {data['human_review_rate']:.1f}%\n\n")
+            parts.append(self._format_stats("Latency (ms)", perf["latency"], ".2f"))
+            parts.append(self._format_stats("Confidence Scores", perf["confidence"], ".3f"))
             
-            # Error analysis
-            if stats["error_analysis"]["total_errors"] > 0:
-                f.write("ERROR ANALYSIS:\n")
-                f.write(f"- Total Errors: {stats['error_analysis']['total_errors']}\n")
-                f.write("- Error Types:\n")
-                for error_type, count in stats["error_analysis"]["error_types"].items():
-                    f.write(f"  - {error_type}: {count}\n")
-                f.write("\n")
+            parts.append("Retrieval Metrics:\n")
+            parts.append(f"  - Avg Nodes Retrieved: {perf['nodes_retrieved']['mean']:.1f}\n")
+            parts.append(f"  - Avg Context Length: {perf['context_length']['mean']:.0f} chars\n")
+            parts.append(f"  - Avg Citations: {perf['citations']['mean']:.1f}\n\n")
+        
+        # Intent classification accuracy
+        parts.append("INTENT CLASSIFICATION ACCURACY:\n")
+        for category, data in stats["intent_classification"].items():
+            parts.append(f"- {category.replace('_', ' ').title()}: {data['accuracy']:.1f}% ({data['correct']}/{data['total']})\n")
+        parts.append("\n")
+        
+        # Category performance
+        parts.append("CATEGORY-WISE PERFORMANCE:\n")
+        for category, data in stats["category_performance"].items():
+            parts.append(f"{category.replace('_', ' ').title()}:\n")
+            parts.append(f"  - Queries: {data['count']}\n")
+            parts.append(f"  - Avg Latency: {data['avg_latency']:.2f}ms\n")
+            parts.append(f"  - Avg Confidence: {data['avg_confidence']:.3f}\n")
+            parts.append(f"  - Avg Nodes: {data['avg_nodes']:.1f}\n")
+            parts.append(f"  - Avg Citations: {data['avg_citations']:.1f}\n")
+            parts.append(f"  - Human Review Rate: {data['human_review_rate']:.1f}%\n\n")
+        
+        # Error analysis
+        if stats["error_analysis"]["total_errors"] > 0:
+            parts.append("ERROR ANALYSIS:\n")
+            parts.append(f"- Total Errors: {stats['error_analysis']['total_errors']}\n")
+            parts.append("- Error Types:\n")
+            for error_type, count in stats["error_analysis"]["error_types"].items():
+                parts.append(f"  - {error_type}: {count}\n")
+            parts.append("\n")
+        
+        # One write for the whole report
+        output_path.write_text("".join(parts), encoding="utf-8")
+
+
+# Suite of the current worker process, built once by _init_worker
+_worker_suite = None
+
+
+def _init_worker(use_cache: bool) -> None:
+    """Build the worker process's suite, and with it a warmed-up engine."""
+    global _worker_suite
+    _worker_suite = ComprehensiveTestSuite(use_cache=use_cache)
+
+
+def _run_in_worker(query_data: Dict[str, Any]) -> QueryResult:
+    """Run one test query on the worker process's engine."""
+    return _worker_suite.run_single_query(query_data)
 
 
 def main():
     """Run the comprehensive test suite."""
     
-    test_suite = ComprehensiveTestSuite()
+    parser = argparse.ArgumentParser(description="Run the comprehensive GraphRAG test suite")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="rebuild the graph indices and disable every pipeline cache")
+    parser.add_argument("--queries-file", metavar="PATH",
+                        help="JSONL file of test queries to run instead of the built-in 100")
+    parser.add_argument("--workers", type=int, default=1, metavar="N",
+                        help="worker processes to spread the queries over (default: 1, serial)")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="log every query as it completes, not just every 25th")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format="%(message)s")
+    
+    try:
+        test_suite = ComprehensiveTestSuite(max_workers=args.workers, use_cache=not args.no_cache,
+                                            queries_file=args.queries_file)
+    except ValueError as e:
+        parser.error(str(e))
     results = test_suite.run_comprehensive_test()
     
     print("\n" + "=" * 60)